@@ -3,77 +3,232 @@ try:
 except ImportError:
     pyttsx3 = None
 
+import hashlib
 import uuid
 import os
+import queue
 import re
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 import requests
 
 
-def initialize_tts_engine(language='en'):
+# Language to voice mapping (based on common SAPI5 voice names and language codes)
+VOICE_KEYWORDS = {
+    'en': ['english', 'zira', 'david', 'mark', 'en-us', 'en_us', 'en_gb'],
+    'es': ['spanish', 'helena', 'sabina', 'es-es', 'es_es', 'es-mx', 'es_mx'],
+    'fr': ['french', 'hortense', 'denis', 'fr-fr', 'fr_fr', 'fr-ca', 'fr_ca'],
+    'de': ['german', 'hedda', 'stefan', 'de-de', 'de_de'],
+    'it': ['italian', 'elsa', 'cosimo', 'it-it', 'it_it'],
+    'pt': ['portuguese', 'heloisa', 'daniel', 'pt-pt', 'pt_pt', 'pt-br', 'pt_br'],
+    'ru': ['russian', 'irina', 'pavel', 'ru-ru', 'ru_ru'],
+    'zh': ['chinese', 'huihui', 'kangkang', 'zh-cn', 'zh_cn', 'zh-tw', 'zh_tw'],
+    'ja': ['japanese', 'haruka', 'ichiro', 'ja-jp', 'ja_jp'],
+    'ko': ['korean', 'heami', 'ko-kr', 'ko_kr'],
+    'hi': ['hindi', 'kalpana', 'hemant', 'hi-in', 'hi_in'],
+    'ar': ['arabic', 'hoda', 'naayf', 'ar-sa', 'ar_sa', 'ar-eg', 'ar_eg'],
+}
+DEFAULT_VOICE_KEYWORDS = ['english', 'zira', 'en-us']
+
+
+def select_voice(voices, language='en'):
     """
-    Initialize and configure the TTS engine with language support
+    Returns the id of the first installed voice matching the language, falling
+    back to the first available voice (None when there are no voices).
     """
-    if not pyttsx3:
-        # If pyttsx3 is not available, return a mock or handle gracefully
-        # In this project, gTTS is the preferred fallback
-        return None
-    
-    try:
-        engine = pyttsx3.init()
-    except Exception as e:
-        print(f"[TTS] pyttsx3 initialization failed: {e}")
+    if not voices:
         return None
-    
-    # Language to voice mapping (based on common SAPI5 voice names and language codes)
-    language_mapping = {
-        'en': ['english', 'zira', 'david', 'mark', 'en-us', 'en_us', 'en_gb'],
-        'es': ['spanish', 'helena', 'sabina', 'es-es', 'es_es', 'es-mx', 'es_mx'],
-        'fr': ['french', 'hortense', 'denis', 'fr-fr', 'fr_fr', 'fr-ca', 'fr_ca'],
-        'de': ['german', 'hedda', 'stefan', 'de-de', 'de_de'],
-        'it': ['italian', 'elsa', 'cosimo', 'it-it', 'it_it'],
-        'pt': ['portuguese', 'heloisa', 'daniel', 'pt-pt', 'pt_pt', 'pt-br', 'pt_br'],
-        'ru': ['russian', 'irina', 'pavel', 'ru-ru', 'ru_ru'],
-        'zh': ['chinese', 'huihui', 'kangkang', 'zh-cn', 'zh_cn', 'zh-tw', 'zh_tw'],
-        'ja': ['japanese', 'haruka', 'ichiro', 'ja-jp', 'ja_jp'],
-        'ko': ['korean', 'heami', 'ko-kr', 'ko_kr'],
-        'hi': ['hindi', 'kalpana', 'hemant', 'hi-in', 'hi_in'],
-        'ar': ['arabic', 'hoda', 'naayf', 'ar-sa', 'ar_sa', 'ar-eg', 'ar_eg'],
-    }
-    
-    # Configure TTS settings for better quality
-    voices = engine.getProperty('voices')
-    if voices:
-        target_keywords = language_mapping.get(language.lower(), ['english', 'zira', 'en-us'])
-        voice_found = False
-        
-        # Try to find a voice matching the language
-        for voice in voices:
-            voice_name_lower = voice.name.lower()
-            voice_id_lower = voice.id.lower()
-            
-            for keyword in target_keywords:
-                keyword_lower = keyword.lower()
-                if keyword_lower in voice_name_lower or keyword_lower in voice_id_lower:
-                    engine.setProperty('voice', voice.id)
-                    voice_found = True
-                    # print(f"[TTS] Selected voice for language '{language}': {voice.name}")
-                    break
-            
-            if voice_found:
+    keywords = VOICE_KEYWORDS.get(language.lower(), DEFAULT_VOICE_KEYWORDS)
+    for voice in voices:
+        voice_name_lower = voice.name.lower()
+        voice_id_lower = voice.id.lower()
+        if any(keyword in voice_name_lower or keyword in voice_id_lower for keyword in keywords):
+            return voice.id
+    return voices[0].id
+
+
+class SpeechEngineWorker:
+    """
+    Long-lived pyttsx3 engine owned by a dedicated worker thread.
+
+    pyttsx3.init() hands out a single engine per driver in a process, and the
+    drivers must be used from the thread that created them, so synthesis and
+    playback jobs are queued to one owner thread instead of initializing an
+    engine per call. The voice for each language is resolved once and cached,
+    and WAV output goes to one scratch file that is reused for every job.
+    """
+
+    def __init__(self, rate=180, volume=0.9):
+        self.rate = rate
+        self.volume = volume
+        self.available = None  # unknown until the worker has tried to start the engine
+        self.jobs_completed = 0
+        self._jobs = queue.Queue()
+        self._lock = threading.Lock()
+        self._started = threading.Event()
+        self._thread = None
+        self._engine = None
+        self._scratch_path = None
+        self._voices = {}  # language -> voice id, only touched by the worker thread
+        self._current_voice = None
+        self._speaking = False
+        self._stop_requested = False
+
+    def _ensure_started(self):
+        if self._thread is None:
+            with self._lock:
+                if self._thread is None:
+                    thread = threading.Thread(target=self._run, name="vaani-pyttsx3", daemon=True)
+                    thread.start()
+                    self._thread = thread
+        self._started.wait()
+        return self.available
+
+    def _run(self):
+        try:
+            # SAPI5 needs COM initialized in the thread that owns the engine
+            if sys.platform == 'win32':
+                try:
+                    import pythoncom
+                    pythoncom.CoInitialize()
+                except ImportError:
+                    pass
+            self._engine = pyttsx3.init()
+            # Slightly slower for clarity
+            self._engine.setProperty('rate', self.rate)
+            self._engine.setProperty('volume', self.volume)
+            # Interruptions are applied from the engine's own callback, on this thread
+            self._engine.connect('started-word', self._on_word)
+            fd, self._scratch_path = tempfile.mkstemp(prefix="vaani_tts_", suffix=".wav")
+            os.close(fd)
+            self.available = True
+        except Exception as e:
+            print(f"[TTS] pyttsx3 initialization failed: {e}")
+            self.available = False
+        finally:
+            self._started.set()
+
+        while self.available:
+            job = self._jobs.get()
+            if job is None:
                 break
-        
-        # Fallback: use first available voice if language not found
-        if not voice_found and voices:
-            engine.setProperty('voice', voices[0].id)
-            # print(f"[TTS] Language '{language}' not found, using default voice: {voices[0].name}")
+            fn, future = job
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(fn(self._engine))
+            except BaseException as e:
+                future.set_exception(e)
+            self.jobs_completed += 1
 
-    # Set speech rate (words per minute)
-    engine.setProperty('rate', 180)  # Slightly slower for clarity
+        if self._scratch_path and os.path.exists(self._scratch_path):
+            os.unlink(self._scratch_path)
 
-    # Set volume (0.0 to 1.0)
-    engine.setProperty('volume', 0.9)
-    
-    return engine
+    def submit(self, fn):
+        """Queues fn(engine) to the engine thread; returns a Future with its result."""
+        if not pyttsx3 or not self._ensure_started():
+            raise RuntimeError("pyttsx3 engine is not available on this system")
+        future = Future()
+        self._jobs.put((fn, future))
+        return future
+
+    def _use_voice(self, engine, language):
+        language = language.lower()
+        if language not in self._voices:
+            self._voices[language] = select_voice(engine.getProperty('voices'), language)
+        voice_id = self._voices[language]
+        if voice_id is not None and voice_id != self._current_voice:
+            engine.setProperty('voice', voice_id)
+            self._current_voice = voice_id
+
+    def prime(self, language='en'):
+        """Starts the engine and resolves the voice for `language` ahead of the first request."""
+        self.submit(lambda engine: self._use_voice(engine, language)).result()
+
+    def synthesize(self, text, language='en'):
+        """Returns WAV bytes for `text` spoken with the voice for `language`."""
+        def job(engine):
+            self._use_voice(engine, language)
+            # Truncate first so a failed run cannot return the previous job's audio
+            open(self._scratch_path, 'wb').close()
+            engine.save_to_file(text, self._scratch_path)
+            engine.runAndWait()
+            with open(self._scratch_path, 'rb') as audio_file:
+                audio_data = audio_file.read()
+            if not audio_data:
+                raise RuntimeError("Audio generation failed - empty file")
+            return audio_data
+
+        return self.submit(job).result()
+
+    def speak(self, text, language='en'):
+        """Plays `text` on the local speakers; returns once playback has finished."""
+        def job(engine):
+            self._use_voice(engine, language)
+            engine.say(text)
+            self._stop_requested = False
+            self._speaking = True
+            try:
+                engine.runAndWait()
+            finally:
+                self._speaking = False
+
+        self.submit(job).result()
+
+    def _on_word(self, name, location, length):
+        if self._stop_requested:
+            self._stop_requested = False
+            self._engine.stop()
+
+    def stop_speaking(self):
+        """
+        Asks the engine thread to interrupt the utterance being played; returns
+        whether one was playing. The engine is never touched from the caller's
+        thread: the flag is picked up by the next started-word callback.
+        """
+        if not self._speaking:
+            return False
+        self._stop_requested = True
+        return True
+
+    def shutdown(self):
+        """Stops the worker after the queued jobs; the next job starts a new one."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+            if thread is None:
+                return
+            if thread.is_alive():
+                self._jobs.put(None)
+        thread.join()
+        self._started.clear()
+        self._engine = None
+        self._scratch_path = None
+        self._voices.clear()
+        self._current_voice = None
+        self.available = None
+
+    def stats(self):
+        return {"available": self.available, "jobs_completed": self.jobs_completed,
+                "pending_jobs": self._jobs.qsize(), "voices": dict(self._voices)}
+
+
+speech_engine = SpeechEngineWorker()
+
+
+def initialize_tts_engine(language='en'):
+    """
+    Start the shared pyttsx3 engine and resolve the voice for the language.
+    Returns the engine worker, or None when pyttsx3 is not available.
+    """
+    try:
+        speech_engine.prime(language)
+    except RuntimeError:
+        return None
+    return speech_engine
 
 def is_tts_engine_ready(engine):
     return engine is not None
@@ -98,8 +253,8 @@ def text_to_speech_simple(text, output_filename=None):
         raise Exception("TTS engine (pyttsx3) is not available on this system")
     
     # Generate audio file
-    engine.save_to_file(text, output_filename)
-    engine.runAndWait()
+    with open(output_filename, 'wb') as audio_file:
+        audio_file.write(engine.synthesize(text))
     
     # Verify file was created
     if not os.path.exists(output_filename):
@@ -140,93 +295,271 @@ def remove_emojis(text):
     return text_without_emojis
 
 
+LANGUAGE_NAMES = {
+    'en': 'English', 'es': 'Spanish', 'fr': 'French', 'de': 'German',
+    'it': 'Italian', 'pt': 'Portuguese', 'ru': 'Russian', 'zh': 'Chinese (Simplified)',
+    'ja': 'Japanese', 'ko': 'Korean', 'hi': 'Hindi', 'ar': 'Arabic',
+}
+
+FAST_TRANSLATION_MODEL = "llama-3.1-8b-instant"
+
+
+class TranslationCache:
+    """
+    Persistent translation memo keyed by (text hash, target language, model).
+
+    Entries live in an in-process dict, optionally backed by a small SQLite
+    file at path (shared by processes on the host and kept across restarts).
+    Entries older than ttl_seconds are ignored and purged; the table is
+    trimmed to max_entries, oldest first. Without a path, or if the file
+    cannot be opened, the cache runs in memory only.
+    """
+
+    def __init__(self, path=None, ttl_seconds=7 * 24 * 3600, max_entries=10000):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._memory = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._writes = 0
+        self.hits = 0
+        self.misses = 0
+        if not path:
+            return
+        try:
+            self._connection().execute(
+                "CREATE TABLE IF NOT EXISTS translations ("
+                "key TEXT PRIMARY KEY, translation TEXT NOT NULL, created_at REAL NOT NULL)"
+            )
+        except sqlite3.Error as e:
+            print(f"[TTS] Translation cache at {path} unavailable ({e}); using memory only")
+            self.path = None
+
+    @classmethod
+    def from_env(cls):
+        return cls(
+            path=os.getenv("TRANSLATION_CACHE_PATH") or None,
+            ttl_seconds=float(os.getenv("TRANSLATION_CACHE_TTL_SECONDS", str(7 * 24 * 3600))),
+            max_entries=int(os.getenv("TRANSLATION_CACHE_MAX_ENTRIES", "10000"))
+        )
+
+    @staticmethod
+    def make_key(text, target_language, model):
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        return f"{digest}:{target_language.lower()}:{model}"
+
+    def _connection(self):
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            self._local.connection = connection
+        return connection
+
+    def get(self, key):
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+        if entry is None and self.path:
+            try:
+                row = self._connection().execute(
+                    "SELECT translation, created_at FROM translations WHERE key = ?", (key,)
+                ).fetchone()
+            except sqlite3.Error:
+                row = None
+            if row is not None:
+                entry = (row[0], row[1])
+                with self._lock:
+                    self._memory[key] = entry
+        with self._lock:
+            if entry is None or now - entry[1] > self.ttl_seconds:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return entry[0]
+
+    def put(self, key, translation):
+        entry = (translation, time.time())
+        with self._lock:
+            self._memory[key] = entry
+            while len(self._memory) > self.max_entries:
+                self._memory.pop(next(iter(self._memory)))
+            self._writes += 1
+            prune = self._writes % 100 == 0
+        if not self.path:
+            return
+        try:
+            connection = self._connection()
+            connection.execute(
+                "INSERT OR REPLACE INTO translations (key, translation, created_at) VALUES (?, ?, ?)",
+                (key, translation, entry[1])
+            )
+            if prune:
+                self._prune(connection)
+        except sqlite3.Error as e:
+            print(f"[TTS] Could not persist translation: {e}")
+
+    def _prune(self, connection):
+        connection.execute("DELETE FROM translations WHERE created_at < ?", (time.time() - self.ttl_seconds,))
+        connection.execute(
+            "DELETE FROM translations WHERE key NOT IN "
+            "(SELECT key FROM translations ORDER BY created_at DESC LIMIT ?)",
+            (self.max_entries,)
+        )
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+            self.hits = self.misses = 0
+        if self.path:
+            self._connection().execute("DELETE FROM translations")
+
+    def stats(self):
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "memory_entries": len(self._memory),
+                    "persistent": self.path is not None}
+
+
+translation_cache = TranslationCache.from_env()
+
+# Upstream calls in progress, so identical concurrent requests share one
+_inflight_translations = {}
+_inflight_lock = threading.Lock()
+
+
 def translate_text(text, target_language='en'):
     """
-    Translate text to target language using Groq API (Decoupled version)
+    Translate text to target language using Groq API (Decoupled version).
+    Results are memoized in translation_cache; concurrent requests for the
+    same text and language wait for a single upstream call.
+    """
+    return translate_text_checked(text, target_language)[0]
+
+
+def translate_text_checked(text, target_language='en'):
+    """
+    translate_text that also reports success: returns (text, fell_back), where
+    fell_back is True when the upstream call failed and the original text
+    came back in place of a translation.
     """
     text = remove_emojis(text)
-    
-    language_names = {
-        'en': 'English', 'es': 'Spanish', 'fr': 'French', 'de': 'German',
-        'it': 'Italian', 'pt': 'Portuguese', 'ru': 'Russian', 'zh': 'Chinese (Simplified)',
-        'ja': 'Japanese', 'ko': 'Korean', 'hi': 'Hindi', 'ar': 'Arabic',
-    }
-    
-    target_lang_name = language_names.get(target_language.lower(), 'English')
-    
+
     if target_language.lower() == 'en':
-        return text
-    
-    try:
-        # Get Groq configuration from environment variables
-        api_key = os.getenv('GROQ_API_KEY')
-        api_endpoint = os.getenv('GROQ_API_ENDPOINT', "https://api.groq.com/openai/v1/chat/completions")
-        default_model = os.getenv('GROQ_MODEL_NAME', "llama-3.3-70b-versatile")
-        
-        if not api_key:
-            print(f"[TTS] No GROQ_API_KEY found, skipping translation")
-            return text
-        
-        word_count = len(text.split())
-        max_tokens = min(max(word_count * 2, 100), 300)
-        
-        system_prompt = f"""You are a translation tool. Your ONLY job is to translate the given text to {target_lang_name}.
-Return ONLY the translation, nothing else."""
+        return text, False
 
-        translation_prompt = f"Translate this text to {target_lang_name}:\n\n{text}"
-        
-        headers = {
-            "Authorization": f"Bearer {api_key}",
-            "Content-Type": "application/json"
-        }
-        
-        fast_model = "llama-3.1-8b-instant"
-        
-        payload = {
-            "model": fast_model,
-            "messages": [
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": translation_prompt}
-            ],
-            "temperature": 0.0,
-            "max_tokens": max_tokens
-        }
-        
-        try:
-            response = requests.post(api_endpoint, headers=headers, json=payload, timeout=10)
-            if response.status_code != 200:
-                raise Exception(f"Fast model failed")
-        except:
-            # Fallback
-            payload["model"] = default_model
-            response = requests.post(api_endpoint, headers=headers, json=payload, timeout=15)
-        
-        if response.status_code == 200:
-            result = response.json()
-            translated_text = result['choices'][0]['message']['content'].strip()
-            # Basic cleanup
-            translated_text = translated_text.strip('"').strip("'").strip()
-            return translated_text
-        return text
-        
+    api_key = os.getenv('GROQ_API_KEY')
+    if not api_key:
+        print(f"[TTS] No GROQ_API_KEY found, skipping translation")
+        return text, False
+
+    model = os.getenv('GROQ_MODEL_NAME', "llama-3.3-70b-versatile")
+    key = TranslationCache.make_key(text, target_language, f"{FAST_TRANSLATION_MODEL}|{model}")
+    cached = translation_cache.get(key)
+    if cached is not None:
+        return cached, False
+
+    with _inflight_lock:
+        future = _inflight_translations.get(key)
+        leader = future is None
+        if leader:
+            future = _inflight_translations[key] = Future()
+    if not leader:
+        return future.result()
+
+    translated = None
+    try:
+        translated = _request_translation(text, target_language, api_key, model)
+        # Cached before the in-flight entry goes, so a request arriving in
+        # between finds the translation instead of calling upstream again
+        if translated is not None:
+            translation_cache.put(key, translated)
     except Exception as e:
         print(f"[TTS] Translation failed: {e}")
-        return text
+    finally:
+        with _inflight_lock:
+            _inflight_translations.pop(key, None)
+        # Failures fall back to the original text and are not cached
+        future.set_result((translated, False) if translated is not None else (text, True))
+    return future.result()
+
+
+def _request_translation(text, target_language, api_key, default_model):
+    """One upstream translation: the fast model first, then the default model. None on failure."""
+    target_lang_name = LANGUAGE_NAMES.get(target_language.lower(), 'English')
+    api_endpoint = os.getenv('GROQ_API_ENDPOINT', "https://api.groq.com/openai/v1/chat/completions")
+
+    word_count = len(text.split())
+    max_tokens = min(max(word_count * 2, 100), 300)
+
+    system_prompt = f"""You are a translation tool. Your ONLY job is to translate the given text to {target_lang_name}.
+Return ONLY the translation, nothing else."""
+
+    translation_prompt = f"Translate this text to {target_lang_name}:\n\n{text}"
+
+    headers = {
+        "Authorization": f"Bearer {api_key}",
+        "Content-Type": "application/json"
+    }
+
+    payload = {
+        "model": FAST_TRANSLATION_MODEL,
+        "messages": [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": translation_prompt}
+        ],
+        "temperature": 0.0,
+        "max_tokens": max_tokens
+    }
+
+    try:
+        response = requests.post(api_endpoint, headers=headers, json=payload, timeout=10)
+        if response.status_code != 200:
+            raise Exception(f"Fast model failed")
+    except:
+        # Fallback
+        payload["model"] = default_model
+        response = requests.post(api_endpoint, headers=headers, json=payload, timeout=15)
 
+    if response.status_code == 200:
+        result = response.json()
+        translated_text = result['choices'][0]['message']['content'].strip()
+        # Basic cleanup
+        translated_text = translated_text.strip('"').strip("'").strip()
+        return translated_text
+    return None
 
-def text_to_speech_stream(text, language='en', use_google_tts=True, translate=True):
+
+def prefetch_translations(texts, languages, max_workers=4):
+    """Warms translation_cache for every (text, language) pair; returns how many pairs were processed."""
+    pairs = [(text, language) for language in languages if language.lower() != 'en' for text in texts if text]
+    if not pairs or not os.getenv('GROQ_API_KEY'):
+        return 0
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        list(pool.map(lambda pair: translate_text(*pair), pairs))
+    return len(pairs)
+
+
+def text_to_speech_stream(text, language='en', use_google_tts=True, translate=True, report=False):
     """
-    Convert text to speech and return the audio data directly
+    Convert text to speech and return the audio data directly.
+    With report=True, returns (audio, translation_fell_back) instead, so
+    callers can avoid caching audio spoken from untranslated text.
     """
     if not text:
         raise ValueError("Text is required")
     
-    import tempfile
     text = remove_emojis(text)
     
+    fell_back = False
     if translate and language.lower() != 'en':
-        text = translate_text(text, language)
+        text, fell_back = translate_text_checked(text, language)
     
+    audio_data = _synthesize(text, language, use_google_tts)
+    return (audio_data, fell_back) if report else audio_data
+
+
+def _synthesize(text, language, use_google_tts):
     if use_google_tts:
         try:
             from gtts import gTTS
@@ -246,35 +579,20 @@ def text_to_speech_stream(text, language='en', use_google_tts=True, translate=Tr
         engine = initialize_tts_engine(language)
         if not engine:
              raise RuntimeError("No TTS engine available (pyttsx3 failed and gTTS skipped/failed)")
+        return engine.synthesize(text, language)
 
-        with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as temp_file:
-            temp_filepath = temp_file.name
 
-        try:
-            engine.save_to_file(text, temp_filepath)
-            engine.runAndWait()
-            with open(temp_filepath, 'rb') as audio_file:
-                audio_data = audio_file.read()
-            os.unlink(temp_filepath)
-            return audio_data
-        except Exception as e:
-            if os.path.exists(temp_filepath):
-                os.unlink(temp_filepath)
-            raise e
-
-
-def speak_text_directly(text):
+def speak_text_directly(text, language='en'):
     """
     Speak text directly without saving to file
     """
     if not text:
         raise ValueError("Text is required")
-    engine = initialize_tts_engine()
+    engine = initialize_tts_engine(language)
     if not engine:
         print(f"[TTS] Cannot speak directly: pyttsx3 engine not available")
         return
-    engine.say(text)
-    engine.runAndWait()
+    engine.speak(text, language)
 
 
 if __name__ == "__main__":
@@ -1,17 +1,24 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request, Response
 from ..models.schemas import Task, ReviewOutput, NextTask
 from ..models.orchestration import OrchestrationResult
 from ..services.review_orchestrator import ReviewOrchestrator
 from ..core.dependencies import get_review_orchestrator
+from ..core.timing import TIMING_HEADER, collect_timings, server_timing_header, timing_requested
 
 router = APIRouter()
 
 @router.post("/process", response_model=OrchestrationResult)
 async def process_task_submission(
     task: Task,
+    request: Request,
+    response: Response,
     orchestrator: ReviewOrchestrator = Depends(get_review_orchestrator)
 ):
     """
     Main entry point for the autonomous review process.
     """
-    return orchestrator.process_submission(task)
+    with collect_timings(timing_requested(request.headers.get(TIMING_HEADER))) as timings:
+        result = orchestrator.process_submission(task)
+    if timings:
+        response.headers["Server-Timing"] = server_timing_header(timings)
+    return result
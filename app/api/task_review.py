@@ -1,26 +1,57 @@
-from fastapi import APIRouter, HTTPException, Form, File, UploadFile, Request, Depends
+from fastapi import APIRouter, HTTPException, Form, File, UploadFile, Request, Response, Depends
+from fastapi.responses import StreamingResponse
 from typing import Optional
 import logging
+import os
 from ..models.schemas import Task, ReviewOutput, TaskCreate
-from ..models.storage import task_storage
+from ..models.orchestration import BatchReviewRequest, BatchReviewResponse
+from ..core.interfaces.task_store_interface import TaskStore
 
 from ..services.review_orchestrator import ReviewOrchestrator
-from ..core.dependencies import get_review_orchestrator
+from ..services.upload_spool import upload_spooler
+from ..core.dependencies import get_review_orchestrator, get_task_store
+from ..core.timing import TIMING_HEADER, collect_timings, server_timing_header, timing_requested
 
 router = APIRouter()
 logger = logging.getLogger("task_review_system")
 
+# Upper bound on submissions per batch request
+BATCH_MAX_ITEMS = int(os.getenv("REVIEW_BATCH_MAX_ITEMS", "100"))
+# Upper bound on the decoded size of all inline PDFs of one batch request
+BATCH_MAX_PDF_BYTES = int(os.getenv("REVIEW_BATCH_MAX_PDF_BYTES", str(50 * 1024 * 1024)))
+
 @router.post("/review", response_model=ReviewOutput)
 async def review_task(
     request: Request,
+    response: Response,
     task_id: Optional[str] = Form(None),
     payload: Optional[str] = Form(None),
     github_url: Optional[str] = Form(None),
     description: Optional[str] = Form(None),
     pdf_file: Optional[UploadFile] = File(None),
     submitted_by: Optional[str] = Form(None),
-    orchestrator: ReviewOrchestrator = Depends(get_review_orchestrator)
+    orchestrator: ReviewOrchestrator = Depends(get_review_orchestrator),
+    task_store: TaskStore = Depends(get_task_store)
 ):
+    with collect_timings(timing_requested(request.headers.get(TIMING_HEADER))) as timings:
+        review = await _dispatch_review(
+            request, task_id, payload, github_url, description, pdf_file, submitted_by, orchestrator, task_store
+        )
+    if timings:
+        response.headers["Server-Timing"] = server_timing_header(timings)
+    return review
+
+async def _dispatch_review(
+    request: Request,
+    task_id: Optional[str],
+    payload: Optional[str],
+    github_url: Optional[str],
+    description: Optional[str],
+    pdf_file: Optional[UploadFile],
+    submitted_by: Optional[str],
+    orchestrator: ReviewOrchestrator,
+    task_store: TaskStore
+) -> ReviewOutput:
     try:
         target_task = None
         
@@ -52,7 +83,7 @@ async def review_task(
 
         # 2. Handle Task ID (from Form)
         if task_id:
-            entry = task_storage.get(task_id)
+            entry = task_store.get(task_id)
             if not entry:
                 raise HTTPException(status_code=404, detail=f"Task {task_id} not found")
             
@@ -83,7 +114,7 @@ async def review_task(
         # 4. Handle Extended Review (GitHub / PDF / Description)
         if github_url or pdf_file or description:
             # We must have a description if github is present (validation handled in orchestrator or schemas)
-            orchestration_res = orchestrator.orchestrate_review(
+            orchestration_res = await orchestrator.orchestrate_review(
                 description=description,
                 github_url=github_url,
                 pdf_file=pdf_file,
@@ -98,3 +129,69 @@ async def review_task(
     except Exception as e:
         logger.error(f"Review execution failed: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Review process failed: {str(e)}")
+
+
+def batch_pdf_bytes(batch: BatchReviewRequest) -> int:
+    # Decoded size of the inline PDFs, from the base64 length
+    return sum(len(item.pdf_base64) * 3 // 4 for item in batch.items if item.pdf_base64)
+
+def check_batch_size(batch: BatchReviewRequest) -> int:
+    """Rejects oversized batches; returns the PDF bytes the batch will hold in memory."""
+    if len(batch.items) > BATCH_MAX_ITEMS:
+        raise HTTPException(status_code=413, detail=f"Batch exceeds the maximum of {BATCH_MAX_ITEMS} items.")
+    pdf_bytes = batch_pdf_bytes(batch)
+    if pdf_bytes > BATCH_MAX_PDF_BYTES:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Batch PDFs exceed the maximum of {BATCH_MAX_PDF_BYTES // (1024 * 1024)} MB in total."
+        )
+    return pdf_bytes
+
+@router.post("/review/batch", response_model=BatchReviewResponse)
+async def review_batch(
+    batch: BatchReviewRequest,
+    orchestrator: ReviewOrchestrator = Depends(get_review_orchestrator),
+    task_store: TaskStore = Depends(get_task_store)
+):
+    """
+    Reviews many submissions in one request. Results are returned in input
+    order; an item that cannot be reviewed carries an error instead of failing
+    the whole batch.
+    """
+    pdf_bytes = check_batch_size(batch)
+
+    # Decoded PDFs count against the same memory budget as spooled uploads
+    await upload_spooler.budget.acquire(pdf_bytes)
+    try:
+        results = await orchestrator.review_batch(batch.items, task_store.get)
+        return BatchReviewResponse(results=results)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Batch review failed: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Batch review failed: {str(e)}")
+    finally:
+        upload_spooler.budget.release(pdf_bytes)
+
+@router.post("/review/batch/stream")
+async def review_batch_stream(
+    batch: BatchReviewRequest,
+    orchestrator: ReviewOrchestrator = Depends(get_review_orchestrator),
+    task_store: TaskStore = Depends(get_task_store)
+):
+    """
+    Streaming variant of /review/batch: one JSON object per line
+    (application/x-ndjson) in completion order, each carrying its input index.
+    """
+    pdf_bytes = check_batch_size(batch)
+    # Reserved before the response starts so a busy server can still answer 503
+    await upload_spooler.budget.acquire(pdf_bytes)
+
+    async def lines():
+        try:
+            async for item_result in orchestrator.review_stream(batch.items, task_store.get):
+                yield item_result.model_dump_json() + "\n"
+        finally:
+            upload_spooler.budget.release(pdf_bytes)
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
@@ -1,37 +1,60 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
 from datetime import datetime
+from typing import List
 import uuid
 import logging
+import os
 from ..models.schemas import TaskCreate, Task
-from ..models.storage import task_storage
+from ..models.orchestration import BatchSubmitRequest
+from ..core.dependencies import get_task_store
+from ..core.interfaces.task_store_interface import TaskStore
 
 router = APIRouter()
 logger = logging.getLogger("task_review_system")
 
+# Upper bound on tasks per batch submission
+SUBMIT_BATCH_MAX_ITEMS = int(os.getenv("SUBMIT_BATCH_MAX_ITEMS", "100"))
+
+def new_task(payload: TaskCreate) -> Task:
+    return Task(
+        task_id=str(uuid.uuid4()),
+        task_title=payload.task_title,
+        task_description=payload.task_description,
+        submitted_by=payload.submitted_by,
+        timestamp=datetime.now()
+    )
+
+def store_entry(task: Task, payload: TaskCreate) -> dict:
+    # Store demo metadata in task if provided (simplified for Day-2)
+    # In a real system, this would be a separate field or a prefix in ID
+    return {"task": task, "is_demo": payload.is_demo, "demo_type": payload.demo_type}
+
 @router.post("/submit", response_model=Task)
-async def submit_task(payload: TaskCreate):
+async def submit_task(payload: TaskCreate, task_store: TaskStore = Depends(get_task_store)):
     try:
         logger.info(f"Received task submission from '{payload.submitted_by}'. Demo: {payload.is_demo}")
         
-        task_id = str(uuid.uuid4())
-        new_task = Task(
-            task_id=task_id,
-            task_title=payload.task_title,
-            task_description=payload.task_description,
-            submitted_by=payload.submitted_by,
-            timestamp=datetime.now()
-        )
-        
-        # Store demo metadata in task if provided (simplified for Day-2)
-        # In a real system, this would be a separate field or a prefix in ID
-        task_storage[task_id] = {
-            "task": new_task,
-            "is_demo": payload.is_demo,
-            "demo_type": payload.demo_type
-        }
+        task = new_task(payload)
+        task_store[task.task_id] = store_entry(task, payload)
         
-        logger.info(f"Task stored successfully. ID: {task_id}")
-        return new_task
+        logger.info(f"Task stored successfully. ID: {task.task_id}")
+        return task
     except Exception as e:
         logger.error(f"Failed to submit task: {str(e)}")
         raise HTTPException(status_code=500, detail="Submission failed. Please check input parameters.")
+
+@router.post("/submit/batch", response_model=List[Task])
+async def submit_batch(batch: BatchSubmitRequest, task_store: TaskStore = Depends(get_task_store)):
+    """Stores many tasks with one batched store write (a single transaction on SQLite)."""
+    if len(batch.tasks) > SUBMIT_BATCH_MAX_ITEMS:
+        raise HTTPException(status_code=413, detail=f"Batch exceeds the maximum of {SUBMIT_BATCH_MAX_ITEMS} tasks.")
+    try:
+        tasks = [new_task(payload) for payload in batch.tasks]
+        task_store.put_many(
+            (task.task_id, store_entry(task, payload)) for task, payload in zip(tasks, batch.tasks)
+        )
+        logger.info(f"Stored a batch of {len(tasks)} tasks")
+        return tasks
+    except Exception as e:
+        logger.error(f"Failed to submit task batch: {str(e)}")
+        raise HTTPException(status_code=500, detail="Batch submission failed. Please check input parameters.")
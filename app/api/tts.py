@@ -1,44 +1,133 @@
-from fastapi import APIRouter, HTTPException, BackgroundTasks, Response, Query
+from typing import Optional
+from fastapi import APIRouter, HTTPException, Response, Query, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from app.services.tts_integration import generate_audio_stream, speak_on_server, TTS_AVAILABLE
+from app.services.tts_integration import (
+    TTS_CACHE_MAX_AGE_SECONDS,
+    PlaybackQueueFull,
+    audio_cache_key,
+    audio_media_type,
+    generate_audio,
+    is_tts_available,
+    playback_queue,
+    progressive_audio,
+    tts_audio_cache
+)
 
 router = APIRouter()
 
 class TTSRequest(BaseModel):
     text: str
     language: str = "en"
-    mode: str = "stream"  # 'stream' (return file) or 'server_play' (play on host)
+    mode: str = "stream"  # 'stream' (return file), 'chunked' (progressive audio) or 'server_play' (play on host)
+
+def _cache_headers(key: Optional[str]) -> dict:
+    if key is None:
+        # Fallback-engine audio is never cached, here or downstream
+        return {"Cache-Control": "no-store"}
+    # Weak: a re-synthesis after eviction sounds the same but may differ byte for byte
+    return {
+        "ETag": f'W/"{key}"',
+        "Cache-Control": f"public, max-age={TTS_CACHE_MAX_AGE_SECONDS}"
+    }
+
+def _etag_matches(if_none_match: str, key: str) -> bool:
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return f'"{key}"' in candidates or "*" in candidates
+
+async def _audio_response(http_request: Request, text: str, language: str) -> Response:
+    """Serves audio from the cache (or a 304 revalidation), synthesizing on a miss."""
+    key = audio_cache_key(text, language)
+    if _etag_matches(http_request.headers.get("if-none-match", ""), key):
+        return Response(status_code=304, headers=_cache_headers(key))
+    try:
+        # Synthesis blocks on network / audio I/O; keep it off the event loop
+        audio_data, key = await run_in_threadpool(generate_audio, text, language)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    return Response(content=audio_data, media_type=audio_media_type(audio_data), headers=_cache_headers(key))
 
 @router.post("/speak")
-async def speak_text(request: TTSRequest, background_tasks: BackgroundTasks):
+async def speak_text(request: TTSRequest, http_request: Request):
     """
     Generates speech from text using the integrated VaaniTTS engine.
-    
+
     - **text**: The text to speak.
     - **language**: Language code (default: 'en').
-    - **mode**: 
-        - 'stream': Returns audio file (wav).
-        - 'server_play': Plays audio on the server speakers (local agent mode).
+    - **mode**:
+        - 'stream': Returns audio file (MP3 from gTTS, WAV from the pyttsx3 fallback), cached and served with ETag.
+        - 'chunked': Streams audio sentence by sentence as it is synthesized; playback can start after the first sentence.
+        - 'server_play': Queues audio for the server speakers (local agent mode); items play one at a time.
     """
-    if not TTS_AVAILABLE:
+    if not is_tts_available():
         raise HTTPException(status_code=503, detail="TTS Service is not available (Module not found or dependencies missing)")
 
     if request.mode == "server_play":
-        # Play on server in background to avoid blocking
-        background_tasks.add_task(speak_on_server, request.text)
-        return {"status": "queued", "message": f"Speaking: {request.text[:20]}..."}
-    
-    try:
-        # Stream audio back to client
-        audio_data = generate_audio_stream(request.text, request.language)
-        return Response(content=audio_data, media_type="audio/wav")
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        # Played by the single playback consumer; identical pending texts are queued once
+        try:
+            item, queued = playback_queue.enqueue(request.text, request.language)
+        except PlaybackQueueFull as e:
+            raise HTTPException(status_code=429, detail=str(e))
+        return {
+            "status": "queued" if queued else "duplicate",
+            "message": f"Speaking: {request.text[:20]}...",
+            "id": item["id"],
+            "queue_length": playback_queue.stats()["pending"]
+        }
+
+    if request.mode == "chunked":
+        try:
+            media_type, chunks = await run_in_threadpool(progressive_audio, request.text, request.language)
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=str(e))
+        return StreamingResponse(chunks, media_type=media_type)
+
+    # Stream audio back to client
+    return await _audio_response(http_request, request.text, request.language)
+
+@router.get("/speak")
+async def speak_text_cacheable(
+    http_request: Request,
+    text: str = Query(..., min_length=1),
+    language: str = Query("en")
+):
+    """
+    Cacheable variant of stream mode: browsers and CDNs can store GET responses
+    and revalidate them with If-None-Match.
+    """
+    if not is_tts_available():
+        raise HTTPException(status_code=503, detail="TTS Service is not available (Module not found or dependencies missing)")
+    return await _audio_response(http_request, text, language)
 
 @router.get("/status")
 async def get_tts_status():
     """Check if TTS service is operational."""
     return {
-        "available": TTS_AVAILABLE,
-        "service": "VaaniTTS_Standalone"
+        "available": is_tts_available(),
+        "service": "VaaniTTS_Standalone",
+        "audio_cache": tts_audio_cache.stats(),
+        "playback_queue": playback_queue.stats()
     }
+
+@router.get("/queue")
+async def get_playback_queue():
+    """Lists the item being played on the server and the ones waiting."""
+    return playback_queue.snapshot()
+
+@router.delete("/queue/{item_id}")
+async def cancel_playback(item_id: str):
+    """Removes a pending server_play item."""
+    if not playback_queue.cancel(item_id):
+        raise HTTPException(status_code=404, detail="No pending playback with this id")
+    return {"status": "cancelled", "id": item_id}
+
+@router.delete("/queue")
+async def clear_playback_queue():
+    """Drops every pending server_play item; the one being played finishes."""
+    return {"status": "cleared", "cancelled": playback_queue.clear()}
+
+@router.post("/queue/skip")
+async def skip_playback():
+    """Interrupts the item being played; the next pending one starts."""
+    return {"skipped": playback_queue.skip()}
@@ -0,0 +1,104 @@
+"""
+Application-scoped object graph.
+
+One AppContainer is created in the lifespan hook and stored on
+`app.state.container`. It owns the long-lived pieces the routes share: the
+review engine (through EngineRegistry), the next task generator, the
+orchestrator built from them, the GitHub client pool, the PDF workers, the
+server playback queue and the caches. Routes receive it through
+`get_container` instead of building a new object graph per request.
+"""
+import asyncio
+import logging
+import threading
+from typing import Optional
+from fastapi import Request
+from .engine_registry import EngineRegistry
+from .interfaces.next_task_interface import NextTaskGeneratorInterface
+from .interfaces.review_engine_interface import ReviewEngineInterface
+from .interfaces.task_store_interface import TaskStore
+from .metrics import mark_worker_exit
+from .warmup import WARMUP_STEPS, Warmup, synthetic_review, warmup as default_warmup
+from ..models.storage import task_storage
+from ..services.pdf_executor import PDFExtractionExecutor, pdf_executor
+from ..services.repo_analyzer import AsyncRepoAnalyzer
+from ..services.repo_metrics_cache import RepoMetricsCache, repo_metrics_cache
+from ..services.review_cache import ReviewResultCache, review_cache
+from ..services.review_orchestrator import ReviewOrchestrator
+from ..services.sequential_task_generator import SequentialTaskGenerator
+from ..services.tts_integration import PlaybackQueue, playback_queue
+
+logger = logging.getLogger("task_review_system.container")
+
+
+class AppContainer:
+    def __init__(
+        self,
+        next_task_generator: Optional[NextTaskGeneratorInterface] = None,
+        task_store: TaskStore = task_storage,
+        review_cache: ReviewResultCache = review_cache,
+        repo_metrics_cache: RepoMetricsCache = repo_metrics_cache,
+        pdf_executor: PDFExtractionExecutor = pdf_executor,
+        warmup: Warmup = default_warmup,
+        playback_queue: PlaybackQueue = playback_queue
+    ):
+        self.engines = EngineRegistry
+        self.next_task_generator = next_task_generator or SequentialTaskGenerator()
+        self.task_store = task_store
+        self.review_cache = review_cache
+        self.repo_metrics_cache = repo_metrics_cache
+        self.pdf_executor = pdf_executor
+        self.repo_analyzer = AsyncRepoAnalyzer
+        self.warmup = warmup
+        self.playback_queue = playback_queue
+        self._orchestrator: Optional[ReviewOrchestrator] = None
+        self._lock = threading.Lock()
+
+    @property
+    def review_engine(self) -> ReviewEngineInterface:
+        return self.engines.get_engine()
+
+    def review_orchestrator(self) -> ReviewOrchestrator:
+        """
+        The shared orchestrator for the current engine. After an engine swap
+        the next call builds a new one; requests holding the old orchestrator
+        finish on the engine they started with.
+        """
+        engine = self.engines.get_engine()
+        orchestrator = self._orchestrator
+        if orchestrator is not None and orchestrator._review_engine is engine:
+            return orchestrator
+        with self._lock:
+            if self._orchestrator is None or self._orchestrator._review_engine is not engine:
+                self._orchestrator = ReviewOrchestrator(
+                    engine,
+                    self.next_task_generator,
+                    pdf_executor=self.pdf_executor,
+                    repo_analyzer=self.repo_analyzer,
+                    review_cache=self.review_cache
+                )
+            return self._orchestrator
+
+    async def startup(self):
+        # The synthetic review goes through this container's orchestrator
+        self.warmup.start({
+            **WARMUP_STEPS,
+            "review": lambda: asyncio.to_thread(synthetic_review, self.review_orchestrator())
+        })
+
+    async def shutdown(self):
+        # Release pooled GitHub connections and PDF workers; drop queued server playback
+        await self.warmup.stop()
+        self.playback_queue.shutdown()
+        await self.repo_analyzer.aclose()
+        self.pdf_executor.shutdown()
+        mark_worker_exit()
+
+
+def get_container(request: Request) -> AppContainer:
+    """Dependency provider for the application container."""
+    container = getattr(request.app.state, "container", None)
+    if container is None:
+        # The lifespan did not run (e.g. TestClient outside a with-block)
+        container = request.app.state.container = AppContainer()
+    return container
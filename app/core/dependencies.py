@@ -1,21 +1,18 @@
 from fastapi import Depends
 from ..core.interfaces.review_engine_interface import ReviewEngineInterface
-from ..core.interfaces.next_task_interface import NextTaskGeneratorInterface
-from ..services.review_engine import ReviewEngine
-from ..services.sequential_task_generator import SequentialTaskGenerator
+from ..core.interfaces.task_store_interface import TaskStore
 from ..services.review_orchestrator import ReviewOrchestrator
+from .container import AppContainer, get_container
+from .engine_registry import EngineRegistry
 
 def get_review_engine() -> ReviewEngineInterface:
-    """Dependency Provider for Review Engine"""
-    return ReviewEngine()
+    """Dependency Provider for Review Engine (the registry's active engine)"""
+    return EngineRegistry.get_engine()
 
-def get_next_task_generator() -> NextTaskGeneratorInterface:
-    """Dependency Provider for Next Task Generator"""
-    return SequentialTaskGenerator()
+def get_review_orchestrator(container: AppContainer = Depends(get_container)) -> ReviewOrchestrator:
+    """Dependency Provider for Review Orchestrator, shared for the application's lifetime"""
+    return container.review_orchestrator()
 
-def get_review_orchestrator(
-    review_engine: ReviewEngineInterface = Depends(get_review_engine),
-    next_task_generator: NextTaskGeneratorInterface = Depends(get_next_task_generator)
-) -> ReviewOrchestrator:
-    """Dependency Provider for Review Orchestrator"""
-    return ReviewOrchestrator(review_engine, next_task_generator)
+def get_task_store(container: AppContainer = Depends(get_container)) -> TaskStore:
+    """Dependency Provider for the task store owned by the container"""
+    return container.task_store
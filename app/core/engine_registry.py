@@ -1,13 +1,49 @@
+import logging
+import threading
+from typing import Any, Dict
 from ..services.review_engine import ReviewEngine
 from ..core.interfaces.review_engine_interface import ReviewEngineInterface
 
+logger = logging.getLogger("task_review_system.engine_registry")
+
 class EngineRegistry:
+    """
+    Process-wide holder of the active review engine.
+
+    register_engine swaps the engine with a single reference assignment:
+    requests that already fetched the engine (or an orchestrator built on
+    it) finish with that instance, and every later lookup sees the new one.
+    The generation counter lets holders of derived objects notice a swap.
+    """
+
     _engine: ReviewEngineInterface = ReviewEngine()
+    _generation: int = 0
+    _lock = threading.Lock()
 
     @classmethod
     def get_engine(cls) -> ReviewEngineInterface:
         return cls._engine
 
+    @classmethod
+    def generation(cls) -> int:
+        return cls._generation
+
     @classmethod
     def register_engine(cls, engine: ReviewEngineInterface):
-        cls._engine = engine
+        if not isinstance(engine, ReviewEngineInterface):
+            raise TypeError(f"{type(engine).__name__} does not implement ReviewEngineInterface")
+        with cls._lock:
+            previous = cls._engine
+            cls._engine = engine
+            cls._generation += 1
+        logger.info(f"Review engine swapped: {type(previous).__name__} -> {type(engine).__name__} "
+                    f"(generation {cls._generation})")
+
+    @classmethod
+    def stats(cls) -> Dict[str, Any]:
+        engine = cls._engine
+        return {
+            "engine": type(engine).__name__,
+            "version": engine.cache_version(),
+            "generation": cls._generation
+        }
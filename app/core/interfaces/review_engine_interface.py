@@ -1,6 +1,40 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import List, Optional
+from ...models.review_context import ReviewContext
 
 class ReviewEngineInterface(ABC):
+    # Engines whose output is a pure function of the review context declare a
+    # version; the orchestrator then memoizes their results under it.
+    VERSION: Optional[str] = None
+
+    def cache_version(self) -> Optional[str]:
+        """
+        Cache key component for this engine's results. Engines driven by
+        reloadable configuration extend VERSION with that configuration's identity.
+        """
+        return self.VERSION if isinstance(self.VERSION, str) else None
+
     @abstractmethod
     def evaluate(self, task: dict) -> dict:
         pass
+
+    def evaluate_context(self, context: ReviewContext) -> dict:
+        """
+        Scores a structured review context.
+        Engines that only understand task dicts get the legacy combined description.
+        """
+        return self.evaluate({
+            "task_id": "context-review",
+            "task_title": "Structured Review",
+            "task_description": context.to_legacy_description(),
+            "submitted_by": "orchestrator",
+            "timestamp": datetime.now()
+        })
+
+    def evaluate_many(self, contexts: List[ReviewContext]) -> List[dict]:
+        """
+        Scores several contexts in one call, returning results in input order.
+        Engines with a cheaper batch path override this.
+        """
+        return [self.evaluate_context(context) for context in contexts]
@@ -0,0 +1,45 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+class TaskStore(ABC):
+    """
+    Storage backend for submitted tasks.
+    Entries are dicts of the form {"task": Task, "is_demo": bool, "demo_type": str | None}.
+    """
+
+    @abstractmethod
+    def get(self, task_id: str, default: Any = None) -> Optional[Dict[str, Any]]:
+        pass
+
+    @abstractmethod
+    def put(self, task_id: str, entry: Dict[str, Any]):
+        pass
+
+    def put_many(self, entries: Iterable[Tuple[str, Dict[str, Any]]]):
+        """Stores several entries; backends with a cheaper batched write override this."""
+        for task_id, entry in entries:
+            self.put(task_id, entry)
+
+    @abstractmethod
+    def find_by_submitter(self, submitted_by: str, limit: int = 100) -> List[Dict[str, Any]]:
+        pass
+
+    @abstractmethod
+    def stats(self) -> Dict[str, Any]:
+        pass
+
+    @abstractmethod
+    def clear(self):
+        pass
+
+    def __setitem__(self, task_id: str, entry: Dict[str, Any]):
+        self.put(task_id, entry)
+
+    def __getitem__(self, task_id: str) -> Dict[str, Any]:
+        entry = self.get(task_id)
+        if entry is None:
+            raise KeyError(task_id)
+        return entry
+
+    def __contains__(self, task_id: object) -> bool:
+        return isinstance(task_id, str) and self.get(task_id) is not None
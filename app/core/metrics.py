@@ -0,0 +1,161 @@
+"""
+Prometheus instrumentation for the review pipeline.
+
+prometheus_client is optional: without it every recorder is a no-op and
+/metrics answers 503. With several uvicorn workers, point
+PROMETHEUS_MULTIPROC_DIR at an empty directory shared by the workers; each
+worker then writes its samples to memory-mapped files and /metrics
+aggregates them, whichever worker serves the scrape.
+"""
+import logging
+import os
+import time
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger("task_review_system.metrics")
+
+try:
+    from prometheus_client import (
+        CONTENT_TYPE_LATEST,
+        REGISTRY,
+        CollectorRegistry,
+        Counter,
+        Gauge,
+        Histogram,
+        generate_latest,
+        multiprocess
+    )
+    METRICS_AVAILABLE = True
+except ImportError:
+    METRICS_AVAILABLE = False
+    CONTENT_TYPE_LATEST = "text/plain; version=0.0.4; charset=utf-8"
+
+MULTIPROC_DIR = os.getenv("PROMETHEUS_MULTIPROC_DIR") or os.getenv("prometheus_multiproc_dir")
+
+if METRICS_AVAILABLE:
+    HTTP_REQUESTS = Counter(
+        "task_review_http_requests_total", "HTTP requests handled, by router",
+        ["router", "method", "status"]
+    )
+    HTTP_LATENCY = Histogram(
+        "task_review_http_request_duration_seconds", "HTTP request latency, by router",
+        ["router"],
+        buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+    )
+    PDF_BYTES = Counter("task_review_pdf_bytes_total", "Bytes of PDF uploads extracted")
+    PDF_PAGES = Counter("task_review_pdf_pages_total", "PDF pages parsed")
+    GITHUB_REQUESTS = Counter(
+        "task_review_github_requests_total", "GitHub API calls, by endpoint and status code",
+        ["endpoint", "status"]
+    )
+    GITHUB_RATE_LIMIT = Gauge(
+        "task_review_github_rate_limit_remaining", "Last X-RateLimit-Remaining reported by GitHub",
+        multiprocess_mode="mostrecent"
+    )
+    # Set by the store on every change, so workers that never serve a scrape
+    # still report; the latest write wins, which is exact for the shared
+    # SQLite store (per-process stores do not share tasks between workers anyway)
+    TASK_STORE_ENTRIES = Gauge(
+        "task_review_task_store_entries", "Tasks held by the task store",
+        multiprocess_mode="livemostrecent"
+    )
+    TASK_STORE_EVICTIONS = Counter(
+        "task_review_task_store_evictions_total", "Tasks evicted from the task store"
+    )
+    REVIEW_SCORES = Histogram(
+        "task_review_score", "Review scores, by status",
+        ["status"],
+        buckets=(10, 20, 30, 40, 50, 60, 70, 80, 90, 100)
+    )
+
+# Router label per endpoint function, resolved once (the hot path is a dict hit)
+_router_names: Dict[Any, str] = {}
+
+
+def router_name(scope: Dict[str, Any]) -> str:
+    route = scope.get("route")
+    endpoint = getattr(route, "endpoint", None)
+    if endpoint is None:
+        return "unmatched"
+    name = _router_names.get(endpoint)
+    if name is None:
+        # app.api.task_review -> task_review
+        name = _router_names[endpoint] = endpoint.__module__.rsplit(".", 1)[-1]
+    return name
+
+
+class MetricsMiddleware:
+    """Pure ASGI middleware: counts and times every HTTP request by router."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not METRICS_AVAILABLE:
+            await self.app(scope, receive, send)
+            return
+
+        status = {"code": 500}
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+            await send(message)
+
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            router = router_name(scope)
+            HTTP_LATENCY.labels(router).observe(time.perf_counter() - start)
+            HTTP_REQUESTS.labels(router, scope["method"], str(status["code"])).inc()
+
+
+def record_pdf(size_bytes: int = 0, pages: int = 0):
+    if not METRICS_AVAILABLE:
+        return
+    if size_bytes:
+        PDF_BYTES.inc(size_bytes)
+    if pages:
+        PDF_PAGES.inc(pages)
+
+
+def record_github_response(endpoint: str, response):
+    if not METRICS_AVAILABLE:
+        return
+    GITHUB_REQUESTS.labels(endpoint.split(":", 1)[0], str(response.status_code)).inc()
+    remaining = (getattr(response, "headers", None) or {}).get("X-RateLimit-Remaining")
+    if remaining is not None:
+        try:
+            GITHUB_RATE_LIMIT.set(int(remaining))
+        except ValueError:
+            pass
+
+
+def record_task_store(entries: int, evictions: int = 0):
+    """Called by the task stores whenever their size changes."""
+    if not METRICS_AVAILABLE:
+        return
+    TASK_STORE_ENTRIES.set(entries)
+    if evictions:
+        TASK_STORE_EVICTIONS.inc(evictions)
+
+
+def record_review(score: int, status: str):
+    if METRICS_AVAILABLE:
+        REVIEW_SCORES.labels(status).observe(score)
+
+
+def render_latest() -> Tuple[bytes, str]:
+    """Exposition payload for /metrics, aggregated over all workers in multiprocess mode."""
+    if MULTIPROC_DIR:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry), CONTENT_TYPE_LATEST
+    return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
+
+
+def mark_worker_exit(pid: Optional[int] = None):
+    """Drops this worker's live gauges from the shared multiprocess directory."""
+    if METRICS_AVAILABLE and MULTIPROC_DIR:
+        multiprocess.mark_process_dead(pid or os.getpid())
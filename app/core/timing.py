@@ -0,0 +1,65 @@
+"""
+Opt-in per-stage wall-clock timing for the review pipeline.
+
+A request turns collection on with `collect_timings()`; pipeline code wraps
+its stages in `stage(name)`. Timings live in a context variable, so
+concurrent requests never mix, and tasks spawned with asyncio.gather write
+into their parent's collection. When no collection is active `stage()` only
+checks the context variable.
+"""
+import os
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, Optional
+
+TIMING_HEADER = "X-Review-Timing"
+
+_timings: ContextVar[Optional[Dict[str, float]]] = ContextVar("review_stage_timings", default=None)
+
+
+def timing_requested(header_value: Optional[str] = None) -> bool:
+    """Timing is on for every request with REVIEW_TIMING_ENABLED, or per request via the X-Review-Timing header."""
+    if os.getenv("REVIEW_TIMING_ENABLED", "false").lower() == "true":
+        return True
+    return (header_value or "").lower() in ("1", "true", "yes")
+
+
+@contextmanager
+def collect_timings(enabled: bool = True) -> Iterator[Optional[Dict[str, float]]]:
+    """Starts a collection for the current request; yields the dict stages are recorded into."""
+    if not enabled:
+        yield None
+        return
+    timings: Dict[str, float] = {}
+    token = _timings.set(timings)
+    try:
+        yield timings
+    finally:
+        _timings.reset(token)
+
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    timings = _timings.get()
+    if timings is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        # Repeated stages (e.g. several PDF shards) accumulate
+        timings[name] = round(timings.get(name, 0.0) + elapsed_ms, 3)
+
+
+def current_timings() -> Optional[Dict[str, float]]:
+    """Snapshot of the active collection, or None when timing is off."""
+    timings = _timings.get()
+    return dict(timings) if timings is not None else None
+
+
+def server_timing_header(timings: Dict[str, float]) -> str:
+    """Formats timings for the Server-Timing response header."""
+    return ", ".join(f"{name};dur={duration}" for name, duration in timings.items())
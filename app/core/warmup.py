@@ -0,0 +1,218 @@
+"""
+Startup warm-up and per-subsystem readiness.
+
+The lifespan hook starts `warmup.start()` in the background: each subsystem
+(PDF stack and workers, GitHub client, TTS engine, the review pipeline) is
+preloaded once, and its state is reported by /ready. Until every required
+subsystem is warm /ready answers 503, so load balancers keep traffic on
+workers that have already paid for the first-request costs. TTS and the
+translation prefetch are optional: when TTS is not installed they are
+reported as unavailable without holding readiness back.
+"""
+import asyncio
+import logging
+import os
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional
+
+logger = logging.getLogger("task_review_system.warmup")
+
+SUBSYSTEMS = ("pdf", "github", "tts", "translation", "review")
+OPTIONAL_SUBSYSTEMS = frozenset({"tts", "translation"})
+
+# Subsystem states
+PENDING = "pending"
+WARMING = "warming"
+READY = "ready"
+UNAVAILABLE = "unavailable"
+FAILED = "failed"
+SKIPPED = "skipped"
+DEGRADED = "degraded"
+
+
+async def warm_pdf():
+    from ..services.pdf_executor import pdf_executor
+    from ..services.pdf_processor import preload_job
+
+    # Import the PDF stack here (thread fallback, sync path) and in every pool worker
+    await asyncio.to_thread(preload_job)
+    await asyncio.gather(*(pdf_executor.run(preload_job) for _ in range(max(pdf_executor.pool_size, 1))))
+
+
+async def warm_github():
+    from ..services.repo_analyzer import AsyncRepoAnalyzer, RepoAnalyzer
+
+    # Imports httpx and opens the shared pool on the serving loop; no API calls are made
+    AsyncRepoAnalyzer.get_client()
+    RepoAnalyzer._parse_url("https://github.com/octo/warmup")
+
+
+async def warm_tts() -> str:
+    from ..services.tts_integration import warm_up_tts
+
+    # "ready", "degraded" (offline engine failed, gTTS still usable) or "unavailable"
+    return await asyncio.to_thread(warm_up_tts)
+
+
+async def warm_translation() -> bool:
+    from ..services.tts_integration import prefetch_translations
+
+    # Static next-task texts, hints and failure messages, in TRANSLATION_PREFETCH_LANGUAGES
+    return await asyncio.to_thread(prefetch_translations)
+
+
+def synthetic_review(orchestrator=None):
+    """Runs one review through the orchestrator, building every validator on the path."""
+    from ..models.review_context import ReviewContext
+
+    if orchestrator is None:
+        from ..services.review_engine import ReviewEngine
+        from ..services.review_orchestrator import ReviewOrchestrator
+        from ..services.sequential_task_generator import SequentialTaskGenerator
+
+        orchestrator = ReviewOrchestrator(ReviewEngine(), SequentialTaskGenerator())
+    context = ReviewContext(
+        description="Objective: warm-up review exercising the scoring pipeline end to end.",
+        repo_metrics={"has_readme": True, "has_tests": True, "commit_count": 12, "file_count": 20},
+        pdf_text="# Warm-up\n" + "word " * 120
+    )
+    # The legacy marker-string parser is still used for stored tasks
+    ReviewContext.from_legacy_description(context.to_legacy_description())
+    # warm() leaves no entry, stats or score metrics behind
+    return orchestrator.warm(context)
+
+
+async def warm_review():
+    await asyncio.to_thread(synthetic_review)
+
+
+WARMUP_STEPS: Dict[str, Callable[[], Awaitable[Any]]] = {
+    "pdf": warm_pdf,
+    "github": warm_github,
+    "tts": warm_tts,
+    "translation": warm_translation,
+    "review": warm_review,
+}
+
+
+class Warmup:
+    def __init__(self, enabled: bool = True, subsystems: Iterable[str] = SUBSYSTEMS, timeout_seconds: float = 30.0,
+                 retry_seconds: float = 2.0, retry_max_seconds: float = 60.0):
+        self.enabled = enabled
+        self.subsystems = tuple(name for name in subsystems if name in SUBSYSTEMS)
+        self.timeout_seconds = timeout_seconds
+        self.retry_seconds = retry_seconds
+        self.retry_max_seconds = retry_max_seconds
+        self._task: Optional[asyncio.Task] = None
+        self.reset()
+
+    @classmethod
+    def from_env(cls) -> "Warmup":
+        # Serverless instances are short-lived; warming them only delays the first request
+        default_enabled = "false" if os.getenv("VERCEL") else "true"
+        subsystems = os.getenv("WARMUP_SUBSYSTEMS", ",".join(SUBSYSTEMS))
+        return cls(
+            enabled=os.getenv("WARMUP_ENABLED", default_enabled).lower() == "true",
+            subsystems=[name.strip() for name in subsystems.split(",") if name.strip()],
+            timeout_seconds=float(os.getenv("WARMUP_TIMEOUT_SECONDS", "30")),
+            retry_seconds=float(os.getenv("WARMUP_RETRY_SECONDS", "2")),
+            retry_max_seconds=float(os.getenv("WARMUP_RETRY_MAX_SECONDS", "60"))
+        )
+
+    def reset(self):
+        self.started = False
+        self.completed = False
+        self.state: Dict[str, Dict[str, Any]] = {
+            name: {"state": PENDING if self.enabled and name in self.subsystems else SKIPPED}
+            for name in SUBSYSTEMS
+        }
+
+    def start(self, steps: Optional[Dict[str, Callable[[], Awaitable[Any]]]] = None) -> Optional[asyncio.Task]:
+        """Schedules the warm-up on the running loop; startup does not wait for it."""
+        if not self.enabled or self._task is not None:
+            return self._task
+        self._task = asyncio.get_running_loop().create_task(self.run(steps))
+        return self._task
+
+    async def stop(self):
+        task, self._task = self._task, None
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    async def run(self, steps: Optional[Dict[str, Callable[[], Awaitable[Any]]]] = None):
+        steps = steps or WARMUP_STEPS
+        self.started = True
+        start = time.perf_counter()
+        await asyncio.gather(*(self._warm(name, steps[name]) for name in self.subsystems))
+        self.completed = True
+        logger.info(f"Warm-up finished in {(time.perf_counter() - start) * 1000:.0f}ms: "
+                    + ", ".join(f"{name}={entry['state']}" for name, entry in self.state.items()))
+
+    async def _warm(self, name: str, step: Callable[[], Awaitable[Any]]):
+        delay = self.retry_seconds
+        attempts = 0
+        while True:
+            attempts += 1
+            self.state[name] = {"state": WARMING, "attempts": attempts}
+            start = time.perf_counter()
+            try:
+                outcome = await asyncio.wait_for(step(), timeout=self.timeout_seconds)
+                self.state[name]["state"] = self._outcome_state(outcome)
+                error = None
+            except asyncio.TimeoutError:
+                error = "timed out"
+                logger.error(f"Warm-up of {name} exceeded {self.timeout_seconds}s")
+            except Exception as e:
+                error = str(e)
+                logger.error(f"Warm-up of {name} failed: {e}")
+            self.state[name]["duration_ms"] = round((time.perf_counter() - start) * 1000, 1)
+            if error is None:
+                return
+            self.state[name].update(state=FAILED, error=error)
+            if name in OPTIONAL_SUBSYSTEMS:
+                return
+            # Required subsystems keep retrying, backing off, until they warm up
+            self.state[name]["retry_in_seconds"] = delay
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.retry_max_seconds)
+
+    @staticmethod
+    def _outcome_state(outcome: Any) -> str:
+        """Steps return None/True when warm, False when unavailable, or an explicit state."""
+        if outcome is False:
+            return UNAVAILABLE
+        if outcome in (READY, DEGRADED, UNAVAILABLE):
+            return outcome
+        return READY
+
+    def is_ready(self) -> bool:
+        """Ready once every required subsystem is warm (or was not asked to warm up)."""
+        for name, entry in self.state.items():
+            if entry["state"] in (READY, DEGRADED, SKIPPED):
+                continue
+            if name in OPTIONAL_SUBSYSTEMS and entry["state"] in (UNAVAILABLE, FAILED):
+                continue
+            return False
+        return True
+
+    @property
+    def phase(self) -> str:
+        if not self.enabled:
+            return "disabled"
+        if self.completed:
+            return "complete"
+        return "running" if self.started else "pending"
+
+    def report(self) -> Dict[str, Any]:
+        return {
+            "ready": self.is_ready(),
+            "warmup": self.phase,
+            "subsystems": {name: dict(entry) for name, entry in self.state.items()}
+        }
+
+
+warmup = Warmup.from_env()
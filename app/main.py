@@ -4,10 +4,16 @@ Updated on: 2026-02-05
 Version: 1.1.1
 """
 from fastapi import FastAPI, Request, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from fastapi.exceptions import RequestValidationError
 from .api import task_submit, task_review, next_task, orchestration, tts
+from .services.upload_spool import upload_spooler
+from .core.container import AppContainer, get_container
+from .core.engine_registry import EngineRegistry
+from .core.metrics import METRICS_AVAILABLE, MetricsMiddleware, render_latest
+from .core.warmup import warmup
 from fastapi.middleware.cors import CORSMiddleware
+from contextlib import asynccontextmanager
 import logging
 import sys
 import os
@@ -23,10 +29,21 @@ logging.basicConfig(
 )
 logger = logging.getLogger("task_review_system")
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # One object graph per process, shared by every request
+    container = app.state.container = AppContainer(warmup=warmup)
+    # Preload PDF, GitHub, TTS and the review path in the background; /ready reports progress
+    await container.startup()
+    yield
+    await container.shutdown()
+    del app.state.container
+
 app = FastAPI(
     title="Task Review AI - Production Demo",
     description="Deterministic Engineering Task Analysis System (Locked)",
-    version="1.1.0"
+    version="1.1.0",
+    lifespan=lifespan
 )
 
 # Security: CORS Middleware
@@ -51,6 +68,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Request counts and latency per router (outermost, so every response is counted)
+app.add_middleware(MetricsMiddleware)
+
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     # Standardized failure contract as requested by the user
@@ -91,8 +111,31 @@ app.include_router(tts.router, prefix="/api/v1/tts", tags=["Tools"])
 
 
 @app.get("/health")
-async def health():
-    return {"status": "healthy", "version": "1.1.0"}
+async def health(request: Request):
+    container = get_container(request)
+    return {
+        "status": "healthy",
+        "version": "1.1.0",
+        "review_engine": EngineRegistry.stats(),
+        "github_cache": container.repo_metrics_cache.stats(),
+        "pdf_executor": container.pdf_executor.stats(),
+        "upload_budget": upload_spooler.budget.stats(),
+        "task_store": container.task_store.stats(),
+        "review_cache": container.review_cache.stats()
+    }
+
+@app.get("/ready")
+async def ready(request: Request):
+    """Readiness probe: 503 until the warm-up has prepared every required subsystem."""
+    report = get_container(request).warmup.report()
+    return JSONResponse(status_code=200 if report["ready"] else 503, content=report)
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    if not METRICS_AVAILABLE:
+        return JSONResponse(status_code=503, content={"detail": "prometheus_client is not installed"})
+    payload, content_type = render_latest()
+    return Response(content=payload, media_type=content_type)
 
 if __name__ == "__main__":
     import uvicorn
@@ -1,7 +1,35 @@
-from pydantic import BaseModel
-from .schemas import ReviewOutput, NextTask, V2NextTask
+from pydantic import BaseModel, Field
+from typing import Any, Dict, List, Optional
+from .schemas import ReviewOutput, NextTask, V2NextTask, TaskCreate
 
 class OrchestrationResult(BaseModel):
     review: ReviewOutput
     readiness_classification: str
     next_task: V2NextTask
+
+
+class BatchReviewItem(BaseModel):
+    """One submission in a batch: a stored task, an inline payload, or extended inputs."""
+    task_id: Optional[str] = None
+    payload: Optional[Dict[str, Any]] = None
+    description: Optional[str] = None
+    github_url: Optional[str] = None
+    pdf_base64: Optional[str] = None
+
+class BatchReviewRequest(BaseModel):
+    items: List[BatchReviewItem] = Field(..., min_length=1)
+
+class BatchSubmitRequest(BaseModel):
+    tasks: List[TaskCreate] = Field(..., min_length=1)
+
+class BatchItemError(BaseModel):
+    status_code: int
+    detail: str
+
+class BatchReviewItemResult(BaseModel):
+    index: int
+    result: Optional[OrchestrationResult] = None
+    error: Optional[BatchItemError] = None
+
+class BatchReviewResponse(BaseModel):
+    results: List[BatchReviewItemResult]
@@ -0,0 +1,61 @@
+from pydantic import BaseModel, Field
+from typing import Any, Dict
+import json
+import logging
+import re
+
+logger = logging.getLogger("task_review_system")
+
+REPO_METRICS_MARKER = "GitHub Repository Metrics"
+PDF_CONTENT_MARKER = "Extracted PDF Content"
+
+# Split by known markers (flexible whitespace)
+# Using [ \t]* around newlines and markers
+_MARKER_PATTERN = re.compile(
+    rf"(?:\r?\n)+[ \t]*--- ({REPO_METRICS_MARKER}|{PDF_CONTENT_MARKER}) ---[ \t]*(?:\r?\n)+"
+)
+
+class ReviewContext(BaseModel):
+    """
+    Structured review input. Description, repository metrics and PDF text
+    travel separately from the orchestrator into the engine instead of being
+    folded into one marker-delimited task description.
+    """
+    description: str = ""
+    repo_metrics: Dict[str, Any] = Field(default_factory=dict)
+    pdf_text: str = ""
+
+    @classmethod
+    def from_legacy_description(cls, description: str) -> "ReviewContext":
+        """Compatibility parser for the combined '--- Marker ---' description format."""
+        parts = _MARKER_PATTERN.split(description)
+
+        # parts[0] is the main description
+        main_description = parts[0].strip()
+        repo_metrics = {}
+        pdf_text = ""
+
+        # Iterate through markers and content
+        for i in range(1, len(parts), 2):
+            marker = parts[i]
+            content = parts[i+1].strip() if i+1 < len(parts) else ""
+
+            if marker == REPO_METRICS_MARKER:
+                try:
+                    repo_metrics = json.loads(content)
+                except Exception as e:
+                    logger.warning(f"Failed to parse repo metrics from context: {e}")
+                    repo_metrics = {}
+            elif marker == PDF_CONTENT_MARKER:
+                pdf_text = content
+
+        return cls.model_construct(description=main_description, repo_metrics=repo_metrics, pdf_text=pdf_text)
+
+    def to_legacy_description(self) -> str:
+        """Renders the combined description format understood by string-based engines."""
+        combined = self.description
+        if self.repo_metrics:
+            combined += f"\n\n--- {REPO_METRICS_MARKER} ---\n{json.dumps(self.repo_metrics, indent=2)}"
+        if self.pdf_text:
+            combined += f"\n\n--- {PDF_CONTENT_MARKER} ---\n\n{self.pdf_text}"
+        return combined
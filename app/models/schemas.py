@@ -5,7 +5,7 @@ Version: 1.1.0 (PROD-LOCKED)
 """
 from pydantic import BaseModel, Field, field_validator
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional
 import re
 
 class TaskBase(BaseModel):
@@ -36,6 +36,9 @@ class Analysis(BaseModel):
 class Meta(BaseModel):
     evaluation_time_ms: int
     mode: str = Field(..., pattern="^(rule|ml|hybrid)$")
+    cached: bool = Field(default=False, description="Served from the review result cache")
+    stage_timings_ms: Optional[Dict[str, float]] = Field(default=None, description="Per-stage wall time, when timing is requested")
+    rules_version: Optional[str] = Field(default=None, description="Version of the scoring rules that produced the score")
 
 class V2NextTask(BaseModel):
     title: str
@@ -1,16 +1,288 @@
-from typing import Dict, Any
+from typing import Dict, Any, Iterable, List, Optional, Tuple
 from collections import OrderedDict
+from datetime import datetime
+import logging
+import os
+import sqlite3
+import sys
+import threading
+import time
 from .schemas import Task
+from ..core.interfaces.task_store_interface import TaskStore
+from ..core.metrics import record_task_store
+
+logger = logging.getLogger("task_review_system.storage")
 
 # Memory Locked Storage: Cap at 1000 tasks to prevent memory pressure during demo
-class LimitedStorage(OrderedDict):
+class LimitedStorage(OrderedDict, TaskStore):
     def __init__(self, limit: int = 1000):
         self.limit = limit
+        self.evictions = 0
         super().__init__()
 
     def __setitem__(self, key: str, value: Any):
-        if len(self) >= self.limit:
+        evicted = 0
+        if key not in self and len(self) >= self.limit:
             self.popitem(last=False)  # Evict oldest entry (FIFO)
+            evicted = 1
         super().__setitem__(key, value)
+        self.evictions += evicted
+        record_task_store(len(self), evicted)
+
+    def clear(self):
+        super().clear()
+        record_task_store(0)
+
+    def put(self, task_id: str, entry: Dict[str, Any]):
+        self[task_id] = entry
+
+    def find_by_submitter(self, submitted_by: str, limit: int = 100) -> List[Dict[str, Any]]:
+        matches = [entry for entry in self.values() if entry["task"].submitted_by == submitted_by]
+        return matches[-limit:][::-1]
+
+    def stats(self) -> Dict[str, Any]:
+        return {"backend": "memory", "entries": len(self), "evictions": self.evictions, "limit": self.limit}
+
+
+class LRUTaskStore(TaskStore):
+    """
+    In-process task store with least-recently-used eviction against a memory budget.
+
+    Every entry is charged the measured size of its Task strings plus a fixed
+    per-entry overhead, so a few large descriptions cannot crowd out the
+    budget unnoticed. Reads refresh recency. Entries older than ttl_seconds
+    (0 = never) expire on access.
+    """
+
+    # Entry dict, Task model instance, datetime and OrderedDict node
+    ENTRY_OVERHEAD_BYTES = 1024
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, max_entries: int = 1000, ttl_seconds: float = 0):
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[Dict[str, Any], int, float]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0, "expired": 0}
+
+    @classmethod
+    def entry_size(cls, entry: Dict[str, Any]) -> int:
+        task = entry["task"]
+        strings = (task.task_id, task.task_title, task.task_description, task.submitted_by, entry.get("demo_type") or "")
+        return cls.ENTRY_OVERHEAD_BYTES + sum(sys.getsizeof(value) for value in strings)
+
+    def get(self, task_id: str, default: Any = None) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            item = self._entries.get(task_id)
+            if item is None:
+                self._stats["misses"] += 1
+                return default
+            entry, size, stored_at = item
+            if self.ttl_seconds and time.monotonic() - stored_at > self.ttl_seconds:
+                self._drop(task_id)
+                self._stats["expired"] += 1
+                self._stats["misses"] += 1
+                record_task_store(len(self._entries))
+                return default
+            self._entries.move_to_end(task_id)
+            self._stats["hits"] += 1
+            return entry
+
+    def put(self, task_id: str, entry: Dict[str, Any]):
+        size = self.entry_size(entry)
+        with self._lock:
+            if task_id in self._entries:
+                self._drop(task_id)
+            self._entries[task_id] = (entry, size, time.monotonic())
+            self._bytes += size
+            # The newest entry always stays, even when it alone exceeds the budget
+            evicted = 0
+            while len(self._entries) > 1 and (
+                self._bytes > self.max_bytes or len(self._entries) > self.max_entries
+            ):
+                evicted_id = next(iter(self._entries))
+                self._drop(evicted_id)
+                evicted += 1
+            self._stats["evictions"] += evicted
+            record_task_store(len(self._entries), evicted)
+
+    def find_by_submitter(self, submitted_by: str, limit: int = 100) -> List[Dict[str, Any]]:
+        with self._lock:
+            matches = [entry for entry, _, _ in self._entries.values() if entry["task"].submitted_by == submitted_by]
+        matches.sort(key=lambda entry: entry["task"].timestamp, reverse=True)
+        return matches[:limit]
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "backend": "lru",
+                **self._stats,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes
+            }
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            record_task_store(0)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _drop(self, task_id: str):
+        # Caller holds the lock
+        _, size, _ = self._entries.pop(task_id)
+        self._bytes -= size
+
+
+class SQLiteTaskStore(TaskStore):
+    """
+    Task store shared by every worker on the host and persisted across restarts.
+
+    WAL mode lets readers proceed while a writer commits; each thread keeps its
+    own connection. Lookups go through the task_id primary key and
+    submitted_by index, so they stay logarithmic at millions of rows. The row
+    count is kept in task_count by triggers, so stats() and len() (read by
+    every /health probe) never scan the table, and every process sees it.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._local = threading.local()
+        conn = self._conn()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS tasks (
+                task_id TEXT PRIMARY KEY,
+                task_title TEXT NOT NULL,
+                task_description TEXT NOT NULL,
+                submitted_by TEXT NOT NULL,
+                timestamp TEXT NOT NULL,
+                is_demo INTEGER NOT NULL DEFAULT 0,
+                demo_type TEXT
+            ) WITHOUT ROWID
+            """
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_tasks_submitted_by ON tasks (submitted_by, timestamp)")
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute("CREATE TABLE IF NOT EXISTS task_count (id INTEGER PRIMARY KEY CHECK (id = 1), entries INTEGER NOT NULL)")
+            # Counts the rows once, when an existing database first gets the counter
+            conn.execute("INSERT OR IGNORE INTO task_count (id, entries) SELECT 1, COUNT(*) FROM tasks")
+            conn.execute(
+                "CREATE TRIGGER IF NOT EXISTS tasks_count_insert AFTER INSERT ON tasks "
+                "BEGIN UPDATE task_count SET entries = entries + 1 WHERE id = 1; END"
+            )
+            conn.execute(
+                "CREATE TRIGGER IF NOT EXISTS tasks_count_delete AFTER DELETE ON tasks "
+                "BEGIN UPDATE task_count SET entries = entries - 1 WHERE id = 1; END"
+            )
+        record_task_store(len(self))
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, isolation_level=None, timeout=10)
+            # WAL makes NORMAL durable against application crashes
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    @staticmethod
+    def _row(task_id: str, entry: Dict[str, Any]) -> tuple:
+        task = entry["task"]
+        return (
+            task_id,
+            task.task_title,
+            task.task_description,
+            task.submitted_by,
+            task.timestamp.isoformat(),
+            int(bool(entry.get("is_demo"))),
+            entry.get("demo_type")
+        )
+
+    @staticmethod
+    def _entry(row: tuple) -> Dict[str, Any]:
+        task = Task.model_construct(
+            task_id=row[0],
+            task_title=row[1],
+            task_description=row[2],
+            submitted_by=row[3],
+            timestamp=datetime.fromisoformat(row[4])
+        )
+        return {"task": task, "is_demo": bool(row[5]), "demo_type": row[6]}
+
+    def get(self, task_id: str, default: Any = None) -> Optional[Dict[str, Any]]:
+        row = self._conn().execute(
+            "SELECT task_id, task_title, task_description, submitted_by, timestamp, is_demo, demo_type "
+            "FROM tasks WHERE task_id = ?",
+            (task_id,)
+        ).fetchone()
+        return self._entry(row) if row else default
+
+    # An upsert rather than INSERT OR REPLACE: REPLACE deletes without firing the count trigger
+    UPSERT_SQL = (
+        "INSERT INTO tasks VALUES (?, ?, ?, ?, ?, ?, ?) ON CONFLICT (task_id) DO UPDATE SET "
+        "task_title = excluded.task_title, task_description = excluded.task_description, "
+        "submitted_by = excluded.submitted_by, timestamp = excluded.timestamp, "
+        "is_demo = excluded.is_demo, demo_type = excluded.demo_type"
+    )
+
+    def put(self, task_id: str, entry: Dict[str, Any]):
+        self._conn().execute(self.UPSERT_SQL, self._row(task_id, entry))
+        record_task_store(len(self))
+
+    def put_many(self, entries: Iterable[Tuple[str, Dict[str, Any]]]):
+        """Writes all entries in one transaction (one WAL commit instead of one per task); all or nothing."""
+        rows = [self._row(task_id, entry) for task_id, entry in entries]
+        if not rows:
+            return
+        conn = self._conn()
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.executemany(self.UPSERT_SQL, rows)
+        record_task_store(len(self))
+
+    def find_by_submitter(self, submitted_by: str, limit: int = 100) -> List[Dict[str, Any]]:
+        rows = self._conn().execute(
+            "SELECT task_id, task_title, task_description, submitted_by, timestamp, is_demo, demo_type "
+            "FROM tasks WHERE submitted_by = ? ORDER BY timestamp DESC LIMIT ?",
+            (submitted_by, limit)
+        ).fetchall()
+        return [self._entry(row) for row in rows]
+
+    def stats(self) -> Dict[str, Any]:
+        # Rows are never evicted; the key keeps stats() uniform across backends
+        return {"backend": "sqlite", "entries": len(self), "evictions": 0, "path": self.path}
+
+    def clear(self):
+        self._conn().execute("DELETE FROM tasks")
+        record_task_store(0)
+
+    def __len__(self) -> int:
+        return self._conn().execute("SELECT entries FROM task_count WHERE id = 1").fetchone()[0]
+
+
+def create_task_store() -> TaskStore:
+    """Builds the backend selected by TASK_STORE_BACKEND (lru | memory | sqlite)."""
+    backend = os.getenv("TASK_STORE_BACKEND", "lru").lower()
+    max_entries = int(os.getenv("TASK_STORE_MAX_ENTRIES", "1000"))
+    if backend == "sqlite":
+        path = os.getenv("TASK_STORE_PATH", "task_store.sqlite3")
+        logger.info(f"Using SQLite task store at {path}")
+        return SQLiteTaskStore(path)
+    if backend == "memory":
+        return LimitedStorage(limit=max_entries)
+    if backend != "lru":
+        logger.warning(f"Unknown TASK_STORE_BACKEND '{backend}'; using the LRU store")
+    return LRUTaskStore(
+        max_bytes=int(os.getenv("TASK_STORE_MAX_BYTES", str(64 * 1024 * 1024))),
+        max_entries=max_entries,
+        ttl_seconds=float(os.getenv("TASK_STORE_TTL_SECONDS", "0"))
+    )
 
-task_storage = LimitedStorage(limit=1000)
+task_storage = create_task_store()
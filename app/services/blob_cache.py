@@ -0,0 +1,182 @@
+import logging
+import os
+import tempfile
+import threading
+import zlib
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger("task_review_system.blob_cache")
+
+
+class TieredBlobCache:
+    """
+    Content-addressed bytes cache.
+
+    Tier 1 is an in-process LRU bounded by the total size of the stored values.
+    Tier 2 (optional) is a directory of zlib-compressed blobs, written atomically,
+    so entries survive restarts and are shared between uvicorn workers on the
+    same host. Keys must be filesystem-safe (hex digests).
+
+    The disk tier's size is scanned once and then tracked as blobs are written,
+    so a put does not walk the directory. Only when the tracked size exceeds
+    max_disk_bytes is the directory rescanned (which also picks up blobs from
+    other workers) and pruned, down to PRUNE_TARGET_RATIO of the limit so the
+    next scans are spread out.
+    """
+
+    PRUNE_TARGET_RATIO = 0.9
+
+    def __init__(
+        self,
+        name: str,
+        max_memory_bytes: int,
+        disk_dir: Optional[str] = None,
+        max_disk_bytes: int = 0,
+        compress: bool = True
+    ):
+        self.name = name
+        self.max_memory_bytes = max_memory_bytes
+        self.disk_dir = disk_dir
+        self.max_disk_bytes = max_disk_bytes
+        self.compress = compress
+        self._entries: "OrderedDict[str, bytes]" = OrderedDict()
+        self._memory_bytes = 0
+        self._lock = threading.Lock()
+        self._stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "evictions": 0}
+        self._disk_bytes: Optional[int] = None  # None until the first scan
+        self._prune_lock = threading.Lock()
+
+        if disk_dir:
+            os.makedirs(disk_dir, exist_ok=True)
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+                self._stats["memory_hits"] += 1
+                return value
+
+        value = self._read_disk(key)
+        with self._lock:
+            if value is None:
+                self._stats["misses"] += 1
+                return None
+            self._stats["disk_hits"] += 1
+            self._remember(key, value)
+        return value
+
+    def put(self, key: str, value: bytes):
+        with self._lock:
+            self._remember(key, value)
+        self._write_disk(key, value)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                **self._stats,
+                "entries": len(self._entries),
+                "memory_bytes": self._memory_bytes
+            }
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._memory_bytes = 0
+
+    def _remember(self, key: str, value: bytes):
+        # Caller holds the lock
+        if len(value) > self.max_memory_bytes:
+            return
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._memory_bytes -= len(previous)
+        self._entries[key] = value
+        self._memory_bytes += len(value)
+        while self._memory_bytes > self.max_memory_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._memory_bytes -= len(evicted)
+            self._stats["evictions"] += 1
+
+    def _blob_path(self, key: str) -> str:
+        return os.path.join(self.disk_dir, key[:2], f"{key}.blob")
+
+    def _read_disk(self, key: str) -> Optional[bytes]:
+        if not self.disk_dir:
+            return None
+        path = self._blob_path(key)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+            # Refresh mtime so pruning keeps recently used blobs
+            os.utime(path)
+            return zlib.decompress(data) if self.compress else data
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"[{self.name}] Discarding unreadable cache blob {key}: {e}")
+            return None
+
+    def _write_disk(self, key: str, value: bytes):
+        if not self.disk_dir:
+            return
+        path = self._blob_path(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            try:
+                replaced = os.stat(path).st_size
+            except FileNotFoundError:
+                replaced = 0
+            data = zlib.compress(value) if self.compress else value
+            # Write-then-rename so concurrent workers never observe partial blobs
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning(f"[{self.name}] Could not persist cache blob {key}: {e}")
+            return
+        if not self.max_disk_bytes:
+            return
+        with self._lock:
+            if self._disk_bytes is not None:
+                self._disk_bytes += len(data) - replaced
+            needs_scan = self._disk_bytes is None or self._disk_bytes > self.max_disk_bytes
+        if needs_scan:
+            self._prune_disk()
+
+    def _prune_disk(self):
+        """Rescans the directory and deletes least recently used blobs until it fits the prune target."""
+        if not self._prune_lock.acquire(blocking=False):
+            # Another thread is already pruning
+            return
+        try:
+            blobs = []
+            total = 0
+            for root, _, files in os.walk(self.disk_dir):
+                for filename in files:
+                    if not filename.endswith(".blob"):
+                        continue
+                    path = os.path.join(root, filename)
+                    try:
+                        stat = os.stat(path)
+                    except FileNotFoundError:
+                        continue
+                    blobs.append((stat.st_mtime, stat.st_size, path))
+                    total += stat.st_size
+
+            if total > self.max_disk_bytes:
+                target = int(self.max_disk_bytes * self.PRUNE_TARGET_RATIO)
+                for _, size, path in sorted(blobs):
+                    try:
+                        os.remove(path)
+                    except FileNotFoundError:
+                        pass
+                    total -= size
+                    if total <= target:
+                        break
+            with self._lock:
+                self._disk_bytes = total
+        finally:
+            self._prune_lock.release()
@@ -0,0 +1,270 @@
+import asyncio
+import logging
+import os
+import tempfile
+import threading
+from concurrent.futures import BrokenExecutor, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+from fastapi import UploadFile, HTTPException
+from .pdf_processor import PDFProcessor, count_pages_job, extract_page_range_job, scoring_prefix_job
+from .scoring_rules import scoring_rules
+from .upload_spool import upload_spooler
+from ..core.metrics import record_pdf
+
+if TYPE_CHECKING:
+    from concurrent.futures import ProcessPoolExecutor
+
+logger = logging.getLogger("task_review_system.pdf_executor")
+
+
+class PDFExtractionExecutor:
+    """
+    Runs pdfplumber extraction off the event loop in a bounded process pool.
+
+    - pool_size workers (0 = run in a thread, for hosts without multiprocessing)
+    - at most pool_size + max_pending jobs admitted; further uploads get a 503
+    - per-job timeout (504); a timed-out job keeps its slot until the worker finishes
+    - each worker is recycled after max_jobs_per_worker jobs to contain pdfminer growth
+    - documents above parallel_page_threshold pages are split into page ranges
+      extracted by several workers from one memory-mapped temp file
+    - with early_exit, pages are read only until the PDF score saturates; the
+      returned prefix scores exactly like the full text
+    """
+
+    def __init__(
+        self,
+        pool_size: int = 2,
+        max_pending: int = 8,
+        job_timeout: float = 30.0,
+        max_jobs_per_worker: int = 50,
+        parallel_page_threshold: int = 50,
+        min_pages_per_shard: int = 10,
+        early_exit: bool = True
+    ):
+        self.pool_size = pool_size
+        self.max_pending = max_pending
+        self.job_timeout = job_timeout
+        self.max_jobs_per_worker = max_jobs_per_worker
+        self.parallel_page_threshold = parallel_page_threshold
+        self.min_pages_per_shard = max(min_pages_per_shard, 1)
+        self.early_exit = early_exit
+        self._pool: Optional["ProcessPoolExecutor"] = None
+        self._threads: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._stats = {"completed": 0, "rejected": 0, "timed_out": 0}
+
+    @classmethod
+    def from_env(cls) -> "PDFExtractionExecutor":
+        # Serverless runtimes (Vercel) lack the shared memory multiprocessing needs
+        default_pool = "0" if os.getenv("VERCEL") else str(min(2, os.cpu_count() or 1))
+        return cls(
+            pool_size=int(os.getenv("PDF_POOL_SIZE", default_pool)),
+            max_pending=int(os.getenv("PDF_POOL_MAX_PENDING", "8")),
+            job_timeout=float(os.getenv("PDF_JOB_TIMEOUT_SECONDS", "30")),
+            max_jobs_per_worker=int(os.getenv("PDF_POOL_MAX_JOBS_PER_WORKER", "50")),
+            parallel_page_threshold=int(os.getenv("PDF_PARALLEL_PAGE_THRESHOLD", "50")),
+            min_pages_per_shard=int(os.getenv("PDF_PARALLEL_MIN_PAGES_PER_SHARD", "10")),
+            early_exit=os.getenv("PDF_EARLY_EXIT", "true").lower() == "true"
+        )
+
+    @property
+    def capacity(self) -> int:
+        return max(self.pool_size, 1) + self.max_pending
+
+    @property
+    def parallel_enabled(self) -> bool:
+        return self.pool_size > 1 and self.parallel_page_threshold > 0
+
+    def _get_pool(self) -> "ProcessPoolExecutor":
+        # multiprocessing is only imported once a worker pool is actually needed
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        with self._lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.pool_size,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    max_tasks_per_child=self.max_jobs_per_worker or None
+                )
+            return self._pool
+
+    def _get_threads(self) -> ThreadPoolExecutor:
+        # A pool of our own, so the job future is a concurrent one that
+        # completes when the thread finishes, even after wait_for gives up
+        with self._lock:
+            if self._threads is None:
+                self._threads = ThreadPoolExecutor(max_workers=self.capacity, thread_name_prefix="pdf-extract")
+            return self._threads
+
+    def _reset_pool(self):
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def _admit(self):
+        with self._lock:
+            if self._in_flight >= self.capacity:
+                self._stats["rejected"] += 1
+                raise HTTPException(status_code=503, detail="PDF extraction queue is full. Please retry shortly.")
+            self._in_flight += 1
+
+    def _release(self, _future=None):
+        with self._lock:
+            self._in_flight -= 1
+            self._stats["completed"] += 1
+
+    async def run(self, job: Callable, *args) -> Any:
+        """Admits and runs one extraction job, enforcing the queue bound and timeout."""
+        self._admit()
+        try:
+            if self.pool_size > 0:
+                future = self._get_pool().submit(job, *args)
+            else:
+                future = self._get_threads().submit(job, *args)
+        except BrokenExecutor:
+            # The pool broke between jobs; without a reset every later submit fails too
+            self._release()
+            raise self._pool_crashed()
+        except BaseException:
+            self._release()
+            raise
+        # The slot is released when the job really finishes, not when we stop waiting
+        future.add_done_callback(self._release)
+
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout=self.job_timeout)
+        except asyncio.TimeoutError:
+            with self._lock:
+                self._stats["timed_out"] += 1
+            logger.error(f"PDF extraction exceeded {self.job_timeout}s")
+            raise HTTPException(status_code=504, detail="PDF extraction timed out.")
+        except BrokenExecutor:
+            raise self._pool_crashed()
+
+    def _pool_crashed(self) -> HTTPException:
+        # BrokenProcessPool; caught via its base class so multiprocessing stays unimported
+        logger.error("PDF worker pool crashed; recycling it")
+        self._reset_pool()
+        return HTTPException(status_code=503, detail="PDF extraction workers restarted. Please retry.")
+
+    async def extract(self, file: UploadFile) -> str:
+        """Async equivalent of PDFProcessor.extract_text, streaming the upload to disk first."""
+        try:
+            async with upload_spooler.spool(file) as spooled:
+                cache_key = self.cache_key(spooled.digest)
+                cached = PDFProcessor.lookup_cached(cache_key, file.filename)
+                if cached is not None:
+                    return cached
+
+                record_pdf(size_bytes=spooled.size)
+                combined_text = await self.extract_path(spooled.path)
+                return PDFProcessor.accept_text(combined_text, cache_key, file.filename)
+
+        except HTTPException:
+            raise
+        except Exception as e:
+            raise PDFProcessor.corrupted(file.filename, e)
+
+    async def extract_bytes(self, content: bytes, filename: str = "batch.pdf") -> str:
+        """extract() for PDF bytes that are already in memory (batch reviews)."""
+        try:
+            cache_key = self.cache_key(PDFProcessor.content_digest(content))
+            cached = PDFProcessor.lookup_cached(cache_key, filename)
+            if cached is not None:
+                return cached
+
+            record_pdf(size_bytes=len(content))
+            combined_text = await self.extract_content(content)
+            return PDFProcessor.accept_text(combined_text, cache_key, filename)
+
+        except HTTPException:
+            raise
+        except Exception as e:
+            raise PDFProcessor.corrupted(filename, e)
+
+    def cache_key(self, digest: str) -> str:
+        # Early-exit output is a scoring prefix, never served as the full text,
+        # and is only reusable while the rules saturate at the same point
+        if not self.early_exit:
+            return digest
+        words, needs_headings = scoring_rules.current().pdf_saturation
+        return f"{digest}-scoring-{words}-{int(needs_headings)}"
+
+    async def extract_content(self, content: bytes) -> str:
+        """Extracts text from in-memory PDF bytes via a temp file."""
+        fd, path = tempfile.mkstemp(suffix=".pdf")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(content)
+            return await self.extract_path(path)
+        finally:
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+
+    async def extract_path(self, path: str) -> str:
+        """Extracts text from a PDF on disk; workers memory-map the file instead of receiving its bytes."""
+        if not self.parallel_enabled:
+            if self.early_exit:
+                page_texts, pages_read, _, _ = await self.run(
+                    scoring_prefix_job, path, None, scoring_rules.current().pdf_saturation
+                )
+                record_pdf(pages=pages_read)
+                return PDFProcessor._combine(page_texts)
+            page_texts = await self.run(extract_page_range_job, path, 0, None)
+            # Page count is not known on this path; pages without a text layer are not counted
+            record_pdf(pages=len(page_texts))
+            return PDFProcessor._combine(page_texts)
+
+        if self.early_exit:
+            # Read up to the parallel threshold serially; most documents saturate within it
+            page_texts, pages_read, page_count, saturated = await self.run(
+                scoring_prefix_job, path, self.parallel_page_threshold, scoring_rules.current().pdf_saturation
+            )
+            if saturated or pages_read >= page_count:
+                record_pdf(pages=pages_read)
+                return PDFProcessor._combine(page_texts)
+            logger.info(f"PDF score not saturated after {pages_read} pages; extracting remaining {page_count - pages_read}")
+            record_pdf(pages=page_count)
+            return PDFProcessor._combine(page_texts + await self.extract_range(path, pages_read, page_count))
+
+        page_count = await self.run(count_pages_job, path)
+        record_pdf(pages=page_count)
+        if page_count <= self.parallel_page_threshold:
+            return PDFProcessor._combine(await self.run(extract_page_range_job, path, 0, page_count))
+        return PDFProcessor._combine(await self.extract_range(path, 0, page_count))
+
+    async def extract_range(self, path: str, start: int, stop: int) -> List[str]:
+        shards = self.shard_pages(start, stop)
+        logger.info(f"Extracting pages {start}-{stop} in {len(shards)} parallel shards")
+        results = await asyncio.gather(
+            *(self.run(extract_page_range_job, path, shard_start, shard_stop) for shard_start, shard_stop in shards)
+        )
+        # Reassemble in page order so output matches the serial path byte for byte
+        return [text for shard in results for text in shard]
+
+    def shard_pages(self, start: int, stop: int) -> List[Tuple[int, int]]:
+        page_count = stop - start
+        shard_count = max(1, min(self.pool_size, page_count // self.min_pages_per_shard))
+        size = -(-page_count // shard_count)
+        return [(first, min(first + size, stop)) for first in range(start, stop, size)]
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {**self._stats, "in_flight": self._in_flight, "capacity": self.capacity}
+
+    def shutdown(self):
+        with self._lock:
+            pool, self._pool = self._pool, None
+            threads, self._threads = self._threads, None
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
+        if threads is not None:
+            threads.shutdown(wait=True, cancel_futures=True)
+
+
+pdf_executor = PDFExtractionExecutor.from_env()
@@ -1,16 +1,106 @@
-import pdfplumber
+import hashlib
 import logging
+import os
 from fastapi import UploadFile, HTTPException
 import io
+import mmap
+from contextlib import contextmanager
+from typing import Iterator, List, Optional, Tuple, Union
+from .blob_cache import TieredBlobCache
+from .review_engine import StreamingPDFScorer
 
 logger = logging.getLogger("task_review_system.pdf_processor")
 
+# pdfplumber (and pdfminer under it) is imported by the functions that parse
+# PDFs, so importing this module (and app.main) stays cheap.
+
+# Extracted text keyed by SHA-256 of the uploaded bytes
+pdf_text_cache = TieredBlobCache(
+    name="pdf_text",
+    max_memory_bytes=int(os.getenv("PDF_CACHE_MAX_BYTES", str(64 * 1024 * 1024))),
+    disk_dir=os.getenv("PDF_CACHE_DIR") or None,
+    max_disk_bytes=int(os.getenv("PDF_CACHE_MAX_DISK_BYTES", str(512 * 1024 * 1024)))
+)
+
 class PDFProcessor:
     """
     Deterministic PDF processing service.
     Extracts text from PDF files using pdfplumber without OCR.
     """
 
+    @staticmethod
+    def content_digest(content: bytes) -> str:
+        return hashlib.sha256(content).hexdigest()
+
+    @staticmethod
+    def _page_text(page) -> Optional[str]:
+        """Stripped page text, or None when the page has no text layer."""
+        text = page.extract_text()
+        return text.strip() if text else None
+
+    @staticmethod
+    def _combine(page_texts: List[str]) -> str:
+        return "\n".join(page_texts).strip()
+
+    @staticmethod
+    def _extract_pages(source) -> str:
+        """Runs pdfplumber layout analysis over every page. Returns '' if no text is found."""
+        import pdfplumber
+
+        with pdfplumber.open(source) as pdf:
+            full_text = []
+            for i, page in enumerate(pdf.pages):
+                text = PDFProcessor._page_text(page)
+                if text is not None:
+                    full_text.append(text)
+                else:
+                    logger.debug(f"No text found on page {i+1}")
+
+            return PDFProcessor._combine(full_text)
+
+    @staticmethod
+    def read_upload(file: UploadFile) -> bytes:
+        """Reads the uploaded bytes, rejecting empty files."""
+        # Read file content into memory
+        content = file.file.read()
+        if not content:
+            logger.error("Empty PDF file uploaded")
+            raise HTTPException(status_code=400, detail="The uploaded PDF file is empty.")
+
+        # Reset file pointer for potential subsequent reads
+        file.file.seek(0)
+        return content
+
+    @staticmethod
+    def lookup_cached(cache_key: str, filename: str) -> Optional[str]:
+        cached = pdf_text_cache.get(cache_key)
+        if cached is None:
+            return None
+        logger.info(f"PDF cache hit for {filename} ({cache_key[:12]})")
+        return cached.decode("utf-8")
+
+    @staticmethod
+    def accept_text(combined_text: str, cache_key: str, filename: str) -> str:
+        """Rejects empty extractions and caches successful ones."""
+        if not combined_text:
+            logger.warning(f"No text extracted from PDF: {filename}")
+            raise HTTPException(
+                status_code=400, 
+                detail="Could not extract any text from the PDF. It might be an image-only PDF (OCR not supported) or contain only non-extractable elements."
+            )
+
+        pdf_text_cache.put(cache_key, combined_text.encode("utf-8"))
+        logger.info(f"Successfully extracted {len(combined_text)} characters from {filename}")
+        return combined_text
+
+    @staticmethod
+    def corrupted(filename: str, error: Exception) -> HTTPException:
+        logger.error(f"Failed to process PDF {filename}: {str(error)}")
+        return HTTPException(
+            status_code=400, 
+            detail=f"The PDF file appears to be corrupted or invalid: {str(error)}"
+        )
+
     @staticmethod
     def extract_text(file: UploadFile) -> str:
         """
@@ -23,44 +113,110 @@ class PDFProcessor:
         - Fully deterministic
         """
         try:
-            # Read file content into memory
-            content = file.file.read()
-            if not content:
-                logger.error("Empty PDF file uploaded")
-                raise HTTPException(status_code=400, detail="The uploaded PDF file is empty.")
-
-            # Reset file pointer for potential subsequent reads
-            file.file.seek(0)
-
-            with pdfplumber.open(io.BytesIO(content)) as pdf:
-                full_text = []
-                for i, page in enumerate(pdf.pages):
-                    text = page.extract_text()
-                    if text:
-                        full_text.append(text.strip())
-                    else:
-                        logger.debug(f"No text found on page {i+1}")
-
-                combined_text = "\n".join(full_text).strip()
-
-                if not combined_text:
-                    logger.warning(f"No text extracted from PDF: {file.filename}")
-                    raise HTTPException(
-                        status_code=400, 
-                        detail="Could not extract any text from the PDF. It might be an image-only PDF (OCR not supported) or contain only non-extractable elements."
-                    )
-
-                logger.info(f"Successfully extracted {len(combined_text)} characters from {file.filename}")
-                return combined_text
+            content = PDFProcessor.read_upload(file)
+            digest = PDFProcessor.content_digest(content)
+            cached = PDFProcessor.lookup_cached(digest, file.filename)
+            if cached is not None:
+                return cached
+
+            combined_text = PDFProcessor._extract_pages(io.BytesIO(content))
+            return PDFProcessor.accept_text(combined_text, digest, file.filename)
 
         except HTTPException:
             raise
         except Exception as e:
-            logger.error(f"Failed to process PDF {file.filename}: {str(e)}")
-            raise HTTPException(
-                status_code=400, 
-                detail=f"The PDF file appears to be corrupted or invalid: {str(e)}"
-            )
+            raise PDFProcessor.corrupted(file.filename, e)
+
+
+def extract_pages_job(content: bytes) -> str:
+    """
+    Process-pool entry point: only bytes go in and text comes out.
+    Errors are re-raised as RuntimeError so they always pickle back to the parent.
+    """
+    try:
+        return PDFProcessor._extract_pages(io.BytesIO(content))
+    except Exception as e:
+        raise RuntimeError(str(e)) from None
+
+
+@contextmanager
+def _open_source(source: Union[bytes, str]):
+    """
+    Opens PDF bytes in memory, or a spooled file path read-only via mmap so
+    workers share the page cache instead of receiving pickled copies.
+    """
+    import pdfplumber
+
+    if isinstance(source, (bytes, bytearray)):
+        with pdfplumber.open(io.BytesIO(source)) as pdf:
+            yield pdf
+        return
+    with open(source, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as shared:
+        with pdfplumber.open(shared) as pdf:
+            yield pdf
+
+
+def iter_page_text(pdf, start: int = 0, stop: Optional[int] = None) -> Iterator[str]:
+    """Yields stripped page texts in order, skipping pages without a text layer."""
+    for page in pdf.pages[start:stop]:
+        text = PDFProcessor._page_text(page)
+        # Release the page's layout objects before moving on
+        page.close()
+        if text is not None:
+            yield text
+
+
+def count_pages_job(source: Union[bytes, str]) -> int:
+    try:
+        with _open_source(source) as pdf:
+            return len(pdf.pages)
+    except Exception as e:
+        raise RuntimeError(str(e)) from None
+
+
+def extract_page_range_job(source: Union[bytes, str], start: int, stop: int) -> List[str]:
+    """Extracts pages [start, stop); returns the stripped page texts in order."""
+    try:
+        with _open_source(source) as pdf:
+            return list(iter_page_text(pdf, start, stop))
+    except Exception as e:
+        raise RuntimeError(str(e)) from None
+
+
+def scoring_prefix_job(
+    source: Union[bytes, str],
+    limit: Optional[int] = None,
+    saturation: Optional[Tuple[Optional[int], bool]] = None
+) -> Tuple[List[str], int, int, bool]:
+    """
+    Early-exit extraction for scoring: walks pages until the streaming PDF score
+    saturates or `limit` pages have been read. `saturation` is the caller's
+    ScoringPlan.pdf_saturation; by default the rules loaded in this process apply.
+    Returns (page_texts, pages_read, page_count, saturated).
+    """
+    try:
+        with _open_source(source) as pdf:
+            page_count = len(pdf.pages)
+            scorer = StreamingPDFScorer(saturation=saturation)
+            page_texts = []
+            pages_read = 0
+            for page in pdf.pages[:limit]:
+                pages_read += 1
+                text = PDFProcessor._page_text(page)
+                page.close()
+                if text is None:
+                    continue
+                page_texts.append(text)
+                if scorer.feed(text):
+                    break
+            return page_texts, pages_read, page_count, scorer.saturated
+    except Exception as e:
+        raise RuntimeError(str(e)) from None
+
+def preload_job() -> bool:
+    """Imports the PDF stack (pdfplumber, pdfminer) so the first real extraction does not pay for it."""
+    import pdfplumber  # noqa: F401
+    return True
 
 # Example usage block for local testing
 if __name__ == "__main__":
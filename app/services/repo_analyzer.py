@@ -1,12 +1,21 @@
-import requests
+import asyncio
 import re
 import logging
 import os
-from typing import Dict, Any, Optional
+from typing import TYPE_CHECKING, Dict, Any, Optional, List, Set
 from fastapi import HTTPException
+from .repo_metrics_cache import repo_metrics_cache
+from ..core.timing import stage
+from ..core.metrics import record_github_response
+
+if TYPE_CHECKING:
+    import httpx
 
 logger = logging.getLogger("task_review_system.repo_analyzer")
 
+# requests and httpx are imported on first GitHub call, not at startup: cold
+# starts (e.g. serverless /health) never pay for them.
+
 class RepoAnalyzer:
     """
     Deterministic GitHub repository analyzer using REST API.
@@ -28,24 +37,112 @@ class RepoAnalyzer:
             repo = repo[:-4]
         return owner, repo
 
+    @staticmethod
+    def _build_headers() -> Dict[str, str]:
+        """Standard GitHub REST headers, authenticated when GITHUB_TOKEN is set."""
+        headers = {
+            "Accept": "application/vnd.github.v3+json",
+            "User-Agent": "Task-Review-Agent"
+        }
+
+        # Use GITHUB_TOKEN if available to avoid rate limits
+        token = os.getenv("GITHUB_TOKEN")
+        if token and token != "your_github_token_here":
+            headers["Authorization"] = f"token {token}"
+        return headers
+
+    @staticmethod
+    def _check_repo_status(status_code: int):
+        """Maps metadata endpoint failures to API errors."""
+        if status_code == 404:
+            raise HTTPException(status_code=404, detail="Repository not found or is private.")
+        elif status_code == 403:
+            raise HTTPException(status_code=429, detail="GitHub API rate limit exceeded. Please try again later.")
+
+    @staticmethod
+    def _parse_commit_count(response) -> int:
+        """Heuristic to get total commit count using Link header."""
+        if response.status_code != 200:
+            return 0
+
+        if "Link" in response.headers:
+            # Format: <...page=123>; rel="last"
+            links = response.headers["Link"]
+            match = re.search(r'page=(\d+)>; rel="last"', links)
+            if match:
+                return int(match.group(1))
+
+        # If no link header, there's likely only 1 page
+        return len(response.json())
+
+    @staticmethod
+    def _summarize_tree(tree_data: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Derives file count, README and tests presence from a recursive tree listing."""
+        has_readme = False
+        has_tests = False
+        file_count = 0
+
+        for item in tree_data:
+            path = item.get("path", "").lower()
+            if item.get("type") == "blob":
+                file_count += 1
+                if "readme" in path:
+                    has_readme = True
+
+            if item.get("type") == "tree":
+                if any(t in path for t in ["test", "tests", "spec", "specs"]):
+                    has_tests = True
+
+        return {"has_readme": has_readme, "has_tests": has_tests, "file_count": file_count}
+
+    @staticmethod
+    def _build_metrics(repo_data: Dict[str, Any], languages: Dict[str, Any], commit_count: int, tree_summary: Dict[str, Any]) -> Dict[str, Any]:
+        metrics = {
+            "repo_name": repo_data.get("full_name"),
+            "default_branch": repo_data.get("default_branch", "main"),
+            "commit_count": commit_count,
+            "has_readme": tree_summary["has_readme"],
+            "has_tests": tree_summary["has_tests"],
+            "file_count": tree_summary["file_count"],
+            "languages": list(languages.keys()),
+            "stars": repo_data.get("stargazers_count", 0),
+            "forks": repo_data.get("forks_count", 0),
+            "is_private": repo_data.get("private", False),
+            "last_updated": repo_data.get("updated_at")
+        }
+
+        logger.info(f"Analyzed repository: {metrics['repo_name']} with {metrics['file_count']} files.")
+        return metrics
+
+    @staticmethod
+    def _fetch(path: str, headers: Dict, repo_key: str, endpoint: str):
+        """GET through the conditional-request cache."""
+        import requests
+
+        with stage(RepoAnalyzer._stage_name(endpoint)):
+            entry = repo_metrics_cache.lookup(repo_key, endpoint)
+            if repo_metrics_cache.is_fresh(entry):
+                return repo_metrics_cache.serve(entry)
+            response = requests.get(
+                f"{RepoAnalyzer.BASE_URL}{path}",
+                headers={**headers, **repo_metrics_cache.conditional_headers(entry)},
+                timeout=10
+            )
+            record_github_response(endpoint, response)
+            return repo_metrics_cache.resolve(repo_key, endpoint, entry, response)
+
+    @staticmethod
+    def _stage_name(endpoint: str) -> str:
+        # "tree:main" -> "github_tree"
+        return "github_" + endpoint.split(":", 1)[0]
+
     @staticmethod
     def _get_commit_count(owner: str, repo: str, headers: Dict) -> int:
         """Heuristic to get total commit count using Link header."""
-        url = f"{RepoAnalyzer.BASE_URL}/repos/{owner}/{repo}/commits?per_page=1"
+        repo_key = repo_metrics_cache.repo_key(owner, repo)
         try:
-            response = requests.get(url, headers=headers, timeout=10)
-            if response.status_code != 200:
-                return 0
-            
-            if "Link" in response.headers:
-                # Format: <...page=123>; rel="last"
-                links = response.headers["Link"]
-                match = re.search(r'page=(\d+)>; rel="last"', links)
-                if match:
-                    return int(match.group(1))
-            
-            # If no link header, there's likely only 1 page
-            return len(response.json())
+            response = RepoAnalyzer._fetch(f"/repos/{owner}/{repo}/commits?per_page=1", headers, repo_key, "commits")
+            return RepoAnalyzer._parse_commit_count(response)
         except Exception as e:
             logger.warning(f"Could not fetch commit count: {e}")
             return 0
@@ -56,75 +153,35 @@ class RepoAnalyzer:
         Main analysis entry point.
         Returns structured metrics for the repository.
         """
+        import requests
+
         try:
             owner, repo = RepoAnalyzer._parse_url(url)
-            headers = {
-                "Accept": "application/vnd.github.v3+json",
-                "User-Agent": "Task-Review-Agent"
-            }
-            
-            # Use GITHUB_TOKEN if available to avoid rate limits
-            token = os.getenv("GITHUB_TOKEN")
-            if token and token != "your_github_token_here":
-                headers["Authorization"] = f"token {token}"
+            headers = RepoAnalyzer._build_headers()
+            repo_key = repo_metrics_cache.repo_key(owner, repo)
 
             # 1. Fetch Basic Metadata
-            repo_res = requests.get(f"{RepoAnalyzer.BASE_URL}/repos/{owner}/{repo}", headers=headers, timeout=10)
-            
-            if repo_res.status_code == 404:
-                raise HTTPException(status_code=404, detail="Repository not found or is private.")
-            elif repo_res.status_code == 403:
-                raise HTTPException(status_code=429, detail="GitHub API rate limit exceeded. Please try again later.")
-            
+            repo_res = RepoAnalyzer._fetch(f"/repos/{owner}/{repo}", headers, repo_key, "metadata")
+            RepoAnalyzer._check_repo_status(repo_res.status_code)
+
             repo_res.raise_for_status()
             repo_data = repo_res.json()
 
             default_branch = repo_data.get("default_branch", "main")
             
             # 2. Fetch Languages
-            lang_res = requests.get(f"{RepoAnalyzer.BASE_URL}/repos/{owner}/{repo}/languages", headers=headers, timeout=10)
+            lang_res = RepoAnalyzer._fetch(f"/repos/{owner}/{repo}/languages", headers, repo_key, "languages")
             languages = lang_res.json() if lang_res.status_code == 200 else {}
 
             # 3. Fetch Commit Count
             commit_count = RepoAnalyzer._get_commit_count(owner, repo, headers)
 
             # 4. Fetch Tree for Files/Structure Analysis
-            tree_url = f"{RepoAnalyzer.BASE_URL}/repos/{owner}/{repo}/git/trees/{default_branch}?recursive=1"
-            tree_res = requests.get(tree_url, headers=headers, timeout=10)
-            
-            has_readme = False
-            has_tests = False
-            file_count = 0
-            
-            if tree_res.status_code == 200:
-                tree_data = tree_res.json().get("tree", [])
-                for item in tree_data:
-                    path = item.get("path", "").lower()
-                    if item.get("type") == "blob":
-                        file_count += 1
-                        if "readme" in path:
-                            has_readme = True
-                    
-                    if item.get("type") == "tree":
-                        if any(t in path for t in ["test", "tests", "spec", "specs"]):
-                            has_tests = True
-
-            metrics = {
-                "repo_name": repo_data.get("full_name"),
-                "default_branch": default_branch,
-                "commit_count": commit_count,
-                "has_readme": has_readme,
-                "has_tests": has_tests,
-                "file_count": file_count,
-                "languages": list(languages.keys()),
-                "stars": repo_data.get("stargazers_count", 0),
-                "forks": repo_data.get("forks_count", 0),
-                "is_private": repo_data.get("private", False),
-                "last_updated": repo_data.get("updated_at")
-            }
-
-            logger.info(f"Analyzed repository: {metrics['repo_name']} with {file_count} files.")
-            return metrics
+            tree_path = f"/repos/{owner}/{repo}/git/trees/{default_branch}?recursive=1"
+            tree_res = RepoAnalyzer._fetch(tree_path, headers, repo_key, f"tree:{default_branch}")
+            tree_data = tree_res.json().get("tree", []) if tree_res.status_code == 200 else []
+
+            return RepoAnalyzer._build_metrics(repo_data, languages, commit_count, RepoAnalyzer._summarize_tree(tree_data))
 
         except HTTPException:
             raise
@@ -137,6 +194,135 @@ class RepoAnalyzer:
             logger.error(f"Unexpected error analyzing repo: {str(e)}")
             raise HTTPException(status_code=500, detail=f"Internal analysis failure: {str(e)}")
 
+
+class AsyncRepoAnalyzer:
+    """
+    Non-blocking counterpart of RepoAnalyzer.
+    Shares one keep-alive httpx.AsyncClient pool per event loop and fetches
+    languages, commit count and tree concurrently once the default branch is known.
+    """
+
+    TIMEOUT_SECONDS = float(os.getenv("GITHUB_TIMEOUT_SECONDS", "10"))
+    MAX_CONNECTIONS = int(os.getenv("GITHUB_MAX_CONNECTIONS", "20"))
+    MAX_KEEPALIVE = int(os.getenv("GITHUB_MAX_KEEPALIVE", "10"))
+
+    _client: Optional["httpx.AsyncClient"] = None
+    _client_loop: Optional[asyncio.AbstractEventLoop] = None
+    _closing: Set["asyncio.Task"] = set()
+
+    @classmethod
+    def get_client(cls) -> "httpx.AsyncClient":
+        """Returns the shared client, rebuilding it if the running loop changed."""
+        import httpx
+
+        loop = asyncio.get_running_loop()
+        if cls._client is None or cls._client.is_closed or cls._client_loop is not loop:
+            if cls._client is not None and not cls._client.is_closed:
+                cls._retire(cls._client, cls._client_loop)
+            cls._client = httpx.AsyncClient(
+                base_url=RepoAnalyzer.BASE_URL,
+                timeout=cls.TIMEOUT_SECONDS,
+                limits=httpx.Limits(
+                    max_connections=cls.MAX_CONNECTIONS,
+                    max_keepalive_connections=cls.MAX_KEEPALIVE
+                )
+            )
+            cls._client_loop = loop
+        return cls._client
+
+    @classmethod
+    def _retire(cls, client: "httpx.AsyncClient", loop: Optional[asyncio.AbstractEventLoop]):
+        """Closes a client left behind by a previous loop instead of leaking its pool."""
+        if loop is not None and loop.is_running() and not loop.is_closed():
+            asyncio.run_coroutine_threadsafe(cls._close_quietly(client), loop)
+            return
+        task = asyncio.get_running_loop().create_task(cls._close_quietly(client))
+        cls._closing.add(task)
+        task.add_done_callback(cls._closing.discard)
+
+    @staticmethod
+    async def _close_quietly(client: "httpx.AsyncClient"):
+        try:
+            await client.aclose()
+        except Exception as e:
+            # Sockets bound to a closed loop cannot be shut down cleanly; the
+            # client is still marked closed and its pool released.
+            logger.debug(f"Closing stale GitHub client failed: {e}")
+
+    @classmethod
+    async def aclose(cls):
+        """Closes the shared pool (called on application shutdown)."""
+        if cls._client is not None and not cls._client.is_closed:
+            await cls._client.aclose()
+        cls._client = None
+        cls._client_loop = None
+
+    @classmethod
+    async def _fetch(cls, client: "httpx.AsyncClient", path: str, headers: Dict, repo_key: str, endpoint: str):
+        """GET through the conditional-request cache."""
+        with stage(RepoAnalyzer._stage_name(endpoint)):
+            entry = repo_metrics_cache.lookup(repo_key, endpoint)
+            if repo_metrics_cache.is_fresh(entry):
+                return repo_metrics_cache.serve(entry)
+            response = await client.get(path, headers={**headers, **repo_metrics_cache.conditional_headers(entry)})
+            record_github_response(endpoint, response)
+            return repo_metrics_cache.resolve(repo_key, endpoint, entry, response)
+
+    @classmethod
+    async def _get_commit_count(cls, client: "httpx.AsyncClient", owner: str, repo: str, headers: Dict) -> int:
+        repo_key = repo_metrics_cache.repo_key(owner, repo)
+        try:
+            response = await cls._fetch(client, f"/repos/{owner}/{repo}/commits?per_page=1", headers, repo_key, "commits")
+            return RepoAnalyzer._parse_commit_count(response)
+        except Exception as e:
+            logger.warning(f"Could not fetch commit count: {e}")
+            return 0
+
+    @classmethod
+    async def analyze_repo(cls, url: str) -> Dict[str, Any]:
+        """
+        Async analysis entry point.
+        Returns the same metrics structure as RepoAnalyzer.analyze_repo.
+        """
+        import httpx
+
+        try:
+            owner, repo = RepoAnalyzer._parse_url(url)
+            headers = RepoAnalyzer._build_headers()
+            repo_key = repo_metrics_cache.repo_key(owner, repo)
+            client = cls.get_client()
+
+            # 1. Metadata first: the tree request needs the default branch
+            repo_res = await cls._fetch(client, f"/repos/{owner}/{repo}", headers, repo_key, "metadata")
+            RepoAnalyzer._check_repo_status(repo_res.status_code)
+
+            repo_res.raise_for_status()
+            repo_data = repo_res.json()
+
+            default_branch = repo_data.get("default_branch", "main")
+
+            # 2. Languages, commit count and tree in parallel
+            lang_res, commit_count, tree_res = await asyncio.gather(
+                cls._fetch(client, f"/repos/{owner}/{repo}/languages", headers, repo_key, "languages"),
+                cls._get_commit_count(client, owner, repo, headers),
+                cls._fetch(client, f"/repos/{owner}/{repo}/git/trees/{default_branch}?recursive=1", headers, repo_key, f"tree:{default_branch}")
+            )
+            languages = lang_res.json() if lang_res.status_code == 200 else {}
+            tree_data = tree_res.json().get("tree", []) if tree_res.status_code == 200 else []
+
+            return RepoAnalyzer._build_metrics(repo_data, languages, commit_count, RepoAnalyzer._summarize_tree(tree_data))
+
+        except HTTPException:
+            raise
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        except httpx.HTTPError as e:
+            logger.error(f"GitHub API Error: {str(e)}")
+            raise HTTPException(status_code=502, detail="External service (GitHub) error.")
+        except Exception as e:
+            logger.error(f"Unexpected error analyzing repo: {str(e)}")
+            raise HTTPException(status_code=500, detail=f"Internal analysis failure: {str(e)}")
+
 if __name__ == "__main__":
     # Local dry run
     import json
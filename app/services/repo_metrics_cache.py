@@ -0,0 +1,225 @@
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger("task_review_system.repo_metrics_cache")
+
+# Response headers we need to replay from cache (commit count is derived from Link)
+REPLAYED_HEADERS = ("Link",)
+
+
+class CachedResponse:
+    """Minimal response stand-in for a GitHub payload served from the cache."""
+
+    def __init__(self, status_code: int, headers: Dict[str, str], body: Any):
+        self.status_code = status_code
+        self.headers = headers
+        self._body = body
+
+    def json(self) -> Any:
+        return self._body
+
+    def raise_for_status(self):
+        pass
+
+
+class CacheEntry:
+    __slots__ = ("etag", "last_modified", "headers", "body", "stored_at", "validated_at")
+
+    def __init__(self, etag, last_modified, headers, body, stored_at, validated_at):
+        self.etag = etag
+        self.last_modified = last_modified
+        self.headers = headers
+        self.body = body
+        self.stored_at = stored_at
+        self.validated_at = validated_at
+
+    def to_response(self) -> CachedResponse:
+        return CachedResponse(200, dict(self.headers), self.body)
+
+
+class RepoMetricsCache:
+    """
+    Conditional-request cache for GitHub REST responses, keyed by owner/repo and endpoint.
+
+    Entries keep the ETag / Last-Modified validators of the metadata, languages,
+    commits and tree endpoints. Within FRESH seconds an entry is served without
+    a network call; afterwards it is revalidated with If-None-Match, which GitHub
+    answers with a 304 that does not count against the rate limit. Backed by
+    SQLite so the cache survives restarts when GITHUB_CACHE_PATH points to a file.
+    """
+
+    def __init__(
+        self,
+        path: str = ":memory:",
+        ttl_seconds: float = 86400,
+        fresh_seconds: float = 60,
+        max_repos: int = 500,
+        enabled: bool = True
+    ):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.fresh_seconds = fresh_seconds
+        self.max_repos = max_repos
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "revalidated": 0, "stale": 0}
+
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        if path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS github_cache (
+                repo TEXT NOT NULL,
+                endpoint TEXT NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                headers TEXT NOT NULL,
+                body TEXT NOT NULL,
+                stored_at REAL NOT NULL,
+                validated_at REAL NOT NULL,
+                PRIMARY KEY (repo, endpoint)
+            )
+            """
+        )
+        # Row count kept by triggers, so stats() (read by /health) does not scan the table
+        with self._conn:
+            self._conn.execute("BEGIN IMMEDIATE")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS github_cache_count (id INTEGER PRIMARY KEY CHECK (id = 1), entries INTEGER NOT NULL)"
+            )
+            self._conn.execute("INSERT OR IGNORE INTO github_cache_count (id, entries) SELECT 1, COUNT(*) FROM github_cache")
+            self._conn.execute(
+                "CREATE TRIGGER IF NOT EXISTS github_cache_count_insert AFTER INSERT ON github_cache "
+                "BEGIN UPDATE github_cache_count SET entries = entries + 1 WHERE id = 1; END"
+            )
+            self._conn.execute(
+                "CREATE TRIGGER IF NOT EXISTS github_cache_count_delete AFTER DELETE ON github_cache "
+                "BEGIN UPDATE github_cache_count SET entries = entries - 1 WHERE id = 1; END"
+            )
+
+    @classmethod
+    def from_env(cls) -> "RepoMetricsCache":
+        return cls(
+            path=os.getenv("GITHUB_CACHE_PATH", ":memory:"),
+            ttl_seconds=float(os.getenv("GITHUB_CACHE_TTL_SECONDS", "86400")),
+            fresh_seconds=float(os.getenv("GITHUB_CACHE_FRESH_SECONDS", "60")),
+            max_repos=int(os.getenv("GITHUB_CACHE_MAX_REPOS", "500")),
+            enabled=os.getenv("GITHUB_CACHE_ENABLED", "true").lower() == "true"
+        )
+
+    @staticmethod
+    def repo_key(owner: str, repo: str) -> str:
+        return f"{owner}/{repo}".lower()
+
+    def lookup(self, repo: str, endpoint: str) -> Optional[CacheEntry]:
+        """Returns the stored entry, dropping it if it outlived the TTL."""
+        if not self.enabled:
+            return None
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT etag, last_modified, headers, body, stored_at, validated_at "
+                "FROM github_cache WHERE repo = ? AND endpoint = ?",
+                (repo, endpoint)
+            ).fetchone()
+            if row is None:
+                return None
+            if time.time() - row[5] > self.ttl_seconds:
+                self._conn.execute("DELETE FROM github_cache WHERE repo = ? AND endpoint = ?", (repo, endpoint))
+                return None
+        return CacheEntry(row[0], row[1], json.loads(row[2]), json.loads(row[3]), row[4], row[5])
+
+    def is_fresh(self, entry: Optional[CacheEntry]) -> bool:
+        return entry is not None and time.time() - entry.validated_at < self.fresh_seconds
+
+    def serve(self, entry: CacheEntry) -> CachedResponse:
+        """Serves a fresh entry without contacting GitHub."""
+        self._count("hits")
+        return entry.to_response()
+
+    @staticmethod
+    def conditional_headers(entry: Optional[CacheEntry]) -> Dict[str, str]:
+        if entry is None:
+            return {}
+        headers = {}
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def resolve(self, repo: str, endpoint: str, entry: Optional[CacheEntry], response):
+        """
+        Reconciles a (possibly conditional) GitHub response with the cache.
+        Returns the response the analyzer should consume.
+        """
+        status_code = response.status_code
+        if entry is not None and status_code == 304:
+            self._count("revalidated")
+            self._touch(repo, endpoint)
+            return entry.to_response()
+
+        if entry is not None and status_code == 403:
+            # Rate limited: a stale answer beats a hard failure
+            logger.warning(f"GitHub rate limited for {repo}/{endpoint}; serving cached response")
+            self._count("stale")
+            return entry.to_response()
+
+        self._count("misses")
+        if status_code == 200 and self.enabled:
+            headers = getattr(response, "headers", None) or {}
+            etag = headers.get("ETag")
+            last_modified = headers.get("Last-Modified")
+            if etag or last_modified:
+                replayed = {name: headers[name] for name in REPLAYED_HEADERS if name in headers}
+                self._store(repo, endpoint, etag, last_modified, replayed, response.json())
+        return response
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            entries = self._conn.execute("SELECT entries FROM github_cache_count WHERE id = 1").fetchone()[0]
+        return {**self._stats, "entries": entries}
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM github_cache")
+            for key in self._stats:
+                self._stats[key] = 0
+
+    def _count(self, name: str):
+        with self._lock:
+            self._stats[name] += 1
+
+    def _touch(self, repo: str, endpoint: str):
+        with self._lock:
+            self._conn.execute(
+                "UPDATE github_cache SET validated_at = ? WHERE repo = ? AND endpoint = ?",
+                (time.time(), repo, endpoint)
+            )
+
+    def _store(self, repo: str, endpoint: str, etag, last_modified, headers: Dict[str, str], body: Any):
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                # Upsert: INSERT OR REPLACE would delete without firing the count trigger
+                "INSERT INTO github_cache "
+                "(repo, endpoint, etag, last_modified, headers, body, stored_at, validated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?) ON CONFLICT (repo, endpoint) DO UPDATE SET "
+                "etag = excluded.etag, last_modified = excluded.last_modified, headers = excluded.headers, "
+                "body = excluded.body, stored_at = excluded.stored_at, validated_at = excluded.validated_at",
+                (repo, endpoint, etag, last_modified, json.dumps(headers), json.dumps(body), now, now)
+            )
+            # Size bound: keep the most recently validated repositories
+            self._conn.execute(
+                "DELETE FROM github_cache WHERE repo NOT IN ("
+                "SELECT repo FROM github_cache GROUP BY repo ORDER BY MAX(validated_at) DESC LIMIT ?)",
+                (self.max_repos,)
+            )
+
+
+repo_metrics_cache = RepoMetricsCache.from_env()
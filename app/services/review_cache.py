@@ -0,0 +1,97 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+from ..models.review_context import ReviewContext
+from ..models.schemas import ReviewOutput
+
+logger = logging.getLogger("task_review_system.review_cache")
+
+
+class ReviewResultCache:
+    """
+    Bounded LRU of engine results keyed by a fingerprint of the parsed review context.
+
+    The fingerprint covers the engine identity and version, the description,
+    the canonical JSON of the repo metrics and a digest of the PDF text, so two
+    submissions that parse to the same context share one entry however they
+    reached the orchestrator. Bumping the engine version invalidates every
+    earlier entry.
+    """
+
+    def __init__(self, max_entries: int = 2048, enabled: bool = True):
+        self.max_entries = max_entries
+        self.enabled = enabled and max_entries > 0
+        self._entries: "OrderedDict[str, ReviewOutput]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    @classmethod
+    def from_env(cls) -> "ReviewResultCache":
+        return cls(
+            max_entries=int(os.getenv("REVIEW_CACHE_MAX_ENTRIES", "2048")),
+            enabled=os.getenv("REVIEW_CACHE_ENABLED", "true").lower() == "true"
+        )
+
+    @staticmethod
+    def fingerprint(context: ReviewContext, engine_version: str) -> str:
+        hasher = hashlib.sha256()
+        for part in (
+            engine_version,
+            context.description,
+            json.dumps(context.repo_metrics, sort_keys=True, separators=(",", ":"), default=str),
+            hashlib.sha256(context.pdf_text.encode("utf-8")).hexdigest()
+        ):
+            hasher.update(part.encode("utf-8"))
+            # Separator keeps ("ab", "c") and ("a", "bc") apart
+            hasher.update(b"\0")
+        return hasher.hexdigest()
+
+    def get(self, key: str, record: bool = True) -> Optional[ReviewOutput]:
+        """
+        Returns a private copy of the cached result, flagged as served from
+        cache. With record=False the lookup touches neither stats nor recency.
+        """
+        if not self.enabled:
+            return None
+        with self._lock:
+            cached = self._entries.get(key)
+            if record and cached is None:
+                self._stats["misses"] += 1
+            elif record:
+                self._entries.move_to_end(key)
+                self._stats["hits"] += 1
+        if cached is None:
+            return None
+        result = cached.model_copy(deep=True)
+        result.meta.cached = True
+        return result
+
+    def put(self, key: str, review_output: ReviewOutput):
+        if not self.enabled:
+            return
+        # Callers go on to mutate their result (next_task), so keep our own copy
+        stored = review_output.model_copy(deep=True)
+        stored.next_task = None
+        with self._lock:
+            self._entries[key] = stored
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats["evictions"] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {**self._stats, "entries": len(self._entries), "max_entries": self.max_entries}
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            for key in self._stats:
+                self._stats[key] = 0
+
+
+review_cache = ReviewResultCache.from_env()
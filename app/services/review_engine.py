@@ -4,20 +4,81 @@ Updated on: 2026-02-05
 Logic: Modular Deterministic Rule Evaluators
 """
 from ..models.schemas import Task, ReviewOutput, Analysis, Meta
+from ..models.review_context import ReviewContext
 from ..core.interfaces.review_engine_interface import ReviewEngineInterface
+from ..core.timing import stage
+from .scoring_rules import ScoringPlan, scoring_rules
+from .text_features import default_extractor
+from typing import Dict, List, Optional, Tuple
+import copy
+import json
 import logging
+import os
 import time
 
 logger = logging.getLogger("task_review_system")
 
 # Evaluation Settings
-DETERMINISTIC_MODE = True
+# Deterministic mode reports FIXED_EVAL_TIME instead of the measured scoring time
+DETERMINISTIC_MODE = os.getenv("REVIEW_DETERMINISTIC_MODE", "true").lower() == "true"
 FIXED_EVAL_TIME = 120
 
-import json
-import re
+# Shown on every review scoring below 90
+IMPROVEMENT_HINTS = (
+    "Ensure PDF contains structured headings.",
+    "Maintain a commit history > 10.",
+    "Define clear objectives in your description."
+)
+
+class StreamingPDFScorer:
+    """
+    Incremental PDF scorer fed one page at a time.
+
+    Feeding the page texts of a document gives exactly the score of the full
+    newline-joined text, because word counts add up across pages and headings
+    are detected per line. Once the first word tier and the heading signal are
+    both reached (`saturated`) the score cannot change, so extraction can stop.
+    The saturation point comes from the scoring rules; worker processes are
+    handed it explicitly so they follow the parent's (possibly reloaded) plan.
+    """
+
+    def __init__(self, plan: Optional[ScoringPlan] = None, saturation: Optional[Tuple[Optional[int], bool]] = None):
+        self.plan = plan
+        if saturation is None:
+            saturation = (plan or scoring_rules.current()).pdf_saturation
+        self.saturation_words, self.saturation_needs_headings = saturation
+        self.word_count = 0
+        self.has_headings = False
+        self.has_text = False
+
+    @property
+    def saturated(self) -> bool:
+        if self.saturation_words is None:
+            return False
+        return (self.has_headings or not self.saturation_needs_headings) and self.word_count >= self.saturation_words
+
+    def feed(self, text: str) -> bool:
+        """Consumes one chunk of text; returns True once the score is saturated."""
+        if text:
+            self.has_text = True
+            # Headings are only looked for until the first one is found
+            features = default_extractor.extract(text, headings=not self.has_headings, keywords=False)
+            self.word_count += features.word_count
+            self.has_headings = self.has_headings or features.has_headings
+        return self.saturated
+
+    def result(self) -> tuple[int, list]:
+        plan = self.plan or scoring_rules.current()
+        return plan.score_pdf(self.has_text, self.word_count, self.has_headings)
 
 class ReviewEngine(ReviewEngineInterface):
+    # Bump whenever the scoring code changes; cached results of older versions stop matching
+    VERSION = "2.1"
+
+    def cache_version(self) -> Optional[str]:
+        """The engine version plus the fingerprint of the active rules file."""
+        return f"{self.VERSION}+rules-{scoring_rules.current().fingerprint}"
+
     def evaluate(self, task: dict) -> dict:
         """
         Adapter method to satisfy ReviewEngineInterface.
@@ -26,156 +87,97 @@ class ReviewEngine(ReviewEngineInterface):
         result = self.review_task(task_obj)
         return result.model_dump()
 
+    def evaluate_context(self, context: ReviewContext) -> dict:
+        """Scores a structured context directly, skipping the legacy string round trip."""
+        return self.review_context(context).model_dump()
+
+    def evaluate_many(self, contexts: List[ReviewContext]) -> List[dict]:
+        """
+        Batch scoring. Scoring is a pure function of the context, so identical
+        submissions in a batch (common in cohort re-reviews) are scored once.
+        """
+        scored: Dict[tuple, dict] = {}
+        results = []
+        for context in contexts:
+            key = (
+                context.description,
+                json.dumps(context.repo_metrics, sort_keys=True, default=str),
+                context.pdf_text
+            )
+            if key not in scored:
+                scored[key] = self.evaluate_context(context)
+            results.append(copy.deepcopy(scored[key]))
+        return results
+
     @staticmethod
     def _parse_context(description: str) -> dict:
         """Extracts structured components from the combined description string."""
-        context = {
-            "description": "",
-            "repo_metrics": {},
-            "pdf_text": ""
-        }
-        
-        # Split by known markers (flexible whitespace)
-        # Using [ \t]* around newlines and markers
-        marker_pattern = r"(?:\r?\n)+[ \t]*--- (GitHub Repository Metrics|Extracted PDF Content) ---[ \t]*(?:\r?\n)+"
-        parts = re.split(marker_pattern, description)
-        
-        # parts[0] is the main description
-        context["description"] = parts[0].strip()
+        context = ReviewContext.from_legacy_description(description)
         
-        # Iterate through markers and content
-        for i in range(1, len(parts), 2):
-            marker = parts[i]
-            content = parts[i+1].strip() if i+1 < len(parts) else ""
-            
-            if marker == "GitHub Repository Metrics":
-                try:
-                    context["repo_metrics"] = json.loads(content)
-                except Exception as e:
-                    logger.warning(f"Failed to parse repo metrics from context: {e}")
-                    context["repo_metrics"] = {}
-            elif marker == "Extracted PDF Content":
-                context["pdf_text"] = content
-        
-        logger.debug(f"Parsed context: Desc Length={len(context['description'])}, "
-                     f"Repo Metrics Keys={list(context['repo_metrics'].keys())}, "
-                     f"PDF Text Length={len(context['pdf_text'])}")
+        logger.debug(f"Parsed context: Desc Length={len(context.description)}, "
+                     f"Repo Metrics Keys={list(context.repo_metrics.keys())}, "
+                     f"PDF Text Length={len(context.pdf_text)}")
                 
-        return context
+        return {
+            "description": context.description,
+            "repo_metrics": context.repo_metrics,
+            "pdf_text": context.pdf_text
+        }
 
     @staticmethod
-    def _score_pdf(text: str) -> tuple[int, list]:
-        """PDF Scoring (40 points max)"""
+    def _score_pdf(text: str, plan: Optional[ScoringPlan] = None) -> tuple[int, list]:
+        """PDF Scoring (40 points max with the bundled rules)"""
+        plan = plan or scoring_rules.current()
         if not text:
-            return 0, ["No PDF content provided."]
-        
-        score = 0
-        reasons = []
-        words = text.split()
-        word_count = len(words)
-        logger.info(f"PDF Analysis: Word count = {word_count}")
-        
-        # 1. Word Count (30 pts)
-        if word_count >= 500:
-            score += 30
-        elif word_count >= 100:
-            score += 20
-        elif word_count >= 20:
-            score += 10
-        else:
-            reasons.append("PDF content too brief.")
-
-        # 2. Structured Headings Detection (10 pts)
-        # Look for lines starting with # or lines that are all caps and > 5 chars
-        has_headings = any(
-            line.strip().startswith('#') or 
-            (line.strip().isupper() and len(line.strip()) > 5) 
-            for line in text.split('\n')
-        )
-        if has_headings:
-            score += 10
-        else:
-            reasons.append("Missing structured headings in PDF.")
-            
-        return score, reasons
+            return plan.score_pdf(False, 0, False)
+
+        scorer = StreamingPDFScorer(plan)
+        scorer.feed(text)
+        logger.info(f"PDF Analysis: Word count = {scorer.word_count}")
+        return scorer.result()
 
     @staticmethod
-    def _score_repo(metrics: dict) -> tuple[int, list]:
-        """Repo Scoring (40 points max)"""
-        if not metrics:
-            return 0, ["No repository metrics provided."]
-        
-        score = 0
-        reasons = []
-        
-        # README (10 pts)
-        if metrics.get("has_readme"):
-            score += 10
-        else:
-            reasons.append("Missing README file.")
-            
-        # Tests (10 pts)
-        if metrics.get("has_tests"):
-            score += 10
-        else:
-            reasons.append("Missing tests directory.")
-            
-        # Commits (10 pts)
-        if metrics.get("commit_count", 0) > 10:
-            score += 10
-        else:
-            reasons.append("Low commit history (< 10 commits).")
-            
-        # Structure (10 pts)
-        if metrics.get("file_count", 0) > 15:
-            score += 10
-        else:
-            reasons.append("Sparse repository structure.")
-            
-        return score, reasons
+    def _score_repo(metrics: dict, plan: Optional[ScoringPlan] = None) -> tuple[int, list]:
+        """Repo Scoring (40 points max with the bundled rules)"""
+        return (plan or scoring_rules.current()).score_repo(metrics)
 
     @staticmethod
-    def _score_description(text: str) -> tuple[int, list]:
-        """Description Scoring (20 points max)"""
-        if not text or len(text) < 10:
-            return 0, ["Description too short."]
-        
-        score = 0
-        reasons = []
-        
-        # 1. Length Threshold (10 pts)
-        if len(text) >= 200:
-            score += 10
-        elif len(text) >= 50:
-            score += 5
-        else:
-            reasons.append("Description needs more detail.")
-            
-        # 2. Objective Keywords (10 pts)
-        description_lower = text.lower()
-        if any(k in description_lower for k in ["objective", "goal", "purpose", "requirement"]):
-            score += 10
-        else:
-            reasons.append("Missing clear objectives/requirements.")
-            
-        return score, reasons
+    def _score_description(text: str, plan: Optional[ScoringPlan] = None) -> tuple[int, list]:
+        """Description Scoring (20 points max with the bundled rules)"""
+        return (plan or scoring_rules.current()).score_description(text)
+
+    @staticmethod
+    def _normalize(score: int, max_points: int) -> int:
+        return int((score / max_points) * 100) if score > 0 and max_points > 0 else 0
 
     @classmethod
     def review_task(cls, task: Task) -> ReviewOutput:
         """
         Pure deterministic review processor. Same Input -> Same Output.
         """
-        start_time = time.time()
-        
         # Parse context from combined description
-        context = cls._parse_context(task.task_description)
-        
-        pdf_score, pdf_reasons = cls._score_pdf(context["pdf_text"])
-        repo_score, repo_reasons = cls._score_repo(context["repo_metrics"])
-        desc_score, desc_reasons = cls._score_description(context["description"])
-        
-        final_score = pdf_score + repo_score + desc_score
-        logger.info(f"Score Breakdown: PDF={pdf_score}/40, Repo={repo_score}/40, Desc={desc_score}/20 | Total={final_score}/100")
+        with stage("context_parsing"):
+            context = ReviewContext.from_legacy_description(task.task_description)
+        return cls.review_context(context)
+
+    @classmethod
+    def review_context(cls, context: ReviewContext) -> ReviewOutput:
+        """
+        Scores the structured review context. Same Input -> Same Output.
+        """
+        start_time = time.perf_counter()
+        # One plan snapshot per review, so a concurrent reload cannot mix rule versions
+        plan = scoring_rules.current()
+        with stage("score_pdf"):
+            pdf_score, pdf_reasons = cls._score_pdf(context.pdf_text, plan)
+        with stage("score_repo"):
+            repo_score, repo_reasons = cls._score_repo(context.repo_metrics, plan)
+        with stage("score_description"):
+            desc_score, desc_reasons = cls._score_description(context.description, plan)
+        
+        final_score = min(pdf_score + repo_score + desc_score, 100)
+        logger.info(f"Score Breakdown: PDF={pdf_score}/{plan.pdf.max_points}, Repo={repo_score}/{plan.repo.max_points}, "
+                    f"Desc={desc_score}/{plan.description.max_points} | Total={final_score}/100")
         
         failure_reasons = pdf_reasons + repo_reasons + desc_reasons
         
@@ -195,15 +197,16 @@ class ReviewEngine(ReviewEngineInterface):
 
         # Analysis Normalization (0-100)
         analysis = Analysis(
-            technical_quality=int((repo_score / 40) * 100) if repo_score > 0 else 0,
-            clarity=int((desc_score / 20) * 100) if desc_score > 0 else 0,
-            discipline_signals=int((pdf_score / 40) * 100) if pdf_score > 0 else 0
+            technical_quality=min(cls._normalize(repo_score, plan.repo.max_points), 100),
+            clarity=min(cls._normalize(desc_score, plan.description.max_points), 100),
+            discipline_signals=min(cls._normalize(pdf_score, plan.pdf.max_points), 100)
         )
         
         # Meta calculation (deterministic eval time)
         meta = Meta(
-            evaluation_time_ms=FIXED_EVAL_TIME,
-            mode="rule"
+            evaluation_time_ms=FIXED_EVAL_TIME if DETERMINISTIC_MODE else int((time.perf_counter() - start_time) * 1000),
+            mode="rule",
+            rules_version=plan.version
         )
 
         return ReviewOutput(
@@ -211,11 +214,7 @@ class ReviewEngine(ReviewEngineInterface):
             readiness_percent=readiness,
             status=status,
             failure_reasons=failure_reasons[:5], # Top 5 reasons
-            improvement_hints=[
-                "Ensure PDF contains structured headings.",
-                "Maintain a commit history > 10.",
-                "Define clear objectives in your description."
-            ] if final_score < 90 else [],
+            improvement_hints=list(IMPROVEMENT_HINTS) if final_score < 90 else [],
             analysis=analysis,
             meta=meta
         )
@@ -1,29 +1,45 @@
 from ..core.interfaces.review_engine_interface import ReviewEngineInterface
 from ..core.interfaces.next_task_interface import NextTaskGeneratorInterface
 from ..models.schemas import Task, ReviewOutput, Analysis, Meta, TaskCreate
-from ..models.orchestration import OrchestrationResult, V2NextTask
+from ..models.review_context import ReviewContext
+from ..models.orchestration import OrchestrationResult, V2NextTask, BatchReviewItem, BatchReviewItemResult, BatchItemError
 from ..models.task_templates import SYSTEM_FALLBACK_TASK
+from .pdf_executor import PDFExtractionExecutor, pdf_executor
 from .pdf_processor import PDFProcessor
-from .repo_analyzer import RepoAnalyzer
+from .repo_analyzer import AsyncRepoAnalyzer, RepoAnalyzer
+from .repo_metrics_cache import RepoMetricsCache
+from .upload_spool import upload_spooler
+from .review_cache import ReviewResultCache, review_cache
+from ..core.timing import current_timings, stage
+from ..core.metrics import record_review
+import asyncio
+import base64
+import binascii
 import logging
-import uuid
-from datetime import datetime
-import json
+import os
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple, Type
 from fastapi import UploadFile, HTTPException
 
 logger = logging.getLogger("orchestrator")
 
+# Concurrent GitHub analyses per batch request / in-flight streamed orchestrations
+BATCH_CONCURRENCY = int(os.getenv("REVIEW_BATCH_CONCURRENCY", "8"))
+
 class ReviewOrchestrator:
     def __init__(
         self,
         review_engine: ReviewEngineInterface,
         next_task_generator: NextTaskGeneratorInterface,
+        pdf_executor: PDFExtractionExecutor = pdf_executor,
+        repo_analyzer: Type[AsyncRepoAnalyzer] = AsyncRepoAnalyzer,
+        review_cache: ReviewResultCache = review_cache
     ):
         self._review_engine = review_engine
         self._next_task_generator = next_task_generator
-        # Using service classes directly as they are static/stateless
-        self._pdf_processor = PDFProcessor
-        self._repo_analyzer = RepoAnalyzer
+        # Long-lived services, normally handed in by the AppContainer
+        self._pdf_executor = pdf_executor
+        self._repo_analyzer = repo_analyzer
+        self._review_cache = review_cache
 
     @staticmethod
     def classify_readiness(score: int) -> str:
@@ -40,7 +56,7 @@ class ReviewOrchestrator:
         else:
             return "FAIL"
 
-    def orchestrate_review(
+    async def orchestrate_review(
         self,
         description: str,
         github_url: str = None,
@@ -58,6 +74,38 @@ class ReviewOrchestrator:
         logger.info(f"Starting extended orchestration. GitHub: {github_url}, PDF: {pdf_file.filename if pdf_file else 'None'}")
         
         # 1. Input Validation
+        with stage("validation"):
+            self.validate_extended_input(description, github_url)
+
+        # 2. PDF Extraction (Mandatory if provided)
+        extracted_text = ""
+        if pdf_file:
+            if not pdf_file.filename.lower().endswith(".pdf"):
+                raise HTTPException(status_code=400, detail="Only PDF files are allowed")
+
+            try:
+                with stage("pdf_extraction"):
+                    extracted_text = await self._pdf_executor.extract(pdf_file)
+            except HTTPException:
+                raise
+            except Exception as e:
+                logger.error(f"PDF Extraction failed: {str(e)}")
+                raise HTTPException(status_code=400, detail=f"PDF Processing failed: {str(e)}")
+
+        # 3. GitHub Analysis (Fallback if fails)
+        repo_metrics = await self.fetch_repo_metrics(github_url) if github_url else {}
+
+        # 4. Build the structured review context
+        context = ReviewContext(
+            description=(description or "").strip(),
+            repo_metrics=repo_metrics,
+            pdf_text=extracted_text
+        )
+
+        return self.process_submission(context=context)
+
+    @staticmethod
+    def validate_extended_input(description: Optional[str], github_url: Optional[str]):
         try:
             from ..models.schemas import ExtendedReviewRequest
             # If github_url or description is provided, validate them
@@ -74,66 +122,257 @@ class ReviewOrchestrator:
         except ValueError as e:
             raise HTTPException(status_code=400, detail=str(e))
 
-        # 2. PDF Extraction (Mandatory if provided)
-        extracted_text = ""
-        if pdf_file:
-            if not pdf_file.filename.lower().endswith(".pdf"):
-                raise HTTPException(status_code=400, detail="Only PDF files are allowed")
-
-            try:
-                extracted_text = self._pdf_processor.extract_text(pdf_file)
-            except HTTPException:
+    async def fetch_repo_metrics(self, github_url: str) -> Dict[str, Any]:
+        """Repository metrics with deterministic zero-metrics fallback; a 404 is still a rejection."""
+        try:
+            repo_metrics = await self._repo_analyzer.analyze_repo(github_url)
+            logger.info(f"Repo Metrics Fetched: Commits={repo_metrics.get('commit_count')}, Files={repo_metrics.get('file_count')}, Tests={repo_metrics.get('has_tests')}")
+            return repo_metrics
+        except HTTPException as e:
+            # 404 remains a rejection/not found, but others might fallback
+            if e.status_code == 404:
                 raise
-            except Exception as e:
-                logger.error(f"PDF Extraction failed: {str(e)}")
-                raise HTTPException(status_code=400, detail=f"PDF Processing failed: {str(e)}")
+            logger.warning(f"GitHub Analysis failed with {e.status_code} - Falling back to deterministic zero-metrics logic")
+        except Exception as e:
+            logger.warning(f"GitHub Analysis failed: {str(e)} - Falling back to deterministic zero-metrics logic")
+        return {}
 
-        # 3. GitHub Analysis (Fallback if fails)
-        repo_metrics = {}
-        if github_url:
+    async def review_batch(
+        self,
+        items: List[BatchReviewItem],
+        task_lookup: Callable[[str], Any]
+    ) -> List[BatchReviewItemResult]:
+        """
+        Reviews many submissions in one call. Results keep input order and
+        carry per-item errors. Repositories and PDFs shared by several items
+        are analyzed/extracted once, concurrently, and all resulting contexts
+        are scored with a single evaluate_many call.
+        """
+        errors: Dict[int, BatchItemError] = {}
+        contexts: Dict[int, ReviewContext] = {}
+        pending: Dict[int, Tuple[Optional[str], Optional[str], str]] = {}
+        repo_urls: Dict[str, str] = {}
+        pdf_contents: Dict[str, bytes] = {}
+
+        # 1. Resolve every item into a context, or into the inputs it still needs
+        for index, item in enumerate(items):
             try:
-                repo_metrics = self._repo_analyzer.analyze_repo(github_url)
-                logger.info(f"Repo Metrics Fetched: Commits={repo_metrics.get('commit_count')}, Files={repo_metrics.get('file_count')}, Tests={repo_metrics.get('has_tests')}")
+                context = self._resolve_stored(item, task_lookup)
+                if context is not None:
+                    contexts[index] = context
+                else:
+                    self.validate_extended_input(item.description, item.github_url)
+                    repo_key = None
+                    if item.github_url:
+                        repo_key = RepoMetricsCache.repo_key(*RepoAnalyzer._parse_url(item.github_url))
+                        repo_urls.setdefault(repo_key, item.github_url)
+                    pdf_key = None
+                    if item.pdf_base64:
+                        content = self._decode_pdf(item.pdf_base64)
+                        pdf_key = PDFProcessor.content_digest(content)
+                        pdf_contents.setdefault(pdf_key, content)
+                    pending[index] = (repo_key, pdf_key, (item.description or "").strip())
             except HTTPException as e:
-                # 404 remains a rejection/not found, but others might fallback
-                if e.status_code == 404:
-                    raise
-                logger.warning(f"GitHub Analysis failed with {e.status_code} - Falling back to deterministic zero-metrics logic")
-            except Exception as e:
-                logger.warning(f"GitHub Analysis failed: {str(e)} - Falling back to deterministic zero-metrics logic")
-                repo_metrics = {}
-
-        # 4. Construct Combined Payload
-        # We follow the ReviewEngine's format: [Desc] \n\n --- [Marker] --- \n [Content]
-        final_description = description or ""
-        if repo_metrics:
-            final_description += f"\n\n--- GitHub Repository Metrics ---\n{json.dumps(repo_metrics, indent=2)}"
-        if extracted_text:
-            final_description += f"\n\n--- Extracted PDF Content ---\n\n{extracted_text}"
-
-        # 5. Create Task object for ReviewEngine
-        task = Task(
-            task_id="orch-" + str(uuid.uuid4())[:8],
-            task_title=f"Review: {github_url if github_url else 'Document Submission'}",
-            task_description=final_description,
-            submitted_by=submitted_by,
-            timestamp=datetime.now()
+                errors[index] = BatchItemError(status_code=e.status_code, detail=str(e.detail))
+
+        # 2. Fan out the deduplicated external work
+        repo_results, pdf_results = await asyncio.gather(
+            self._gather_bounded(
+                [self.fetch_repo_metrics(url) for url in repo_urls.values()], BATCH_CONCURRENCY
+            ),
+            self._gather_bounded(
+                [self._pdf_executor.extract_bytes(content) for content in pdf_contents.values()],
+                max(self._pdf_executor.pool_size, 1)
+            )
         )
+        repo_metrics_by_key = dict(zip(repo_urls.keys(), repo_results))
+        pdf_text_by_key = dict(zip(pdf_contents.keys(), pdf_results))
+
+        for index, (repo_key, pdf_key, description) in pending.items():
+            repo_metrics = repo_metrics_by_key.get(repo_key, {}) if repo_key else {}
+            pdf_text = pdf_text_by_key.get(pdf_key, "") if pdf_key else ""
+            failure = next((r for r in (pdf_text, repo_metrics) if isinstance(r, BaseException)), None)
+            if failure is not None:
+                status_code = failure.status_code if isinstance(failure, HTTPException) else 500
+                detail = failure.detail if isinstance(failure, HTTPException) else str(failure)
+                errors[index] = BatchItemError(status_code=status_code, detail=str(detail))
+                continue
+            contexts[index] = ReviewContext(description=description, repo_metrics=repo_metrics, pdf_text=pdf_text)
+
+        # 3. Score all contexts in one engine call
+        indices = sorted(contexts)
+        reviews = self.evaluate_many([contexts[i] for i in indices])
+        results = {i: self.finalize(review) for i, review in zip(indices, reviews)}
 
-        return self.process_submission(task)
+        return [
+            BatchReviewItemResult(index=i, result=results.get(i), error=errors.get(i))
+            for i in range(len(items))
+        ]
 
-    def process_submission(self, task: Task) -> OrchestrationResult:
+    async def review_stream(
+        self,
+        items: List[BatchReviewItem],
+        task_lookup: Callable[[str], Any],
+        max_in_flight: int = BATCH_CONCURRENCY
+    ) -> AsyncIterator[BatchReviewItemResult]:
         """
-        Core logic for evaluating a task and generating the next step.
+        Yields each item's result as soon as it finishes, tagged with its input index.
+        At most `max_in_flight` orchestrations run at once, and new ones are only
+        started when the consumer asks for the next result, so a slow reader
+        throttles the work instead of buffering it.
         """
+        shared: Dict[str, asyncio.Task] = {}
+        pending_items = iter(enumerate(items))
+        in_flight = set()
+        try:
+            while True:
+                while len(in_flight) < max(max_in_flight, 1):
+                    next_item = next(pending_items, None)
+                    if next_item is None:
+                        break
+                    index, item = next_item
+                    in_flight.add(asyncio.ensure_future(self._review_item(index, item, task_lookup, shared)))
+                if not in_flight:
+                    return
+                done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                for finished in done:
+                    yield finished.result()
+        finally:
+            # Client went away or the stream finished: drop outstanding work
+            for task in list(in_flight) + list(shared.values()):
+                task.cancel()
+
+    async def _review_item(
+        self,
+        index: int,
+        item: BatchReviewItem,
+        task_lookup: Callable[[str], Any],
+        shared: Dict[str, asyncio.Task]
+    ) -> BatchReviewItemResult:
+        """Runs one streamed item end to end; repo and PDF work is shared between items of the stream."""
+        try:
+            context = self._resolve_stored(item, task_lookup)
+            if context is None:
+                self.validate_extended_input(item.description, item.github_url)
+                repo_metrics: Dict[str, Any] = {}
+                pdf_text = ""
+                if item.pdf_base64:
+                    content = self._decode_pdf(item.pdf_base64)
+                    key = "pdf:" + PDFProcessor.content_digest(content)
+                    pdf_text = await self._coalesce(shared, key, lambda: self._pdf_executor.extract_bytes(content))
+                if item.github_url:
+                    key = "repo:" + RepoMetricsCache.repo_key(*RepoAnalyzer._parse_url(item.github_url))
+                    repo_metrics = await self._coalesce(shared, key, lambda: self.fetch_repo_metrics(item.github_url))
+                context = ReviewContext(
+                    description=(item.description or "").strip(),
+                    repo_metrics=repo_metrics,
+                    pdf_text=pdf_text
+                )
+            return BatchReviewItemResult(index=index, result=self.process_submission(context=context))
+        except HTTPException as e:
+            return BatchReviewItemResult(index=index, error=BatchItemError(status_code=e.status_code, detail=str(e.detail)))
+        except Exception as e:
+            logger.error(f"Streamed review of item {index} failed: {str(e)}")
+            return BatchReviewItemResult(index=index, error=BatchItemError(status_code=500, detail=f"Review process failed: {str(e)}"))
+
+    @staticmethod
+    async def _coalesce(shared: Dict[str, asyncio.Task], key: str, factory: Callable[[], Awaitable]) -> Any:
+        task = shared.get(key)
+        if task is None:
+            task = shared[key] = asyncio.ensure_future(factory())
+        # shield: one waiter being cancelled must not cancel the others
+        return await asyncio.shield(task)
+
+    @staticmethod
+    def _resolve_stored(item: BatchReviewItem, task_lookup: Callable[[str], Any]) -> Optional[ReviewContext]:
+        """Context for task_id / payload items; None when the item carries extended inputs."""
+        if item.task_id:
+            entry = task_lookup(item.task_id)
+            if not entry:
+                raise HTTPException(status_code=404, detail=f"Task {item.task_id} not found")
+            task = entry["task"] if isinstance(entry, dict) else entry
+            return ReviewContext.from_legacy_description(task.task_description)
+        if item.payload is not None:
+            try:
+                payload = TaskCreate(**item.payload)
+            except ValueError:
+                raise HTTPException(status_code=400, detail="Invalid payload format")
+            return ReviewContext.from_legacy_description(payload.task_description)
+        if item.github_url or item.description or item.pdf_base64:
+            return None
+        raise HTTPException(status_code=400, detail="Insufficient input provided.")
+
+    @staticmethod
+    def _decode_pdf(pdf_base64: str) -> bytes:
+        try:
+            content = base64.b64decode(pdf_base64, validate=True)
+        except (binascii.Error, ValueError):
+            raise HTTPException(status_code=400, detail="pdf_base64 is not valid base64")
+        if not content:
+            raise HTTPException(status_code=400, detail="The uploaded PDF file is empty.")
+        if len(content) > upload_spooler.max_upload_bytes:
+            raise HTTPException(status_code=413, detail="PDF exceeds the maximum upload size.")
+        return content
+
+    @staticmethod
+    async def _gather_bounded(coroutines: List[Awaitable], limit: int) -> List[Any]:
+        """gather() with at most `limit` coroutines running; exceptions are returned in place."""
+        semaphore = asyncio.Semaphore(limit)
+
+        async def bounded(coroutine):
+            async with semaphore:
+                return await coroutine
+
+        return await asyncio.gather(*(bounded(c) for c in coroutines), return_exceptions=True)
+
+    def evaluate_many(self, contexts: List[ReviewContext]) -> List[ReviewOutput]:
+        """Batch scoring; falls back to per-item evaluation so one bad item cannot fail the batch."""
+        if not contexts:
+            return []
+        keys = [self._cache_key(context) for context in contexts]
+        results: List[Optional[ReviewOutput]] = [self._review_cache.get(key) if key else None for key in keys]
+        misses = [i for i, result in enumerate(results) if result is None]
+        if not misses:
+            return results
+
         try:
+            scored = [ReviewOutput(**result) for result in self._review_engine.evaluate_many([contexts[i] for i in misses])]
+            for i, review_output in zip(misses, scored):
+                if keys[i]:
+                    self._review_cache.put(keys[i], review_output)
+                results[i] = review_output
+        except Exception as e:
+            logger.error(f"Batch evaluation failed: {str(e)} - Retrying items individually", exc_info=True)
+            for i in misses:
+                results[i] = self.evaluate(context=contexts[i])
+        return results
+
+    def evaluate(self, task: Optional[Task] = None, context: Optional[ReviewContext] = None) -> ReviewOutput:
+        try:
+            cache_key = None
+            if self._engine_version() is not None:
+                if context is None:
+                    with stage("context_parsing"):
+                        context = ReviewContext.from_legacy_description(task.task_description)
+                cache_key = self._cache_key(context)
+                cached = self._review_cache.get(cache_key)
+                if cached is not None:
+                    logger.info(f"Review served from cache: Score={cached.score}, Status={cached.status}")
+                    return cached
+
             # 1. Call ReviewEngine
-            review_result_dict = self._review_engine.evaluate(task.model_dump())
+            if context is not None:
+                review_result_dict = self._review_engine.evaluate_context(context)
+            else:
+                review_result_dict = self._review_engine.evaluate(task.model_dump())
             review_output = ReviewOutput(**review_result_dict)
             logger.info(f"Review Logic Result: Score={review_output.score}, Status={review_output.status}")
+            if cache_key:
+                self._review_cache.put(cache_key, review_output)
+            return review_output
         except Exception as e:
             logger.error(f"ReviewEngine failed: {str(e)}", exc_info=True)
-            review_output = ReviewOutput(
+            return ReviewOutput(
                 score=0,
                 readiness_percent=0,
                 status="fail",
@@ -142,13 +381,56 @@ class ReviewOrchestrator:
                 meta=Meta(evaluation_time_ms=0, mode="rule")
             )
 
+    def _engine_version(self) -> Optional[str]:
+        cache_version = getattr(self._review_engine, "cache_version", None)
+        version = cache_version() if callable(cache_version) else getattr(self._review_engine, "VERSION", None)
+        return f"{type(self._review_engine).__name__}:{version}" if isinstance(version, str) else None
+
+    def _cache_key(self, context: ReviewContext) -> Optional[str]:
+        """Result cache key, or None when the engine does not declare a version."""
+        version = self._engine_version()
+        return self._review_cache.fingerprint(context, version) if version else None
+
+    def process_submission(self, task: Optional[Task] = None, context: Optional[ReviewContext] = None) -> OrchestrationResult:
+        """
+        Core logic for evaluating a task and generating the next step.
+        A structured context is scored directly; a stored task goes through the legacy adapter.
+        """
+        return self.finalize(self.evaluate(task=task, context=context))
+
+    def warm(self, context: ReviewContext) -> OrchestrationResult:
+        """
+        Reviews `context` through the same steps as process_submission (cache
+        fingerprint and lookup, engine, readiness, next task) without leaving
+        a trace: nothing is stored in or counted by the review cache, the
+        score is not recorded, and errors propagate instead of becoming a
+        fail review. Used by the startup warm-up.
+        """
+        cache_key = self._cache_key(context)
+        review_output = self._review_cache.get(cache_key, record=False) if cache_key else None
+        if review_output is None:
+            review_output = ReviewOutput(**self._review_engine.evaluate_context(context))
+        classification = self.classify_readiness(review_output.score)
+        next_task = self._next_task_generator.generate_next_task(review_output, classification)
+        review_output.next_task = next_task
+        return OrchestrationResult(
+            review=review_output,
+            readiness_classification=classification,
+            next_task=next_task
+        )
+
+    def finalize(self, review_output: ReviewOutput) -> OrchestrationResult:
+        """Classifies readiness and attaches the next task."""
+        record_review(review_output.score, review_output.status)
+
         # 2. Interpret readiness
         classification = self.classify_readiness(review_output.score)
         logger.info(f"Readiness Classification: {classification}")
 
         # 3. Next Task Generation
         try:
-            next_task = self._next_task_generator.generate_next_task(review_output, classification)
+            with stage("next_task"):
+                next_task = self._next_task_generator.generate_next_task(review_output, classification)
             logger.info(f"Next Task Generated: Title='{next_task.title}', Difficulty='{next_task.difficulty}'")
         except Exception as e:
             logger.warning(f"NextTaskGenerator failed: {str(e)} - Using system fallback")
@@ -160,6 +442,7 @@ class ReviewOrchestrator:
             )
 
         review_output.next_task = next_task
+        review_output.meta.stage_timings_ms = current_timings()
 
         return OrchestrationResult(
             review=review_output,
@@ -0,0 +1,300 @@
+import hashlib
+import json
+import logging
+import operator
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from .text_features import TextFeatureExtractor
+
+logger = logging.getLogger("task_review_system.scoring_rules")
+
+DEFAULT_RULES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "scoring_rules.json")
+
+# Features each section exposes to its rules, in the order the plan reads them
+SECTION_FEATURES = {
+    "pdf": ("present", "word_count", "has_headings"),
+    "repo": ("present", "has_readme", "has_tests", "commit_count", "file_count"),
+    "description": ("present", "char_length", "has_keyword"),
+}
+
+OPERATORS = {
+    ">": operator.gt,
+    ">=": operator.ge,
+    "<": operator.lt,
+    "<=": operator.le,
+    "==": operator.eq,
+}
+
+
+def _truthy(value: Any, _threshold: Any) -> bool:
+    return bool(value)
+
+
+class RulesError(ValueError):
+    """Raised when a rules file does not describe a valid scoring plan."""
+
+
+class CompiledSection:
+    """
+    One section of the plan, flattened to tuples: the gate is (op, index, threshold)
+    and every criterion is (index, tiers, failure) with tiers of (op, threshold, points).
+    """
+
+    __slots__ = ("name", "requires", "unmet_reason", "criteria", "max_points")
+
+    def __init__(self, name: str, requires: Tuple, unmet_reason: str, criteria: Tuple, max_points: int):
+        self.name = name
+        self.requires = requires
+        self.unmet_reason = unmet_reason
+        self.criteria = criteria
+        self.max_points = max_points
+
+    def evaluate(self, values: Tuple) -> Tuple[int, List[str]]:
+        op, index, threshold = self.requires
+        if not op(values[index], threshold):
+            return 0, [self.unmet_reason]
+
+        score = 0
+        reasons = []
+        for index, tiers, failure in self.criteria:
+            value = values[index]
+            for op, threshold, points in tiers:
+                if op(value, threshold):
+                    score += points
+                    break
+            else:
+                reasons.append(failure)
+        return score, reasons
+
+
+class ScoringPlan:
+    """A compiled rules file. Immutable; a reload builds a new plan and swaps it in."""
+
+    __slots__ = ("version", "fingerprint", "pdf", "repo", "description", "extractor", "pdf_saturation")
+
+    def __init__(self, version: str, fingerprint: str, sections: Dict[str, CompiledSection],
+                 extractor: TextFeatureExtractor, pdf_saturation: Tuple[Optional[int], bool]):
+        self.version = version
+        self.fingerprint = fingerprint
+        self.pdf = sections["pdf"]
+        self.repo = sections["repo"]
+        self.description = sections["description"]
+        self.extractor = extractor
+        self.pdf_saturation = pdf_saturation
+
+    def score_pdf(self, present: bool, word_count: int, has_headings: bool) -> Tuple[int, List[str]]:
+        return self.pdf.evaluate((present, word_count, has_headings))
+
+    def score_repo(self, metrics: Dict[str, Any]) -> Tuple[int, List[str]]:
+        if not metrics:
+            return self.repo.evaluate((False, None, None, 0, 0))
+        return self.repo.evaluate((
+            True,
+            metrics.get("has_readme"),
+            metrics.get("has_tests"),
+            metrics.get("commit_count", 0),
+            metrics.get("file_count", 0)
+        ))
+
+    def score_description(self, text: str) -> Tuple[int, List[str]]:
+        if not text:
+            return self.description.evaluate((False, 0, False))
+        features = self.extractor.extract(text, words=False, headings=False)
+        return self.description.evaluate((True, features.char_length, bool(features.keyword_hits)))
+
+
+def compile_rules(rules: Dict[str, Any], fingerprint: str = "") -> ScoringPlan:
+    """Validates a rules document and flattens it into a ScoringPlan."""
+    if not isinstance(rules, dict) or not isinstance(rules.get("sections"), dict):
+        raise RulesError("Rules must be an object with 'version' and 'sections'")
+    sections = {}
+    for name, features in SECTION_FEATURES.items():
+        spec = rules["sections"].get(name)
+        if not isinstance(spec, dict):
+            raise RulesError(f"Missing rules section '{name}'")
+        sections[name] = _compile_section(name, spec, features)
+
+    keywords = _expect_list("description", "keywords", rules["sections"]["description"].get("keywords", []))
+    if not all(isinstance(keyword, str) for keyword in keywords):
+        raise RulesError("Keywords in 'description' must be strings")
+    return ScoringPlan(
+        version=str(rules.get("version", "unversioned")),
+        fingerprint=fingerprint,
+        sections=sections,
+        extractor=TextFeatureExtractor(keywords),
+        pdf_saturation=_pdf_saturation(sections["pdf"])
+    )
+
+
+def _compile_section(name: str, spec: Dict[str, Any], features: Tuple[str, ...]) -> CompiledSection:
+    requires = spec.get("requires", {"feature": "present"})
+    if not isinstance(requires, dict):
+        raise RulesError(f"'requires' in '{name}' must be an object")
+    requires_op = _compile_op(name, requires)
+    gate = (requires_op, _feature_index(name, requires.get("feature"), features), requires.get("value"))
+
+    criteria = []
+    max_points = 0
+    for criterion in _expect_list(name, "criteria", spec.get("criteria", [])):
+        if not isinstance(criterion, dict):
+            raise RulesError(f"Criteria in '{name}' must be objects")
+        index = _feature_index(name, criterion.get("feature"), features)
+        if "tiers" in criterion:
+            tier_specs = _expect_list(name, "tiers", criterion["tiers"])
+            if not all(isinstance(tier, dict) for tier in tier_specs):
+                raise RulesError(f"Tiers of '{criterion['feature']}' in '{name}' must be objects")
+            tiers = tuple(
+                (_compile_op(name, tier), tier["value"], int(tier["points"]))
+                for tier in tier_specs
+            )
+        else:
+            tiers = ((_truthy, None, int(criterion["points"])),)
+        if not tiers:
+            raise RulesError(f"Criterion '{criterion['feature']}' in '{name}' has no tiers")
+        max_points += max(points for _, _, points in tiers)
+        criteria.append((index, tiers, criterion.get("failure", "")))
+
+    return CompiledSection(name, gate, requires.get("unmet_reason", ""), tuple(criteria), max_points)
+
+
+def _expect_list(section: str, key: str, value: Any) -> List[Any]:
+    if not isinstance(value, list):
+        raise RulesError(f"'{key}' in '{section}' must be a list")
+    return value
+
+
+def _compile_op(section: str, spec: Dict[str, Any]) -> Callable[[Any, Any], bool]:
+    if "op" not in spec:
+        return _truthy
+    op = OPERATORS.get(spec["op"])
+    if op is None:
+        raise RulesError(f"Unknown operator '{spec['op']}' in '{section}'")
+    if "value" not in spec:
+        raise RulesError(f"Operator '{spec['op']}' in '{section}' needs a value")
+    return op
+
+
+def _feature_index(section: str, feature: Optional[str], features: Tuple[str, ...]) -> int:
+    if feature not in features:
+        raise RulesError(f"Unknown feature '{feature}' in '{section}'; expected one of {', '.join(features)}")
+    return features.index(feature)
+
+
+def _pdf_saturation(section: CompiledSection) -> Tuple[Optional[int], bool]:
+    """
+    (word count, heading needed) after which more PDF text cannot change the
+    PDF score, or (None, ...) when the rules do not guarantee that and
+    extraction must read every page.
+
+    Tiers are evaluated first match wins, in file order, so word count rules
+    only saturate when every tier is a lower bound, thresholds strictly
+    descend and points do not increase: past the first tier's threshold,
+    no other tier can match. A heading, once seen, stays seen, so any rule
+    on has_headings (gate, flag or tiers) is settled by the first heading.
+    """
+    words_index = SECTION_FEATURES["pdf"].index("word_count")
+    headings_index = SECTION_FEATURES["pdf"].index("has_headings")
+    gate_op, gate_index, gate_threshold = section.requires
+    rules = [(gate_index, ((gate_op, gate_threshold, 0),))]
+    rules += [(index, tiers) for index, tiers, _ in section.criteria]
+
+    saturation_words = 0
+    needs_headings = False
+    for index, tiers in rules:
+        if index == headings_index:
+            needs_headings = True
+        elif index == words_index:
+            needed = _words_saturation(tiers)
+            if needed is None:
+                return None, needs_headings
+            saturation_words = max(saturation_words, needed)
+    return saturation_words, needs_headings
+
+
+def _words_saturation(tiers: Tuple) -> Optional[int]:
+    needed = []
+    for op, threshold, _ in tiers:
+        if op is _truthy:
+            needed.append(1)
+        elif op is operator.ge:
+            needed.append(int(threshold))
+        elif op is operator.gt:
+            needed.append(int(threshold) + 1)
+        else:
+            return None
+    points = [points for _, _, points in tiers]
+    descending = all(a > b for a, b in zip(needed, needed[1:]))
+    non_increasing = all(a >= b for a, b in zip(points, points[1:]))
+    return needed[0] if descending and non_increasing else None
+
+
+class ScoringRules:
+    """
+    Holds the active ScoringPlan. When the rules file changes on disk (checked
+    at most every reload_interval seconds) it is recompiled and swapped in with
+    a single reference assignment, so in-flight reviews finish on the plan
+    they started with. A file that fails to compile leaves the current plan
+    in place.
+    """
+
+    def __init__(self, path: str = DEFAULT_RULES_PATH, reload_interval: float = 5.0):
+        self.path = path
+        self.reload_interval = reload_interval
+        self._reload_lock = threading.Lock()
+        self._checked_at = time.monotonic()
+        self._mtime = self._stat_mtime()
+        self._plan = self._load()
+
+    @classmethod
+    def from_env(cls) -> "ScoringRules":
+        return cls(
+            path=os.getenv("SCORING_RULES_PATH", DEFAULT_RULES_PATH),
+            reload_interval=float(os.getenv("SCORING_RULES_RELOAD_SECONDS", "5"))
+        )
+
+    def current(self) -> ScoringPlan:
+        if self.reload_interval > 0 and time.monotonic() - self._checked_at >= self.reload_interval:
+            self._check_for_changes()
+        return self._plan
+
+    def reload(self) -> ScoringPlan:
+        """Recompiles the rules file now; returns the active plan."""
+        with self._reload_lock:
+            self._mtime = self._stat_mtime()
+            try:
+                plan = self._load()
+            except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+                logger.error(f"Keeping scoring rules {self._plan.version}; {self.path} failed to compile: {e}")
+                return self._plan
+            if plan.fingerprint != self._plan.fingerprint:
+                logger.info(f"Scoring rules reloaded: {self._plan.version} -> {plan.version}")
+            self._plan = plan
+            return plan
+
+    def _check_for_changes(self):
+        if not self._reload_lock.acquire(blocking=False):
+            # Another thread is already checking
+            return
+        try:
+            self._checked_at = time.monotonic()
+            changed = self._stat_mtime() != self._mtime
+        finally:
+            self._reload_lock.release()
+        if changed:
+            self.reload()
+
+    def _stat_mtime(self) -> Optional[int]:
+        try:
+            return os.stat(self.path).st_mtime_ns
+        except OSError:
+            return None
+
+    def _load(self) -> ScoringPlan:
+        with open(self.path, "rb") as f:
+            raw = f.read()
+        return compile_rules(json.loads(raw), hashlib.sha256(raw).hexdigest()[:16])
+
+
+scoring_rules = ScoringRules.from_env()
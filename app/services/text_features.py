@@ -0,0 +1,130 @@
+from typing import FrozenSet, Iterable
+
+OBJECTIVE_KEYWORDS = ("objective", "goal", "purpose", "requirement")
+
+# ASCII byte -> b" " for the characters str.split() treats as whitespace, b"x" otherwise
+_WORD_TABLE = bytes(32 if chr(i).isspace() else 120 for i in range(128)) + b"x" * 128
+
+
+class TextFeatures:
+    """Everything the scorers read from a piece of text."""
+
+    __slots__ = ("word_count", "has_headings", "char_length", "keyword_hits")
+
+    def __init__(self, word_count: int, has_headings: bool, char_length: int, keyword_hits: FrozenSet[str]):
+        self.word_count = word_count
+        self.has_headings = has_headings
+        self.char_length = char_length
+        self.keyword_hits = keyword_hits
+
+
+class TextFeatureExtractor:
+    """
+    One extraction call per text, shared by all scorers.
+
+    The text is read once, in blocks of about BLOCK_CHARS that end on a line
+    break, and every feature is updated from each block while it is hot in
+    cache: a byte translate and count for words, find() between '#'
+    characters and per-line isupper() for headings, and a C-level `in` on
+    the lowered block for each keyword not found yet. Heading and keyword
+    checks stop as soon as they are settled. Since blocks split at line
+    breaks, words, lines and keyword occurrences are never cut, and matching
+    on block.lower() equals the original `k in text.lower()`.
+    """
+
+    BLOCK_CHARS = 16384
+
+    def __init__(self, keywords: Iterable[str] = OBJECTIVE_KEYWORDS):
+        self.keywords = tuple(dict.fromkeys(keyword.lower() for keyword in keywords))
+
+    def extract(self, text: str, words: bool = True, headings: bool = True, keywords: bool = True) -> TextFeatures:
+        """Computes the requested features in one pass; skipped ones are reported as absent."""
+        if not text:
+            return TextFeatures(0, False, 0, frozenset())
+        if len(text) <= self.BLOCK_CHARS:
+            # One block: no block bookkeeping needed
+            lowered = text.lower() if keywords else ""
+            return TextFeatures(
+                word_count=count_words(text) if words else 0,
+                has_headings=headings and has_headings(text),
+                char_length=len(text),
+                keyword_hits=frozenset(keyword for keyword in self.keywords if keyword in lowered)
+            )
+        word_count = 0
+        found_heading = False
+        look_for_heading = headings
+        hits = set()
+        missing = list(self.keywords) if keywords else []
+        for block in self._blocks(text):
+            if words:
+                word_count += count_words(block)
+            if look_for_heading and has_headings(block):
+                found_heading = True
+                look_for_heading = False
+            if missing:
+                lowered = block.lower()
+                found = [keyword for keyword in missing if keyword in lowered]
+                if found:
+                    hits.update(found)
+                    missing = [keyword for keyword in missing if keyword not in hits]
+        return TextFeatures(
+            word_count=word_count,
+            has_headings=found_heading,
+            char_length=len(text),
+            keyword_hits=frozenset(hits)
+        )
+
+    def _blocks(self, text: str) -> Iterable[str]:
+        size = self.BLOCK_CHARS
+        start = 0
+        while start < len(text):
+            end = text.find("\n", start + size)
+            end = len(text) if end < 0 else end + 1
+            yield text[start:end]
+            start = end
+
+    def keyword_hits(self, text: str) -> FrozenSet[str]:
+        return self.extract(text, words=False, headings=False).keyword_hits
+
+    def has_keyword(self, text: str) -> bool:
+        """Whether any keyword occurs."""
+        return bool(self.keyword_hits(text))
+
+
+def count_words(text: str) -> int:
+    """len(text.split()) without materialising the words (ASCII text is counted in C)."""
+    if not text.isascii():
+        return len(text.split())
+    mapped = text.encode("ascii").translate(_WORD_TABLE)
+    # A word starts at every non-space byte that follows a space, plus at the very start
+    return mapped.count(b" x") + (mapped[:1] == b"x")
+
+
+def has_headings(text: str) -> bool:
+    """Whether any line starts with '#' or is all caps and longer than 5 characters (after stripping)."""
+    if "#" in text and _has_hash_heading(text):
+        return True
+    for line in text.split("\n"):
+        # Whitespace is uncased, so isupper() of the raw line equals that of the
+        # stripped line; only the length check needs the strip, and only for candidates
+        if line.isupper() and len(line.strip()) > 5:
+            return True
+    return False
+
+
+def _has_hash_heading(text: str) -> bool:
+    """Whether some line's first non-whitespace character is '#', visiting only the '#' characters."""
+    position = text.find("#")
+    while position >= 0:
+        line_start = text.rfind("\n", 0, position) + 1
+        prefix = text[line_start:position]
+        if not prefix or prefix.isspace():
+            return True
+        line_end = text.find("\n", position)
+        if line_end < 0:
+            return False
+        position = text.find("#", line_end)
+    return False
+
+
+default_extractor = TextFeatureExtractor()
@@ -1,6 +1,15 @@
 import sys
 import os
+import hashlib
 import logging
+import re
+import threading
+import uuid
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import chain, islice
+from typing import Deque, Iterator, List, Optional, Tuple
+from .blob_cache import TieredBlobCache
 
 logger = logging.getLogger("task_review_system.tts")
 
@@ -17,60 +26,424 @@ logger = logging.getLogger("task_review_system.tts")
 ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 VAANI_DIR = os.path.join(ROOT_DIR, "VaaniTTS_Standalone", "VaaniTTS_Standalone")
 
-if os.path.exists(VAANI_DIR):
-    if VAANI_DIR not in sys.path:
-        sys.path.append(VAANI_DIR)
-        logger.info(f"Added VaaniTTS path: {VAANI_DIR}")
-else:
-    logger.warning(f"VaaniTTS directory not found at: {VAANI_DIR}. Please ensure the submodule/folder is present.")
-
-try:
-    # Attempt to import the service
-    # Since we added the path, we can import directly
-    from tts_service import text_to_speech_stream, speak_text_directly, initialize_tts_engine
-    TTS_AVAILABLE = True
-except ImportError as e:
-    logger.error(f"Failed to import VaaniTTS modules: {e}")
-    TTS_AVAILABLE = False
-    text_to_speech_stream = None
-    speak_text_directly = None
-    initialize_tts_engine = None
+# The VaaniTTS service (and pyttsx3/gTTS behind it) is loaded on the first TTS
+# call rather than at import, so app startup does not touch sys.path or probe
+# speech engines.
+_tts_lock = threading.Lock()
+_tts_module = None
+_tts_checked = False
 
-def generate_audio_stream(text: str, language: str = 'en') -> bytes:
+
+def _load_tts():
+    """Imports tts_service once; returns the module, or None when it is unavailable."""
+    global _tts_module, _tts_checked
+    if _tts_checked:
+        return _tts_module
+    with _tts_lock:
+        if _tts_checked:
+            return _tts_module
+        if os.path.exists(VAANI_DIR):
+            if VAANI_DIR not in sys.path:
+                sys.path.append(VAANI_DIR)
+                logger.info(f"Added VaaniTTS path: {VAANI_DIR}")
+        else:
+            logger.warning(f"VaaniTTS directory not found at: {VAANI_DIR}. Please ensure the submodule/folder is present.")
+
+        try:
+            # Since we added the path, we can import directly
+            import tts_service
+            _tts_module = tts_service
+        except ImportError as e:
+            logger.error(f"Failed to import VaaniTTS modules: {e}")
+            _tts_module = None
+        _tts_checked = True
+        return _tts_module
+
+
+def is_tts_available() -> bool:
+    """Whether VaaniTTS can be used; the first call performs the import."""
+    return _load_tts() is not None
+
+
+def warm_up_tts() -> str:
     """
-    Generates audio stream from text using VaaniTTS.
-    Returns raw bytes of WAV (or other format) audio.
+    Loads VaaniTTS and starts its long-lived pyttsx3 engine with the default
+    voice resolved. Returns "ready", "degraded" when only the offline engine
+    failed (gTTS still works), or "unavailable" when VaaniTTS cannot be loaded.
+    """
+    tts_service = _load_tts()
+    if tts_service is None:
+        return "unavailable"
+    if tts_service.initialize_tts_engine() is None:
+        logger.warning("pyttsx3 engine unavailable; TTS will rely on gTTS only")
+        return "degraded"
+    return "ready"
+
+
+# Synthesized audio keyed by (normalized text, language, engine). The UI reads
+# the same failure reasons and next-task texts over and over, and every miss
+# costs a translation call plus a gTTS round trip. Audio is already compressed,
+# so the disk tier stores it as is.
+tts_audio_cache = TieredBlobCache(
+    name="tts_audio",
+    max_memory_bytes=int(os.getenv("TTS_CACHE_MAX_BYTES", str(32 * 1024 * 1024))),
+    disk_dir=os.getenv("TTS_CACHE_DIR") or None,
+    max_disk_bytes=int(os.getenv("TTS_CACHE_MAX_DISK_BYTES", str(256 * 1024 * 1024))),
+    compress=False
+)
+TTS_CACHE_MAX_AGE_SECONDS = int(os.getenv("TTS_CACHE_MAX_AGE_SECONDS", "86400"))
+
+# Only gTTS output is cached under this engine name. text_to_speech_stream
+# falls back to pyttsx3 when gTTS fails; that audio is served uncached.
+TTS_ENGINE = "vaani-gtts"
+
+
+def audio_cache_key(text: str, language: str = 'en') -> str:
+    """
+    Cache key and ETag for the audio of `text`. Text is normalized the way the
+    synthesizer sees it (emojis removed, whitespace collapsed), so variants
+    that would be spoken identically share one entry.
+    """
+    tts_service = _load_tts()
+    normalized = tts_service.remove_emojis(text) if tts_service is not None else " ".join(text.split())
+    material = f"{TTS_ENGINE}\0{language.lower()}\0{normalized}"
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+def audio_media_type(audio: bytes) -> str:
+    """gTTS returns MP3 and the pyttsx3 fallback WAV; tell them apart by signature."""
+    if audio[:3] == b"ID3" or (len(audio) > 1 and audio[0] == 0xFF and audio[1] & 0xE0 == 0xE0):
+        return "audio/mpeg"
+    return "audio/wav"
+
+
+def generate_audio(text: str, language: str = 'en') -> Tuple[bytes, Optional[str]]:
+    """
+    Returns (audio, cache key), synthesizing only on a cache miss. The key is
+    None when gTTS failed and the pyttsx3 fallback produced the audio, or when
+    translation failed and the untranslated text was spoken: a transient
+    outage must not be cached (and served with an ETag) under the target key.
     """
-    if not TTS_AVAILABLE:
+    tts_service = _load_tts()
+    if tts_service is None:
         raise RuntimeError("VaaniTTS service is not available (Import Error)")
-    
+
+    key = audio_cache_key(text, language)
+    audio_data = tts_audio_cache.get(key)
+    if audio_data is not None:
+        return audio_data, key
+
     try:
         # Generate audio using the standalone service
         # It handles buffering and cleanup
-        audio_data = text_to_speech_stream(text, language=language)
-        return audio_data
+        audio_data, translation_fell_back = tts_service.text_to_speech_stream(text, language=language, report=True)
     except Exception as e:
         logger.error(f"Error generating audio stream: {e}")
         raise e
+    if translation_fell_back:
+        logger.warning(f"Translation to '{language}' failed; serving untranslated audio uncached")
+    if not audio_data or translation_fell_back or audio_media_type(audio_data) != "audio/mpeg":
+        return audio_data, None
+    tts_audio_cache.put(key, audio_data)
+    return audio_data, key
+
+
+# Languages whose translations of the static review texts are fetched at startup
+TRANSLATION_PREFETCH_LANGUAGES = [
+    language.strip() for language in os.getenv("TRANSLATION_PREFETCH_LANGUAGES", "").split(",") if language.strip()
+]
+
+
+def spoken_templates() -> List[str]:
+    """Static texts the review UI reads out: next-task templates, improvement hints and scoring failure messages."""
+    from ..models.task_templates import SYSTEM_FALLBACK_TASK
+    from .review_engine import IMPROVEMENT_HINTS
+    from .scoring_rules import scoring_rules
+    from .sequential_task_generator import SequentialTaskGenerator
+
+    rules = SequentialTaskGenerator.RULES
+    texts = []
+    for template in (rules.pass_task, rules.borderline_task, rules.fail_task, SYSTEM_FALLBACK_TASK):
+        texts += [template.title, template.objective, template.rationale]
+    texts += IMPROVEMENT_HINTS
+    plan = scoring_rules.current()
+    for section in (plan.pdf, plan.repo, plan.description):
+        texts.append(section.unmet_reason)
+        texts += [failure for _, _, failure in section.criteria]
+    return list(dict.fromkeys(text for text in texts if text))
+
+
+def prefetch_translations(languages: Optional[List[str]] = None) -> bool:
+    """Fills the translation cache for the static review texts; returns whether TTS is available."""
+    tts_service = _load_tts()
+    if tts_service is None:
+        return False
+    languages = TRANSLATION_PREFETCH_LANGUAGES if languages is None else languages
+    count = tts_service.prefetch_translations(spoken_templates(), languages)
+    if count:
+        logger.info(f"Prefetched {count} translations for {', '.join(languages)}")
+    return True
+
+
+def generate_audio_stream(text: str, language: str = 'en') -> bytes:
+    """
+    Generates audio stream from text using VaaniTTS.
+    Returns raw bytes of MP3 (gTTS) or WAV (pyttsx3 fallback) audio.
+    """
+    return generate_audio(text, language)[0]
+
+# Progressive synthesis: sentences are synthesized by a small pool, a few
+# ahead of the one being sent, and sent in order
+TTS_STREAM_WORKERS = int(os.getenv("TTS_STREAM_WORKERS", "3"))
+TTS_STREAM_MAX_CHUNK_CHARS = int(os.getenv("TTS_STREAM_MAX_CHUNK_CHARS", "300"))
+
+_SENTENCE_END = re.compile(r"(?<=[.!?;:\u0964\u3002\uff01\uff1f])\s+|\n+")
+_stream_pool: Optional[ThreadPoolExecutor] = None
+_stream_pool_lock = threading.Lock()
+
+
+def split_sentences(text: str, max_chars: int = TTS_STREAM_MAX_CHUNK_CHARS) -> List[str]:
+    """Splits text into sentence chunks; sentences longer than max_chars are cut at word boundaries."""
+    chunks = []
+    for sentence in _SENTENCE_END.split(text):
+        sentence = sentence.strip()
+        while len(sentence) > max_chars:
+            cut = sentence.rfind(" ", 0, max_chars)
+            cut = cut if cut > 0 else max_chars
+            chunks.append(sentence[:cut])
+            sentence = sentence[cut:].strip()
+        if sentence:
+            chunks.append(sentence)
+    return chunks
 
-def speak_on_server(text: str):
+
+def _get_stream_pool() -> ThreadPoolExecutor:
+    global _stream_pool
+    with _stream_pool_lock:
+        if _stream_pool is None:
+            _stream_pool = ThreadPoolExecutor(max_workers=TTS_STREAM_WORKERS, thread_name_prefix="tts-stream")
+        return _stream_pool
+
+
+def iter_audio_chunks(text: str, language: str = 'en') -> Iterator[Tuple[str, bytes]]:
+    """
+    Yields (sentence chunk, audio) in order. At most TTS_STREAM_WORKERS
+    chunks are in flight; closing the iterator (client gone) cancels the rest.
+    Every chunk goes through the audio cache, so repeated sentences are free.
+    """
+    chunks = iter(split_sentences(text))
+    pool = _get_stream_pool()
+    pending: Deque[Tuple[str, Future]] = deque(
+        (chunk, pool.submit(generate_audio_stream, chunk, language)) for chunk in islice(chunks, TTS_STREAM_WORKERS)
+    )
+    try:
+        while pending:
+            chunk, future = pending.popleft()
+            audio = future.result()
+            following = next(chunks, None)
+            if following is not None:
+                pending.append((following, pool.submit(generate_audio_stream, following, language)))
+            yield chunk, audio
+    finally:
+        for _, future in pending:
+            future.cancel()
+
+
+def progressive_audio(text: str, language: str = 'en') -> Tuple[str, Iterator[bytes]]:
+    """
+    Synthesizes the first chunk and returns (media type, iterator over the whole
+    stream). Blocks only for the first chunk, so time-to-first-audio follows
+    the first sentence. MP3 frames concatenate as is; WAV chunks are merged
+    into one stream with an open-ended header.
+    """
+    if _load_tts() is None:
+        raise RuntimeError("VaaniTTS service is not available (Import Error)")
+    if not split_sentences(text):
+        raise ValueError("Text is required")
+    chunks = iter_audio_chunks(text, language)
+    _, first = next(chunks)
+    media_type = audio_media_type(first)
+    rest = _same_media_type(media_type, chunks, language)
+    if media_type == "audio/wav":
+        return media_type, _merge_wav(first, rest)
+    return media_type, chain([first], rest)
+
+
+def _same_media_type(media_type: str, chunks: Iterator[Tuple[str, bytes]], language: str) -> Iterator[bytes]:
+    """
+    Passes on chunks of the stream's media type. If gTTS recovers during a
+    pyttsx3 (WAV) stream, that chunk is resynthesized with pyttsx3; an engine
+    switch that cannot be undone (WAV inside an MP3 stream) ends the stream,
+    since splicing the other format in would corrupt it.
+    """
+    try:
+        for chunk, audio in chunks:
+            if audio_media_type(audio) != media_type and media_type == "audio/wav":
+                audio = _load_tts().text_to_speech_stream(chunk, language=language, use_google_tts=False)
+            if audio_media_type(audio) != media_type:
+                logger.error(f"TTS engine changed mid-stream ({media_type} -> {audio_media_type(audio)}); ending the stream early")
+                return
+            yield audio
+    finally:
+        chunks.close()
+
+
+def _merge_wav(first: bytes, rest: Iterator[bytes]) -> Iterator[bytes]:
+    # Streaming WAV convention: unknown RIFF and data sizes are 0xFFFFFFFF
+    data_offset = first.find(b"data")
+    if data_offset < 0:
+        yield first
+        yield from rest
+        return
+    header = bytearray(first[:data_offset + 8])
+    header[4:8] = b"\xff\xff\xff\xff"
+    header[data_offset + 4:data_offset + 8] = b"\xff\xff\xff\xff"
+    yield bytes(header) + first[data_offset + 8:]
+    for chunk in rest:
+        offset = chunk.find(b"data")
+        yield chunk[offset + 8:] if chunk[:4] == b"RIFF" and offset >= 0 else chunk
+
+
+def speak_on_server(text: str, language: str = 'en'):
     """
     Speaks text immediately on the server (local playback).
     Useful for local debugging or if the agent is running on the user's machine.
     """
-    if not TTS_AVAILABLE:
+    tts_service = _load_tts()
+    if tts_service is None:
         logger.warning("TTS not available, cannot speak")
         return
     
     try:
-        # Initialize COM library for Windows if running in a thread
-        if sys.platform == 'win32':
-             try:
-                 import pythoncom
-                 pythoncom.CoInitialize()
-             except ImportError:
-                 pass
-
-        speak_text_directly(text)
+        # The engine thread inside VaaniTTS initializes COM itself on Windows
+        tts_service.speak_text_directly(text, language)
     except Exception as e:
         logger.error(f"Error speaking text on server: {e}")
+
+
+class PlaybackQueueFull(Exception):
+    pass
+
+
+class PlaybackQueue:
+    """
+    Server-side playback for mode 'server_play'. Requests are queued and
+    played one at a time by a single consumer thread, so a burst cannot start
+    competing playbacks on the audio device. The queue is bounded, and a text
+    already waiting in the same language is not queued twice.
+    """
+
+    def __init__(self, max_depth: int = 10, player=speak_on_server):
+        self.max_depth = max_depth
+        self._player = player
+        self._pending: Deque[dict] = deque()
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = False
+        self.current: Optional[dict] = None
+        self.played = 0
+        self.deduplicated = 0
+        self.rejected = 0
+        self.cancelled = 0
+
+    @classmethod
+    def from_env(cls) -> "PlaybackQueue":
+        return cls(max_depth=int(os.getenv("TTS_PLAYBACK_MAX_QUEUE", "10")))
+
+    def enqueue(self, text: str, language: str = 'en') -> Tuple[dict, bool]:
+        """Queues text for playback; returns (item, whether it was newly queued)."""
+        key = audio_cache_key(text, language)
+        with self._condition:
+            for item in self._pending:
+                if item["key"] == key:
+                    self.deduplicated += 1
+                    return self._public(item), False
+            if len(self._pending) >= self.max_depth:
+                self.rejected += 1
+                raise PlaybackQueueFull(f"Playback queue is full ({self.max_depth} pending)")
+            item = {"id": uuid.uuid4().hex[:12], "key": key, "text": text, "language": language}
+            self._pending.append(item)
+            self._stopping = False
+            self._ensure_consumer()
+            self._condition.notify()
+            return self._public(item), True
+
+    def _ensure_consumer(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._consume, name="tts-playback", daemon=True)
+            self._thread.start()
+
+    def _consume(self):
+        while True:
+            with self._condition:
+                while not self._pending and not self._stopping:
+                    self._condition.wait()
+                if self._stopping:
+                    return
+                item = self.current = self._pending.popleft()
+            try:
+                self._player(item["text"], item["language"])
+            except Exception as e:
+                logger.error(f"Error during server playback: {e}")
+            with self._condition:
+                self.current = None
+                self.played += 1
+
+    def cancel(self, item_id: str) -> bool:
+        """Removes a pending item; returns False if it is not waiting (unknown, playing or done)."""
+        with self._condition:
+            for item in self._pending:
+                if item["id"] == item_id:
+                    self._pending.remove(item)
+                    self.cancelled += 1
+                    return True
+            return False
+
+    def clear(self) -> int:
+        """Drops every pending item; returns how many were dropped."""
+        with self._condition:
+            count = len(self._pending)
+            self._pending.clear()
+            self.cancelled += count
+            return count
+
+    def skip(self) -> bool:
+        """Interrupts the item being played; the next one starts right away."""
+        if self.current is None:
+            return False
+        tts_service = _load_tts()
+        return bool(tts_service is not None and tts_service.speech_engine.stop_speaking())
+
+    def shutdown(self):
+        # Does not wait for the item being played; the consumer is a daemon thread
+        with self._condition:
+            self._pending.clear()
+            self._stopping = True
+            self._condition.notify_all()
+
+    @staticmethod
+    def _public(item: dict) -> dict:
+        return {"id": item["id"], "text": item["text"], "language": item["language"]}
+
+    def snapshot(self) -> dict:
+        with self._condition:
+            return {
+                "playing": self._public(self.current) if self.current else None,
+                "pending": [self._public(item) for item in self._pending],
+                "max_depth": self.max_depth
+            }
+
+    def stats(self) -> dict:
+        with self._condition:
+            return {
+                "pending": len(self._pending),
+                "playing": self.current is not None,
+                "max_depth": self.max_depth,
+                "played": self.played,
+                "deduplicated": self.deduplicated,
+                "rejected": self.rejected,
+                "cancelled": self.cancelled
+            }
+
+
+playback_queue = PlaybackQueue.from_env()
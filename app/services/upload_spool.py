@@ -0,0 +1,175 @@
+import asyncio
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict
+from fastapi import UploadFile, HTTPException
+
+logger = logging.getLogger("task_review_system.upload_spool")
+
+
+class UploadBudget:
+    """
+    Per-process byte budget for uploads that are being spooled or processed.
+    Reservations that do not fit wait up to `wait_timeout` seconds for other
+    uploads to finish, then fail with 503.
+    """
+
+    def __init__(self, max_bytes: int, wait_timeout: float = 10.0):
+        self.max_bytes = max_bytes
+        self.wait_timeout = wait_timeout
+        self._lock = threading.Lock()
+        self._used = 0
+        self._waiters = deque()
+        self._stats = {"rejected": 0, "waited": 0}
+
+    async def acquire(self, size: int):
+        deadline = time.monotonic() + self.wait_timeout
+        waited = False
+        while True:
+            with self._lock:
+                # A lone upload is always admitted so a tiny budget cannot deadlock
+                if self._used + size <= self.max_bytes or self._used == 0:
+                    self._used += size
+                    if waited:
+                        self._stats["waited"] += 1
+                    return
+                loop = asyncio.get_running_loop()
+                waiter = loop.create_future()
+                self._waiters.append((loop, waiter))
+
+            remaining = deadline - time.monotonic()
+            try:
+                if remaining <= 0:
+                    raise asyncio.TimeoutError
+                await asyncio.wait_for(waiter, timeout=remaining)
+                waited = True
+            except asyncio.TimeoutError:
+                with self._lock:
+                    self._stats["rejected"] += 1
+                logger.warning(f"Upload memory budget exhausted ({self._used}/{self.max_bytes} bytes in flight)")
+                raise HTTPException(status_code=503, detail="Server is busy processing other uploads. Please retry shortly.")
+
+    def release(self, size: int):
+        with self._lock:
+            self._used = max(self._used - size, 0)
+            waiters, self._waiters = list(self._waiters), deque()
+        for loop, waiter in waiters:
+            try:
+                loop.call_soon_threadsafe(_wake, waiter)
+            except RuntimeError:
+                # Loop already closed; nobody is waiting on it anymore
+                pass
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {**self._stats, "in_flight_bytes": self._used, "max_bytes": self.max_bytes}
+
+
+def _wake(waiter: asyncio.Future):
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+class SpooledUpload:
+    """An upload copied to a private temp file, hashed while copying."""
+
+    def __init__(self, filename: str, path: str, size: int, digest: str):
+        self.filename = filename
+        self.path = path
+        self.size = size
+        self.digest = digest
+
+
+class UploadSpooler:
+    """
+    Copies UploadFile bodies to a private temp file in fixed-size chunks, so a
+    PDF is never held in memory as a whole, hashing them on the way.
+
+    Starlette has already received the whole multipart body into its own
+    spooled file by the time a route runs, so the size limit cannot be
+    enforced while the client sends. What it does: an upload whose part size
+    (reported by the multipart parser) exceeds the maximum gets a 413 before
+    anything is copied; for parts of unknown size the copy stops with a 413
+    once it passes the maximum. The upload size, capped at the maximum, is
+    reserved against the shared budget before copying, until the caller is
+    done with the spooled file.
+    """
+
+    def __init__(self, max_upload_bytes: int, budget: UploadBudget, chunk_size: int = 1024 * 1024):
+        self.max_upload_bytes = max_upload_bytes
+        self.budget = budget
+        self.chunk_size = chunk_size
+
+    @classmethod
+    def from_env(cls) -> "UploadSpooler":
+        budget = UploadBudget(
+            max_bytes=int(os.getenv("UPLOAD_MEMORY_BUDGET_BYTES", str(256 * 1024 * 1024))),
+            wait_timeout=float(os.getenv("UPLOAD_QUEUE_TIMEOUT_SECONDS", "10"))
+        )
+        return cls(
+            max_upload_bytes=int(os.getenv("PDF_MAX_UPLOAD_BYTES", str(25 * 1024 * 1024))),
+            budget=budget,
+            chunk_size=int(os.getenv("UPLOAD_CHUNK_BYTES", str(1024 * 1024)))
+        )
+
+    def reservation_size(self, file: UploadFile) -> int:
+        # The multipart parser records each part's size; unknown sizes reserve the maximum
+        declared = getattr(file, "size", None)
+        if declared is None or declared <= 0:
+            return self.max_upload_bytes
+        return min(declared, self.max_upload_bytes)
+
+    @asynccontextmanager
+    async def spool(self, file: UploadFile) -> AsyncIterator[SpooledUpload]:
+        # The whole upload is reserved up front: partial reservations held while
+        # waiting for more budget would let concurrent uploads block each other
+        declared = getattr(file, "size", None)
+        if declared is not None and declared > self.max_upload_bytes:
+            raise self._too_large()
+        reserved = self.reservation_size(file)
+        await self.budget.acquire(reserved)
+        path = None
+        try:
+            fd, path = tempfile.mkstemp(suffix=".pdf")
+            hasher = hashlib.sha256()
+            size = 0
+            with os.fdopen(fd, "wb") as out:
+                while True:
+                    chunk = await file.read(self.chunk_size)
+                    if not chunk:
+                        break
+                    size += len(chunk)
+                    if size > self.max_upload_bytes:
+                        raise self._too_large()
+                    hasher.update(chunk)
+                    out.write(chunk)
+
+            if size == 0:
+                logger.error("Empty PDF file uploaded")
+                raise HTTPException(status_code=400, detail="The uploaded PDF file is empty.")
+
+            yield SpooledUpload(file.filename, path, size, hasher.hexdigest())
+        finally:
+            self.budget.release(reserved)
+            if path is not None:
+                try:
+                    os.unlink(path)
+                except OSError:
+                    pass
+            # Reset file pointer for potential subsequent reads
+            await file.seek(0)
+
+    def _too_large(self) -> HTTPException:
+        return HTTPException(
+            status_code=413,
+            detail=f"PDF exceeds the maximum upload size of {self.max_upload_bytes // (1024 * 1024)} MB."
+        )
+
+
+upload_spooler = UploadSpooler.from_env()
@@ -0,0 +1,93 @@
+"""
+Benchmark: serverless cold start. Each run is a fresh interpreter that imports
+api/index.py (the Vercel entry point) and serves one /health request through
+the ASGI app, lifespan included. Reports the median import time and
+time-to-first-/health, and which heavy modules were loaded by then.
+
+Usage: python tests/bench_cold_start.py [runs] [--json]
+  --json prints one machine-readable line, for tracking across releases.
+"""
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules that must not be loaded before the route that needs them runs
+DEFERRED_MODULES = ("pdfplumber", "pdfminer", "requests", "httpx", "tts_service", "pyttsx3", "gtts", "multiprocessing")
+
+PROBE = r"""
+import asyncio, json, sys, time
+start = time.perf_counter()
+sys.path.insert(0, ROOT_DIR)
+from api.index import app
+imported = time.perf_counter()
+
+async def first_health():
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+        "scheme": "http", "path": "/health", "raw_path": b"/health", "root_path": "",
+        "query_string": b"", "headers": [(b"host", b"bench")], "client": ("127.0.0.1", 1),
+        "server": ("bench", 80)
+    }
+    async with app.router.lifespan_context(app):
+        await app(scope, receive, send)
+    return messages[0]["status"]
+
+status = asyncio.run(first_health())
+served = time.perf_counter()
+print(json.dumps({
+    "import_ms": (imported - start) * 1000,
+    "first_health_ms": (served - start) * 1000,
+    "status": status,
+    "loaded": [name for name in DEFERRED if name in sys.modules]
+}))
+"""
+
+
+def probe() -> dict:
+    code = f"ROOT_DIR = {ROOT_DIR!r}\nDEFERRED = {DEFERRED_MODULES!r}\n" + PROBE
+    output = subprocess.run(
+        [sys.executable, "-c", code], cwd=ROOT_DIR, capture_output=True, text=True, check=True
+    ).stdout
+    # Application logging also goes to stdout; the result is the last line
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    runs = int(args[0]) if args else 10
+    probe()  # warm the bytecode cache so every run measures the same thing
+    results = [probe() for _ in range(runs)]
+
+    summary = {
+        "runs": runs,
+        "python": sys.version.split()[0],
+        "import_ms_median": round(statistics.median(r["import_ms"] for r in results), 1),
+        "first_health_ms_median": round(statistics.median(r["first_health_ms"] for r in results), 1),
+        "health_status": results[-1]["status"],
+        "deferred_modules_loaded": results[-1]["loaded"]
+    }
+    if "--json" in sys.argv:
+        print(json.dumps(summary))
+        return
+
+    print(f"--- Cold Start Benchmark ({runs} fresh interpreters, Python {summary['python']}) ---")
+    print(f"import api.index         | median {summary['import_ms_median']:7.1f}ms")
+    print(f"time to first /health    | median {summary['first_health_ms_median']:7.1f}ms (status {summary['health_status']})")
+    loaded = ", ".join(summary["deferred_modules_loaded"]) or "none"
+    print(f"deferred modules loaded  | {loaded}")
+
+
+if __name__ == "__main__":
+    main()
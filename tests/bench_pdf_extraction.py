@@ -0,0 +1,64 @@
+"""
+Benchmark: serial vs page-parallel PDF extraction.
+
+Usage: python tests/bench_pdf_extraction.py [workers]
+"""
+import asyncio
+import os
+import sys
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from app.services.pdf_executor import PDFExtractionExecutor
+from app.services.pdf_processor import extract_pages_job
+from pdf_fixtures import make_text_pdf
+
+PAGE_COUNTS = [10, 100, 500]
+
+
+async def run_serial(executor: PDFExtractionExecutor, content: bytes) -> str:
+    return await executor.run(extract_pages_job, content)
+
+
+async def run_parallel(executor: PDFExtractionExecutor, content: bytes) -> str:
+    return await executor.extract_content(content)
+
+
+def timed(coro_factory, executor, content):
+    start = time.perf_counter()
+    text = asyncio.run(coro_factory(executor, content))
+    return text, (time.perf_counter() - start) * 1000
+
+
+def main():
+    workers = int(sys.argv[1]) if len(sys.argv) > 1 else (os.cpu_count() or 2)
+    executor = PDFExtractionExecutor(
+        pool_size=workers,
+        max_pending=workers * 4,
+        job_timeout=600,
+        parallel_page_threshold=1,
+        min_pages_per_shard=5,
+        early_exit=False
+    )
+    print(f"--- PDF Extraction Benchmark ({workers} workers) ---")
+    try:
+        # Warm the pool so process start-up is not billed to the first run
+        asyncio.run(run_serial(executor, make_text_pdf(1)))
+        for pages in PAGE_COUNTS:
+            content = make_text_pdf(pages)
+            serial_text, serial_ms = timed(run_serial, executor, content)
+            parallel_text, parallel_ms = timed(run_parallel, executor, content)
+            assert serial_text == parallel_text, f"{pages} pages: parallel output differs from serial"
+            print(
+                f"{pages:>4} pages | serial {serial_ms:9.1f}ms | parallel {parallel_ms:9.1f}ms "
+                f"| speedup {serial_ms / parallel_ms:4.2f}x | identical output"
+            )
+    finally:
+        executor.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Benchmark: structured ReviewContext vs the legacy marker-string round trip on ~100 KB inputs.
+
+Usage: python tests/bench_review_context.py [iterations]
+"""
+import json
+import os
+import sys
+import time
+import tracemalloc
+import uuid
+from datetime import datetime
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from app.models.review_context import ReviewContext
+from app.models.schemas import Task
+from app.services.review_engine import ReviewEngine
+
+DESCRIPTION = "Objective: deliver the ingestion pipeline described in the attached design document. " * 3
+REPO_METRICS = {
+    "repo_name": "octo/pipeline", "default_branch": "main", "commit_count": 120, "has_readme": True,
+    "has_tests": True, "file_count": 240, "languages": ["Python", "Shell"], "stars": 12, "forks": 3,
+    "is_private": False, "last_updated": "2026-02-14T12:00:00Z"
+}
+# Keep the combined legacy string under TaskBase's 100000 character limit
+PDF_TEXT = "# Architecture\n" + ("The service streams records into partitioned storage. " * 1800)[:98000]
+
+
+def legacy_review(engine: ReviewEngine) -> dict:
+    final_description = DESCRIPTION
+    final_description += f"\n\n--- GitHub Repository Metrics ---\n{json.dumps(REPO_METRICS, indent=2)}"
+    final_description += f"\n\n--- Extracted PDF Content ---\n\n{PDF_TEXT}"
+    task = Task(
+        task_id="orch-" + str(uuid.uuid4())[:8],
+        task_title="Review: benchmark",
+        task_description=final_description,
+        submitted_by="Bench",
+        timestamp=datetime.now()
+    )
+    return engine.evaluate(task.model_dump())
+
+
+def context_review(engine: ReviewEngine) -> dict:
+    context = ReviewContext(description=DESCRIPTION.strip(), repo_metrics=REPO_METRICS, pdf_text=PDF_TEXT)
+    return engine.evaluate_context(context)
+
+
+def measure(fn, engine, iterations):
+    fn(engine)  # warm up
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn(engine)
+    elapsed_ms = (time.perf_counter() - start) * 1000 / iterations
+
+    tracemalloc.start()
+    fn(engine)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed_ms, peak
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    engine = ReviewEngine()
+    assert legacy_review(engine) == context_review(engine), "paths disagree"
+
+    size_kb = (len(DESCRIPTION) + len(json.dumps(REPO_METRICS)) + len(PDF_TEXT)) / 1024
+    print(f"--- ReviewContext Benchmark ({size_kb:.0f} KB input, {iterations} iterations) ---")
+    legacy_ms, legacy_peak = measure(legacy_review, engine, iterations)
+    context_ms, context_peak = measure(context_review, engine, iterations)
+    print(f"legacy marker string | {legacy_ms:7.3f}ms/review | peak alloc {legacy_peak / 1024:8.1f} KB")
+    print(f"structured context   | {context_ms:7.3f}ms/review | peak alloc {context_peak / 1024:8.1f} KB")
+    print(f"saved                | {legacy_ms - context_ms:7.3f}ms/review | {(legacy_peak - context_peak) / 1024:8.1f} KB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+import threading
+import time
+import types
+import pytest
+from app.services import tts_integration
+from app.services.tts_integration import tts_audio_cache
+
+
+@pytest.fixture
+def fake_tts(monkeypatch):
+    """
+    Replaces the VaaniTTS service with an in-process fake and yields its state.
+
+    Tests may swap "encode" (text -> audio bytes, "offline_encode" for the
+    pyttsx3 path), "delay" (text -> seconds),
+    "translation_fails" ((text, language) -> bool) and set "gate" to an Event
+    that texts matching "gated" wait on.
+    """
+    state = {
+        "active": 0, "max_active": 0, "calls": [],
+        "encode": lambda text: b"ID3" + text.encode(),
+        "offline_encode": lambda text: b"RIFF\xff\xff\xff\xffWAVEfmt " + b"\x00" * 20 + b"data\xff\xff\xff\xff" + text.encode(),
+        "delay": lambda text: 0,
+        "translation_fails": lambda text, language: False,
+        "gate": None, "gated": lambda text: True
+    }
+    lock = threading.Lock()
+
+    def text_to_speech_stream(text, language="en", use_google_tts=True, report=False):
+        with lock:
+            state["active"] += 1
+            state["max_active"] = max(state["max_active"], state["active"])
+            state["calls"].append((text, language))
+        try:
+            if state["gate"] is not None and state["gated"](text):
+                state["gate"].wait(5)
+            time.sleep(state["delay"](text))
+            audio = state["encode" if use_google_tts else "offline_encode"](text)
+            return (audio, state["translation_fails"](text, language)) if report else audio
+        finally:
+            with lock:
+                state["active"] -= 1
+
+    service = types.SimpleNamespace(
+        text_to_speech_stream=text_to_speech_stream,
+        remove_emojis=lambda text: " ".join(text.replace("\U0001F600", "").split())
+    )
+    monkeypatch.setattr(tts_integration, "_load_tts", lambda: service)
+    monkeypatch.setattr("app.api.tts.is_tts_available", lambda: True)
+    tts_audio_cache.clear()
+    yield state
+    tts_audio_cache.clear()
@@ -19,6 +19,24 @@ def test_submit_valid_task():
     assert response.status_code == 200
     assert "task_id" in response.json()
 
+def test_submit_batch_uses_one_store_write(monkeypatch):
+    from app.models import storage
+    batches = []
+    original = storage.task_storage.put_many
+    monkeypatch.setattr(storage.task_storage, "put_many", lambda entries: batches.append(list(entries)) or original(batches[-1]))
+    payload = {
+        "task_title": "Implement Async Data Pipeline",
+        "task_description": "Requirement: Connect to API. Objective: Pipeline data to database.",
+        "submitted_by": "Test User"
+    }
+    response = client.post("/api/v1/task/submit/batch", json={"tasks": [payload, {**payload, "submitted_by": "Other User"}]})
+    assert response.status_code == 200
+    tasks = response.json()
+    assert [task["submitted_by"] for task in tasks] == ["Test User", "Other User"]
+    assert len(batches) == 1 and len(batches[0]) == 2
+    review = client.post("/api/v1/task/review", json={"task_id": tasks[1]["task_id"]})
+    assert review.status_code == 200
+
 def test_full_review_flow():
     # 1. Submit
     payload = {
@@ -0,0 +1,243 @@
+import asyncio
+import base64
+import json
+import pytest
+import httpx
+from datetime import datetime
+from fastapi.testclient import TestClient
+from app.main import app
+from app.models.schemas import Task
+from app.models.storage import task_storage
+from app.models.review_context import ReviewContext
+from app.models.orchestration import BatchReviewItem
+from app.services.review_engine import ReviewEngine
+from app.services.pdf_processor import pdf_text_cache
+from app.services.repo_analyzer import AsyncRepoAnalyzer, RepoAnalyzer
+from app.services.repo_metrics_cache import repo_metrics_cache
+from app.services.review_cache import review_cache
+from pdf_fixtures import make_text_pdf
+
+client = TestClient(app)
+
+DESCRIPTION = "A detailed project explanation covering architecture, testing and deployment."
+
+
+@pytest.fixture(autouse=True)
+def clean_caches():
+    for cache in (repo_metrics_cache, pdf_text_cache, review_cache):
+        cache.clear()
+    yield
+    for cache in (repo_metrics_cache, pdf_text_cache, review_cache):
+        cache.clear()
+
+
+def mock_github(monkeypatch, seen):
+    def handler(request):
+        seen.append(request.url.path)
+        if request.url.path.endswith("/languages"):
+            return httpx.Response(200, json={"Python": 100})
+        if request.url.path.endswith("/commits"):
+            return httpx.Response(200, json=[{}], headers={"Link": '<https://api.github.com/x?page=30>; rel="last"'})
+        if "/git/trees" in request.url.path:
+            return httpx.Response(200, json={"tree": [{"path": "README.md", "type": "blob"}]})
+        if request.url.path == "/repos/octo/missing":
+            return httpx.Response(404, json={})
+        return httpx.Response(200, json={"full_name": "octo/app", "default_branch": "main"})
+
+    http_client = httpx.AsyncClient(base_url=RepoAnalyzer.BASE_URL, transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(AsyncRepoAnalyzer, "get_client", classmethod(lambda cls: http_client))
+
+
+def test_batch_preserves_order_and_reports_item_errors():
+    task_storage["batch-task"] = {"task": Task(
+        task_id="batch-task",
+        task_title="Stored Task",
+        task_description=DESCRIPTION,
+        submitted_by="tester",
+        timestamp=datetime.now()
+    )}
+    response = client.post("/api/v1/task/review/batch", json={"items": [
+        {"task_id": "batch-task"},
+        {"task_id": "does-not-exist"},
+        {"payload": {"task_title": "Inline Task", "task_description": DESCRIPTION, "submitted_by": "tester"}},
+        {"payload": {"task_title": "x"}},
+        {}
+    ]})
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [r["index"] for r in results] == [0, 1, 2, 3, 4]
+    assert results[0]["result"]["review"]["score"] == results[2]["result"]["review"]["score"]
+    assert results[1]["error"]["status_code"] == 404
+    assert results[3]["error"]["status_code"] == 400
+    assert results[4]["error"]["status_code"] == 400
+    assert results[0]["error"] is None
+
+
+def test_batch_matches_single_review():
+    single = client.post("/api/v1/task/review", data={"description": DESCRIPTION}).json()
+    review_cache.clear()
+    batch = client.post("/api/v1/task/review/batch", json={"items": [{"description": DESCRIPTION}]}).json()
+    assert batch["results"][0]["result"]["review"] == single
+
+
+def test_batch_dedupes_repo_and_pdf_work(monkeypatch):
+    seen = []
+    mock_github(monkeypatch, seen)
+    pdf = base64.b64encode(make_text_pdf(3)).decode()
+    extractions = []
+
+    from app.services.pdf_executor import pdf_executor
+    real_extract_content = pdf_executor.extract_content
+
+    async def counting_extract_content(content):
+        extractions.append(len(content))
+        return await real_extract_content(content)
+
+    monkeypatch.setattr(pdf_executor, "extract_content", counting_extract_content)
+
+    item = {"description": DESCRIPTION, "github_url": "https://github.com/octo/app", "pdf_base64": pdf}
+    response = client.post("/api/v1/task/review/batch", json={"items": [
+        item,
+        {**item, "github_url": "https://github.com/Octo/App"},
+        {"description": DESCRIPTION, "github_url": "https://github.com/octo/missing"}
+    ]})
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert results[0]["result"]["review"] == results[1]["result"]["review"]
+    assert results[2]["error"]["status_code"] == 404
+    assert len(extractions) == 1
+    assert seen.count("/repos/octo/app") == 1
+
+
+def test_batch_rejects_invalid_pdf_per_item():
+    response = client.post("/api/v1/task/review/batch", json={"items": [
+        {"description": DESCRIPTION, "pdf_base64": "not base64!"},
+        {"description": DESCRIPTION, "pdf_base64": base64.b64encode(b"not a pdf").decode()},
+        {"description": DESCRIPTION}
+    ]})
+    results = response.json()["results"]
+    assert results[0]["error"]["status_code"] == 400
+    assert results[1]["error"]["status_code"] == 400
+    assert results[2]["result"] is not None
+
+
+def test_batch_size_limit(monkeypatch):
+    from app.api import task_review
+    monkeypatch.setattr(task_review, "BATCH_MAX_ITEMS", 2)
+    response = client.post("/api/v1/task/review/batch", json={"items": [{"description": DESCRIPTION}] * 3})
+    assert response.status_code == 413
+
+
+def test_batch_pdf_bytes_are_limited_and_budgeted(monkeypatch):
+    from app.api import task_review
+    from app.services.upload_spool import upload_spooler
+    pdf = base64.b64encode(make_text_pdf(1)).decode()
+    item = {"description": DESCRIPTION, "pdf_base64": pdf}
+
+    monkeypatch.setattr(task_review, "BATCH_MAX_PDF_BYTES", len(pdf))
+    assert client.post("/api/v1/task/review/batch", json={"items": [item, item]}).status_code == 413
+
+    reserved = []
+    real_acquire = upload_spooler.budget.acquire
+    monkeypatch.setattr(upload_spooler.budget, "acquire", lambda size: reserved.append(size) or real_acquire(size))
+    assert client.post("/api/v1/task/review/batch", json={"items": [item]}).status_code == 200
+    assert client.post("/api/v1/task/review/batch/stream", json={"items": [item]}).status_code == 200
+    assert reserved == [len(pdf) * 3 // 4] * 2
+    assert upload_spooler.budget.stats()["in_flight_bytes"] == 0
+
+
+def test_evaluate_many_scores_identical_contexts_once(monkeypatch):
+    engine = ReviewEngine()
+    calls = []
+    real = engine.evaluate_context
+    monkeypatch.setattr(engine, "evaluate_context", lambda context: calls.append(context) or real(context))
+
+    contexts = [
+        ReviewContext(description=DESCRIPTION, repo_metrics={"commit_count": 5, "file_count": 3}),
+        ReviewContext(description=DESCRIPTION, repo_metrics={"file_count": 3, "commit_count": 5}),
+        ReviewContext(description="short")
+    ]
+    results = engine.evaluate_many(contexts)
+    assert len(calls) == 2
+    assert results[0] == results[1] == real(contexts[0])
+    assert results[2] == real(contexts[2])
+
+
+def make_orchestrator():
+    from app.core.dependencies import get_review_engine
+    from app.services.review_orchestrator import ReviewOrchestrator
+    from app.services.sequential_task_generator import SequentialTaskGenerator
+    return ReviewOrchestrator(get_review_engine(), SequentialTaskGenerator())
+
+
+def test_stream_emits_ndjson_with_indices(monkeypatch):
+    seen = []
+    mock_github(monkeypatch, seen)
+    with client.stream("POST", "/api/v1/task/review/batch/stream", json={"items": [
+        {"description": DESCRIPTION, "github_url": "https://github.com/octo/app"},
+        {"task_id": "does-not-exist"},
+        {"description": DESCRIPTION, "github_url": "https://github.com/octo/app"}
+    ]}) as response:
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        lines = [json.loads(line) for line in response.iter_lines() if line]
+
+    by_index = {line["index"]: line for line in lines}
+    assert sorted(by_index) == [0, 1, 2]
+    assert by_index[1]["error"]["status_code"] == 404
+    first, second = by_index[0]["result"]["review"], by_index[2]["result"]["review"]
+    assert first["score"] == second["score"] and first["analysis"] == second["analysis"]
+    # Both items share one analysis of the repository
+    assert seen.count("/repos/octo/app") == 1
+
+
+def test_stream_bounds_in_flight_and_yields_in_completion_order(monkeypatch):
+    orchestrator = make_orchestrator()
+    delays = {"https://github.com/octo/slow": 0.2, "https://github.com/octo/fast": 0.0}
+    running = []
+    peak = []
+
+    async def fake_fetch(url):
+        running.append(url)
+        peak.append(len(running))
+        await asyncio.sleep(delays.get(url, 0.01))
+        running.remove(url)
+        return {}
+
+    monkeypatch.setattr(orchestrator, "fetch_repo_metrics", fake_fetch)
+    items = [BatchReviewItem(description=DESCRIPTION, github_url="https://github.com/octo/slow"),
+             BatchReviewItem(description=DESCRIPTION, github_url="https://github.com/octo/fast")]
+    items += [BatchReviewItem(description=DESCRIPTION, github_url=f"https://github.com/octo/r{i}") for i in range(6)]
+
+    async def consume():
+        results = []
+        async for item_result in orchestrator.review_stream(items, task_storage.get, max_in_flight=2):
+            results.append(item_result)
+        return [r.index for r in results], results
+
+    order, results = asyncio.run(consume())
+    assert sorted(order) == list(range(8))
+    assert all(r.error is None and r.result.review.score > 0 for r in results)
+    assert order[0] == 1
+    assert max(peak) <= 2
+
+
+def test_stream_does_not_start_work_ahead_of_a_slow_reader(monkeypatch):
+    orchestrator = make_orchestrator()
+    started = []
+
+    async def fake_fetch(url):
+        started.append(url)
+        return {}
+
+    monkeypatch.setattr(orchestrator, "fetch_repo_metrics", fake_fetch)
+    items = [BatchReviewItem(description=DESCRIPTION, github_url=f"https://github.com/octo/r{i}") for i in range(10)]
+
+    async def read_one():
+        stream = orchestrator.review_stream(items, task_storage.get, max_in_flight=3)
+        await stream.__anext__()
+        await asyncio.sleep(0.05)
+        await stream.aclose()
+
+    asyncio.run(read_one())
+    assert len(started) == 3
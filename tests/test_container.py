@@ -0,0 +1,106 @@
+import pytest
+from fastapi.testclient import TestClient
+from app.core.container import AppContainer
+from app.core.engine_registry import EngineRegistry
+from app.core.warmup import Warmup
+from app.main import app
+from app.models.review_context import ReviewContext
+from app.services.review_cache import review_cache
+from app.services.review_engine import ReviewEngine
+
+client = TestClient(app)
+
+CONTEXT = ReviewContext(description="Objective: verify engine swaps keep in-flight reviews consistent.")
+
+
+class FixedEngine(ReviewEngine):
+    VERSION = "fixed"
+
+    def evaluate_context(self, context):
+        result = super().evaluate_context(context)
+        result["score"] = 42
+        return result
+
+
+@pytest.fixture
+def restore_engine():
+    original = EngineRegistry.get_engine()
+    review_cache.clear()
+    yield
+    EngineRegistry.register_engine(original)
+    review_cache.clear()
+
+
+def test_orchestrator_is_shared_between_requests():
+    container = AppContainer(warmup=Warmup(enabled=False))
+    assert container.review_orchestrator() is container.review_orchestrator()
+    assert container.review_orchestrator()._review_engine is EngineRegistry.get_engine()
+
+
+def test_engine_swap_does_not_touch_in_flight_orchestrators(restore_engine):
+    container = AppContainer(warmup=Warmup(enabled=False))
+    in_flight = container.review_orchestrator()
+    generation = EngineRegistry.generation()
+
+    EngineRegistry.register_engine(FixedEngine())
+
+    assert EngineRegistry.generation() == generation + 1
+    swapped = container.review_orchestrator()
+    assert swapped is not in_flight
+    assert swapped.evaluate(context=CONTEXT).score == 42
+    assert in_flight.evaluate(context=CONTEXT).score != 42
+
+
+def test_register_rejects_non_engines(restore_engine):
+    with pytest.raises(TypeError):
+        EngineRegistry.register_engine(object())
+
+
+def test_routes_use_the_swapped_engine(restore_engine):
+    EngineRegistry.register_engine(FixedEngine())
+    response = client.post("/api/v1/task/review", data={"description": CONTEXT.description})
+    assert response.status_code == 200
+    assert response.json()["score"] == 42
+    assert client.get("/health").json()["review_engine"]["engine"] == "FixedEngine"
+
+
+def test_lifespan_owns_the_container(monkeypatch):
+    monkeypatch.setattr("app.main.warmup", Warmup(enabled=False))
+    monkeypatch.delattr(app.state, "container", raising=False)
+    with TestClient(app) as lifespan_client:
+        container = app.state.container
+        lifespan_client.get("/health")
+        assert app.state.container is container
+    assert getattr(app.state, "container", None) is None
+
+
+@pytest.fixture
+def own_container(monkeypatch):
+    """Installs an AppContainer built from test doubles as the app's container."""
+    def install(**members):
+        container = AppContainer(warmup=Warmup(enabled=False), **members)
+        monkeypatch.setattr(app.state, "container", container, raising=False)
+        return container
+    return install
+
+
+def test_routes_use_the_container_task_store_and_cache(own_container):
+    from app.models.storage import LRUTaskStore, task_storage
+    from app.services.review_cache import ReviewResultCache
+
+    store = LRUTaskStore()
+    cache = ReviewResultCache(max_entries=10)
+    own_container(task_store=store, review_cache=cache)
+
+    task = client.post("/api/v1/task/submit", json={
+        "task_title": "Container Task", "task_description": "Objective: a task kept in the container's store.",
+        "submitted_by": "Container User"
+    }).json()
+    assert store.get(task["task_id"]) is not None
+    assert task_storage.get(task["task_id"]) is None
+
+    first = client.post("/api/v1/task/review", json={"task_id": task["task_id"]})
+    second = client.post("/api/v1/task/review", json={"task_id": task["task_id"]})
+    assert first.status_code == second.status_code == 200
+    assert second.json()["meta"]["cached"] is True
+    assert cache.stats()["hits"] == 1
@@ -30,8 +30,8 @@ def test_repeated_call_determinism():
     # Consistent PDF content
     pdf_content = b"%PDF-1.4\n1 0 obj\n<< /Type /Catalog /Pages 2 0 R >>\nendobj\n..." # Mock binary
     
-    with patch("app.services.repo_analyzer.RepoAnalyzer.analyze_repo", return_value=mock_metrics), \
-         patch("app.services.pdf_processor.PDFProcessor.extract_text", return_value="Objective: High quality project document.\nStructured Heading\n" + "Word " * 100):
+    with patch("app.services.repo_analyzer.AsyncRepoAnalyzer.analyze_repo", return_value=mock_metrics), \
+         patch("app.services.pdf_executor.PDFExtractionExecutor.extract", return_value="Objective: High quality project document.\nStructured Heading\n" + "Word " * 100):
         
         results = []
         for i in range(5):
@@ -5,29 +5,29 @@ import io
 
 client = TestClient(app)
 
+def mock_github(monkeypatch, handler):
+    import httpx
+    from app.services.repo_analyzer import AsyncRepoAnalyzer, RepoAnalyzer
+
+    client = httpx.AsyncClient(base_url=RepoAnalyzer.BASE_URL, transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(AsyncRepoAnalyzer, "get_client", classmethod(lambda cls: client))
+
 def test_github_review_valid(monkeypatch):
-    import requests
-    
-    class MockResponse:
-        def __init__(self, json_data, status_code, headers=None):
-            self.json_data = json_data
-            self.status_code = status_code
-            self.headers = headers or {}
-        def json(self): return self.json_data
-        def raise_for_status(self): pass
-
-    def mock_get(url, *args, **kwargs):
+    import httpx
+
+    def handler(request):
+        url = str(request.url)
         if "/repos/fastapi/fastapi/languages" in url:
-            return MockResponse({"Python": 100}, 200)
+            return httpx.Response(200, json={"Python": 100})
         if "/repos/fastapi/fastapi/commits" in url:
-            return MockResponse([{}], 200, {"Link": 'page=50>; rel="last"'})
+            return httpx.Response(200, json=[{}], headers={"Link": 'page=50>; rel="last"'})
         if "/git/trees" in url:
-            return MockResponse({"tree": [{"path": "README.md", "type": "blob"}]}, 200)
+            return httpx.Response(200, json={"tree": [{"path": "README.md", "type": "blob"}]})
         if "/repos/fastapi/fastapi" in url:
-            return MockResponse({"full_name": "fastapi/fastapi", "default_branch": "master", "stargazers_count": 10}, 200)
-        return MockResponse({}, 404)
+            return httpx.Response(200, json={"full_name": "fastapi/fastapi", "default_branch": "master", "stargazers_count": 10})
+        return httpx.Response(404, json={})
 
-    monkeypatch.setattr(requests, "get", mock_get)
+    mock_github(monkeypatch, handler)
 
     response = client.post(
         "/api/v1/task/review",
@@ -41,6 +41,36 @@ def test_github_review_valid(monkeypatch):
     assert "status" in data
     assert "analysis" in data
 
+def test_async_repo_analyzer_metrics(monkeypatch):
+    import asyncio
+    import httpx
+    from app.services.repo_analyzer import AsyncRepoAnalyzer
+
+    seen = []
+
+    def handler(request):
+        seen.append(request.url.path)
+        if request.url.path.endswith("/languages"):
+            return httpx.Response(200, json={"Python": 100})
+        if request.url.path.endswith("/commits"):
+            return httpx.Response(200, json=[{}], headers={"Link": '<https://api.github.com/x?page=42>; rel="last"'})
+        if "/git/trees/dev" in request.url.path:
+            return httpx.Response(200, json={"tree": [
+                {"path": "README.md", "type": "blob"},
+                {"path": "tests", "type": "tree"}
+            ]})
+        return httpx.Response(200, json={"full_name": "octo/demo", "default_branch": "dev"})
+
+    mock_github(monkeypatch, handler)
+
+    metrics = asyncio.run(AsyncRepoAnalyzer.analyze_repo("https://github.com/octo/demo"))
+    assert seen[0] == "/repos/octo/demo"
+    assert len(seen) == 4
+    assert metrics["commit_count"] == 42
+    assert metrics["has_readme"] and metrics["has_tests"]
+    assert metrics["file_count"] == 1
+    assert metrics["languages"] == ["Python"]
+
 def test_github_review_invalid_url():
     response = client.post(
         "/api/v1/task/review",
@@ -63,12 +93,9 @@ def test_github_review_missing_description():
     assert "Description is required" in response.json()["detail"]
 
 def test_github_review_not_found(monkeypatch):
-    import requests
-    class MockResponse:
-        def __init__(self, status_code): self.status_code = status_code
-        def json(self): return {}
-    
-    monkeypatch.setattr(requests, "get", lambda *args, **kwargs: MockResponse(404))
+    import httpx
+
+    mock_github(monkeypatch, lambda request: httpx.Response(404, json={}))
 
     response = client.post(
         "/api/v1/task/review",
@@ -0,0 +1,48 @@
+import json
+import os
+import subprocess
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFERRED_MODULES = ["pdfplumber", "pdfminer", "requests", "httpx", "tts_service", "pyttsx3", "multiprocessing"]
+
+
+def loaded_after(code: str) -> list:
+    """Runs code in a fresh interpreter and returns the deferred modules it loaded."""
+    script = (
+        "import json, sys\n"
+        f"{code}\n"
+        f"print(json.dumps([m for m in {DEFERRED_MODULES!r} if m in sys.modules]))"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", script], cwd=ROOT_DIR, capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def test_app_import_skips_heavy_subsystems():
+    assert loaded_after("import app.main") == []
+
+
+def test_health_skips_heavy_subsystems():
+    # TestClient itself is built on httpx
+    assert loaded_after(
+        "from fastapi.testclient import TestClient\n"
+        "from app.main import app\n"
+        "assert TestClient(app).get('/health').status_code == 200"
+    ) == ["httpx"]
+
+
+def test_subsystems_load_on_first_use():
+    assert "pdfplumber" in loaded_after(
+        "from app.services.pdf_processor import extract_pages_job\n"
+        "try:\n"
+        "    extract_pages_job(b'not a pdf')\n"
+        "except RuntimeError:\n"
+        "    pass"
+    )
+    assert "tts_service" in loaded_after(
+        "from app.services.tts_integration import is_tts_available\n"
+        "is_tts_available()"
+    )
@@ -0,0 +1,103 @@
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+from app.main import app
+from app.core import metrics
+from app.services.repo_analyzer import AsyncRepoAnalyzer, RepoAnalyzer
+from app.services.repo_metrics_cache import repo_metrics_cache
+from app.services.review_cache import review_cache
+
+pytestmark = pytest.mark.skipif(not metrics.METRICS_AVAILABLE, reason="prometheus_client not installed")
+
+client = TestClient(app)
+
+DESCRIPTION = "Objective: expose review pipeline metrics for dashboards and alerts."
+
+
+def sample(name, labels=None):
+    from prometheus_client import REGISTRY
+    return REGISTRY.get_sample_value(name, labels or {}) or 0
+
+
+def test_requests_are_counted_per_router():
+    before = sample("task_review_http_requests_total", {"router": "task_review", "method": "POST", "status": "200"})
+    client.post("/api/v1/task/review", data={"description": DESCRIPTION})
+    after = sample("task_review_http_requests_total", {"router": "task_review", "method": "POST", "status": "200"})
+    assert after == before + 1
+    assert sample("task_review_http_request_duration_seconds_count", {"router": "task_review"}) >= 1
+
+
+def test_metrics_endpoint_exposes_pipeline_series(monkeypatch):
+    review_cache.clear()
+    repo_metrics_cache.clear()
+
+    def handler(request):
+        headers = {"X-RateLimit-Remaining": "4321"}
+        if request.url.path.endswith("/languages"):
+            return httpx.Response(200, json={}, headers=headers)
+        if request.url.path.endswith("/commits"):
+            return httpx.Response(200, json=[{}], headers=headers)
+        if "/git/trees" in request.url.path:
+            return httpx.Response(200, json={"tree": []}, headers=headers)
+        return httpx.Response(200, json={"default_branch": "main"}, headers=headers)
+
+    http_client = httpx.AsyncClient(base_url=RepoAnalyzer.BASE_URL, transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(AsyncRepoAnalyzer, "get_client", classmethod(lambda cls: http_client))
+
+    client.post("/api/v1/task/review", data={"description": DESCRIPTION, "github_url": "https://github.com/octo/metrics"})
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    body = response.text
+    assert 'task_review_github_requests_total{endpoint="metadata",status="200"}' in body
+    assert "task_review_github_rate_limit_remaining 4321.0" in body
+    assert "task_review_score_bucket" in body
+    assert "task_review_task_store_entries" in body
+    assert "task_review_pdf_bytes_total" in body
+
+
+def test_pdf_bytes_and_pages_are_recorded():
+    from pdf_fixtures import make_text_pdf
+    from app.services.pdf_processor import pdf_text_cache
+
+    pdf_text_cache.clear()
+    pdf = make_text_pdf(2)
+    bytes_before = sample("task_review_pdf_bytes_total")
+    pages_before = sample("task_review_pdf_pages_total")
+    client.post("/api/v1/task/review", data={"description": DESCRIPTION},
+                files={"pdf_file": ("doc.pdf", pdf, "application/pdf")})
+    assert sample("task_review_pdf_bytes_total") == bytes_before + len(pdf)
+    assert sample("task_review_pdf_pages_total") >= pages_before + 1
+
+
+def test_recorders_are_noops_without_prometheus(monkeypatch):
+    import app.main as main
+    monkeypatch.setattr(metrics, "METRICS_AVAILABLE", False)
+    monkeypatch.setattr(main, "METRICS_AVAILABLE", False)
+    metrics.record_pdf(10, 1)
+    metrics.record_review(50, "borderline")
+    assert client.get("/metrics").status_code == 503
+
+
+@pytest.mark.parametrize("backend", ["memory", "lru"])
+def test_task_store_series_follow_writes_without_a_scrape(backend):
+    from test_task_store import make_entry
+    from app.models.storage import LimitedStorage, LRUTaskStore
+
+    store = LimitedStorage(limit=2) if backend == "memory" else LRUTaskStore(max_entries=2)
+    evictions_before = sample("task_review_task_store_evictions_total")
+    for i in range(5):
+        store[f"t{i}"] = make_entry(f"t{i}")
+
+    assert sample("task_review_task_store_entries") == 2
+    assert sample("task_review_task_store_evictions_total") == evictions_before + 3
+    assert store.stats()["evictions"] == 3
+
+
+def test_sqlite_store_reports_entries_and_evictions(tmp_path):
+    from test_task_store import make_entry
+    from app.models.storage import SQLiteTaskStore
+
+    store = SQLiteTaskStore(str(tmp_path / "tasks.sqlite3"))
+    store.put_many([(f"t{i}", make_entry(f"t{i}")) for i in range(3)])
+    assert sample("task_review_task_store_entries") == 3
+    assert store.stats()["evictions"] == 0
@@ -0,0 +1,81 @@
+import io
+import pytest
+from app.services import pdf_processor
+from app.services.blob_cache import TieredBlobCache
+from app.services.pdf_processor import PDFProcessor
+
+class MockUploadFile:
+    def __init__(self, filename, content):
+        self.filename = filename
+        self.file = io.BytesIO(content)
+
+def test_memory_tier_evicts_by_total_bytes():
+    cache = TieredBlobCache("test", max_memory_bytes=10)
+    cache.put("a", b"12345")
+    cache.put("b", b"12345")
+    cache.get("a")  # refresh recency of "a"
+    cache.put("c", b"123")
+
+    assert cache.get("a") == b"12345"
+    assert cache.get("b") is None
+    stats = cache.stats()
+    assert stats["evictions"] == 1
+    assert stats["memory_bytes"] == 8
+
+def test_disk_tier_survives_new_instance(tmp_path):
+    TieredBlobCache("test", max_memory_bytes=1024, disk_dir=str(tmp_path)).put("ab12", b"persisted")
+
+    fresh = TieredBlobCache("test", max_memory_bytes=1024, disk_dir=str(tmp_path))
+    assert fresh.get("ab12") == b"persisted"
+    assert fresh.stats()["disk_hits"] == 1
+
+def test_disk_tier_is_pruned(tmp_path):
+    cache = TieredBlobCache("test", max_memory_bytes=0, disk_dir=str(tmp_path), max_disk_bytes=64, compress=False)
+    cache.put("aa01", b"x" * 40)
+    cache.put("aa02", b"y" * 40)
+    assert cache.get("aa01") is None
+    assert cache.get("aa02") == b"y" * 40
+
+def test_disk_writes_do_not_rescan_until_over_the_limit(tmp_path, monkeypatch):
+    from app.services import blob_cache
+    walks = []
+    real_walk = blob_cache.os.walk
+    monkeypatch.setattr(blob_cache.os, "walk", lambda top: walks.append(top) or real_walk(top))
+    cache = TieredBlobCache("test", max_memory_bytes=0, disk_dir=str(tmp_path), max_disk_bytes=1000, compress=False)
+
+    for i in range(9):
+        cache.put(f"ab{i:02d}", b"x" * 100)
+    cache.put("ab00", b"y" * 100)  # overwriting does not grow the tracked size
+    assert len(walks) == 1
+
+    cache.put("ab09", b"x" * 100)
+    cache.put("ab10", b"x" * 100)
+    assert len(walks) == 2
+    # Pruned below the limit, to the target ratio
+    assert cache._disk_bytes == 900
+    assert cache.get("ab10") == b"x" * 100
+
+def test_extract_text_reuses_cached_result(monkeypatch):
+    monkeypatch.setattr(pdf_processor, "pdf_text_cache", TieredBlobCache("pdf_text", max_memory_bytes=1024))
+    calls = []
+
+    def fake_extract(source):
+        calls.append(source)
+        return "Objective: cached document"
+
+    monkeypatch.setattr(PDFProcessor, "_extract_pages", staticmethod(fake_extract))
+
+    first = PDFProcessor.extract_text(MockUploadFile("doc.pdf", b"%PDF-same-bytes"))
+    second = PDFProcessor.extract_text(MockUploadFile("copy.pdf", b"%PDF-same-bytes"))
+
+    assert first == second == "Objective: cached document"
+    assert len(calls) == 1
+
+def test_failed_extraction_is_not_cached(monkeypatch):
+    cache = TieredBlobCache("pdf_text", max_memory_bytes=1024)
+    monkeypatch.setattr(pdf_processor, "pdf_text_cache", cache)
+    monkeypatch.setattr(PDFProcessor, "_extract_pages", staticmethod(lambda source: ""))
+
+    with pytest.raises(Exception):
+        PDFProcessor.extract_text(MockUploadFile("scan.pdf", b"%PDF-image-only"))
+    assert cache.stats()["entries"] == 0
@@ -0,0 +1,116 @@
+import asyncio
+import io
+import threading
+import time
+import pytest
+from fastapi import HTTPException
+from app.services.pdf_executor import PDFExtractionExecutor
+from app.services.pdf_processor import extract_pages_job
+
+def test_rejects_when_queue_is_saturated():
+    executor = PDFExtractionExecutor(pool_size=0, max_pending=0, job_timeout=5)
+    release = threading.Event()
+
+    async def scenario():
+        first = asyncio.ensure_future(executor.run(release.wait))
+        await asyncio.sleep(0.05)
+        with pytest.raises(HTTPException) as exc:
+            await executor.run(lambda: "never runs")
+        release.set()
+        await first
+        return exc.value
+
+    error = asyncio.run(scenario())
+    assert error.status_code == 503
+    assert executor.stats()["rejected"] == 1
+    assert executor.stats()["in_flight"] == 0
+
+def test_job_timeout_maps_to_504():
+    executor = PDFExtractionExecutor(pool_size=0, job_timeout=0.05)
+
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(executor.run(time.sleep, 0.5))
+    assert exc.value.status_code == 504
+    assert executor.stats()["timed_out"] == 1
+
+def test_timed_out_thread_job_keeps_slot_until_it_finishes():
+    executor = PDFExtractionExecutor(pool_size=0, max_pending=0, job_timeout=0.05)
+    release = threading.Event()
+
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(executor.run(release.wait))
+    assert exc.value.status_code == 504
+    assert executor.stats()["in_flight"] == 1
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(executor.run(lambda: "never runs"))
+    assert exc.value.status_code == 503
+
+    release.set()
+    executor.shutdown()
+    assert executor.stats()["in_flight"] == 0
+
+def test_pool_broken_before_submit_is_recycled():
+    from concurrent.futures.process import BrokenProcessPool
+
+    class DeadPool:
+        def submit(self, *args):
+            raise BrokenProcessPool("a worker died between jobs")
+
+        def shutdown(self, **kwargs):
+            pass
+
+    executor = PDFExtractionExecutor(pool_size=1, job_timeout=60)
+    executor._pool = DeadPool()
+    try:
+        with pytest.raises(HTTPException) as exc:
+            asyncio.run(executor.run(abs, -3))
+        assert exc.value.status_code == 503
+        assert executor._pool is None
+        assert executor.stats()["in_flight"] == 0
+        assert asyncio.run(executor.run(abs, -3)) == 3
+    finally:
+        executor.shutdown()
+
+def test_process_pool_extracts_text():
+    canvas = pytest.importorskip("reportlab.pdfgen.canvas")
+    buffer = io.BytesIO()
+    c = canvas.Canvas(buffer)
+    c.drawString(100, 750, "Objective: Run extraction in a worker process.")
+    c.save()
+
+    executor = PDFExtractionExecutor(pool_size=1, job_timeout=60, max_jobs_per_worker=1)
+    try:
+        text = asyncio.run(executor.run(extract_pages_job, buffer.getvalue()))
+    finally:
+        executor.shutdown()
+    assert "worker process" in text
+
+def test_corrupted_pdf_error_crosses_process_boundary():
+    executor = PDFExtractionExecutor(pool_size=1, job_timeout=60)
+    try:
+        with pytest.raises(RuntimeError):
+            asyncio.run(executor.run(extract_pages_job, b"not a pdf"))
+    finally:
+        executor.shutdown()
+
+def test_shard_pages_covers_every_page_once():
+    executor = PDFExtractionExecutor(pool_size=4, min_pages_per_shard=10)
+    assert executor.shard_pages(0, 95) == [(0, 24), (24, 48), (48, 72), (72, 95)]
+    assert executor.shard_pages(0, 15) == [(0, 15)]
+    assert executor.shard_pages(50, 70) == [(50, 60), (60, 70)]
+
+def test_page_parallel_output_matches_serial():
+    from pdf_fixtures import make_text_pdf
+
+    content = make_text_pdf(12, lines_per_page=5)
+    executor = PDFExtractionExecutor(pool_size=3, job_timeout=60, parallel_page_threshold=4, min_pages_per_shard=2, early_exit=False)
+
+    async def both():
+        return await executor.run(extract_pages_job, content), await executor.extract_content(content)
+
+    try:
+        serial, parallel = asyncio.run(both())
+    finally:
+        executor.shutdown()
+    assert serial == parallel
+    assert "SECTION 12 OVERVIEW" in parallel
@@ -0,0 +1,105 @@
+import asyncio
+import httpx
+import pytest
+from app.services import repo_analyzer
+from app.services.repo_analyzer import AsyncRepoAnalyzer, RepoAnalyzer
+from app.services.repo_metrics_cache import RepoMetricsCache
+
+REPO_URL = "https://github.com/octo/cached"
+
+def make_handler(calls):
+    bodies = {
+        "/repos/octo/cached": {"full_name": "octo/cached", "default_branch": "main"},
+        "/repos/octo/cached/languages": {"Python": 10},
+        "/repos/octo/cached/commits": [{}],
+        "/repos/octo/cached/git/trees/main": {"tree": [{"path": "README.md", "type": "blob"}]},
+    }
+
+    def handler(request):
+        path = request.url.path
+        etag = f'"{path}"'
+        calls.append((path, request.headers.get("If-None-Match")))
+        if request.headers.get("If-None-Match") == etag:
+            return httpx.Response(304)
+        headers = {"ETag": etag}
+        if path.endswith("/commits"):
+            headers["Link"] = '<https://api.github.com/x?page=12>; rel="last"'
+        return httpx.Response(200, json=bodies[path], headers=headers)
+
+    return handler
+
+@pytest.fixture
+def cache(monkeypatch):
+    cache = RepoMetricsCache(fresh_seconds=0)
+    monkeypatch.setattr(repo_analyzer, "repo_metrics_cache", cache)
+    return cache
+
+def use_transport(monkeypatch, handler):
+    client = httpx.AsyncClient(base_url=RepoAnalyzer.BASE_URL, transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(AsyncRepoAnalyzer, "get_client", classmethod(lambda cls: client))
+
+def test_revalidates_with_etag(cache, monkeypatch):
+    calls = []
+    use_transport(monkeypatch, make_handler(calls))
+
+    first = asyncio.run(AsyncRepoAnalyzer.analyze_repo(REPO_URL))
+    second = asyncio.run(AsyncRepoAnalyzer.analyze_repo(REPO_URL))
+
+    assert first == second
+    assert second["commit_count"] == 12
+    assert all(etag is not None for _, etag in calls[4:])
+    stats = cache.stats()
+    assert stats["misses"] == 4
+    assert stats["revalidated"] == 4
+    assert stats["entries"] == 4
+
+def test_fresh_entries_skip_network(cache, monkeypatch):
+    cache.fresh_seconds = 60
+    calls = []
+    use_transport(monkeypatch, make_handler(calls))
+
+    asyncio.run(AsyncRepoAnalyzer.analyze_repo(REPO_URL))
+    asyncio.run(AsyncRepoAnalyzer.analyze_repo(REPO_URL))
+
+    assert len(calls) == 4
+    assert cache.stats()["hits"] == 4
+
+def test_rate_limit_serves_stale_entry(cache, monkeypatch):
+    calls = []
+    use_transport(monkeypatch, make_handler(calls))
+    expected = asyncio.run(AsyncRepoAnalyzer.analyze_repo(REPO_URL))
+
+    use_transport(monkeypatch, lambda request: httpx.Response(403, json={}))
+    assert asyncio.run(AsyncRepoAnalyzer.analyze_repo(REPO_URL)) == expected
+    assert cache.stats()["stale"] == 4
+
+def test_size_bound_evicts_oldest_repo():
+    cache = RepoMetricsCache(max_repos=1)
+    ok = httpx.Response(200, json={}, headers={"ETag": '"a"'})
+    cache.resolve("a/one", "metadata", None, ok)
+    cache.resolve("b/two", "metadata", None, ok)
+    assert cache.lookup("a/one", "metadata") is None
+    assert cache.lookup("b/two", "metadata") is not None
+
+def test_ttl_expires_entries():
+    cache = RepoMetricsCache(ttl_seconds=-1)
+    cache.resolve("a/one", "metadata", None, httpx.Response(200, json={}, headers={"ETag": '"a"'}))
+    assert cache.lookup("a/one", "metadata") is None
+
+def test_loop_change_closes_previous_client():
+    async def get():
+        return AsyncRepoAnalyzer.get_client()
+
+    async def replace():
+        client = AsyncRepoAnalyzer.get_client()
+        await asyncio.sleep(0)
+        return client
+
+    old = asyncio.run(get())
+    new = asyncio.run(replace())
+    try:
+        assert new is not old
+        assert old.is_closed
+        assert not new.is_closed
+    finally:
+        asyncio.run(AsyncRepoAnalyzer.aclose())
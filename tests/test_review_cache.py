@@ -0,0 +1,98 @@
+import pytest
+from datetime import datetime
+from fastapi.testclient import TestClient
+from app.main import app
+from app.models.schemas import Task
+from app.models.storage import task_storage
+from app.models.review_context import ReviewContext
+from app.services.review_cache import ReviewResultCache, review_cache
+from app.services.review_engine import ReviewEngine
+from app.services.review_orchestrator import ReviewOrchestrator
+from app.services.sequential_task_generator import SequentialTaskGenerator
+
+client = TestClient(app)
+
+DESCRIPTION = "Objective: build a cached review pipeline with clear goals and requirements."
+
+
+@pytest.fixture(autouse=True)
+def clean_cache():
+    review_cache.clear()
+    yield
+    review_cache.clear()
+
+
+class CountingEngine(ReviewEngine):
+    def __init__(self):
+        self.calls = 0
+
+    def evaluate_context(self, context):
+        self.calls += 1
+        return super().evaluate_context(context)
+
+
+def test_fingerprint_is_canonical():
+    a = ReviewContext(description="d", repo_metrics={"a": 1, "b": 2}, pdf_text="p")
+    b = ReviewContext(description="d", repo_metrics={"b": 2, "a": 1}, pdf_text="p")
+    assert ReviewResultCache.fingerprint(a, "v1") == ReviewResultCache.fingerprint(b, "v1")
+    assert ReviewResultCache.fingerprint(a, "v1") != ReviewResultCache.fingerprint(a, "v2")
+    assert ReviewResultCache.fingerprint(a, "v1") != ReviewResultCache.fingerprint(
+        ReviewContext(description="d", repo_metrics={"a": 1, "b": 2}, pdf_text="q"), "v1"
+    )
+
+
+def test_task_and_context_paths_share_entries():
+    engine = CountingEngine()
+    orchestrator = ReviewOrchestrator(engine, SequentialTaskGenerator())
+    task = Task(task_id="t", task_title="Cached Task", task_description=DESCRIPTION,
+                submitted_by="tester", timestamp=datetime.now())
+
+    first = orchestrator.process_submission(task)
+    second = orchestrator.process_submission(context=ReviewContext(description=DESCRIPTION))
+    third = orchestrator.evaluate_many([ReviewContext(description=DESCRIPTION)])[0]
+
+    assert engine.calls == 1
+    assert first.review.meta.cached is False
+    assert second.review.meta.cached is True and third.meta.cached is True
+    assert second.review.score == first.review.score
+    assert second.next_task is not None
+    assert review_cache.stats()["hits"] == 2
+
+
+def test_version_bump_invalidates(monkeypatch):
+    engine = CountingEngine()
+    orchestrator = ReviewOrchestrator(engine, SequentialTaskGenerator())
+    context = ReviewContext(description=DESCRIPTION)
+    orchestrator.evaluate(context=context)
+    monkeypatch.setattr(CountingEngine, "VERSION", "next")
+    orchestrator.evaluate(context=context)
+    assert engine.calls == 2
+
+
+def test_cached_copies_are_isolated():
+    orchestrator = ReviewOrchestrator(ReviewEngine(), SequentialTaskGenerator())
+    context = ReviewContext(description=DESCRIPTION)
+    orchestrator.evaluate(context=context).failure_reasons.append("mutated")
+    assert "mutated" not in orchestrator.evaluate(context=context).failure_reasons
+
+
+def test_lru_bound():
+    cache = ReviewResultCache(max_entries=2)
+    output = ReviewOrchestrator(ReviewEngine(), SequentialTaskGenerator()).evaluate(context=ReviewContext(description=DESCRIPTION))
+    for key in ("a", "b", "a", "c"):
+        cache.put(key, output)
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_review_endpoint_reports_cache_hits():
+    task_storage["cache-task"] = {"task": Task(
+        task_id="cache-task", task_title="Cached Task", task_description=DESCRIPTION,
+        submitted_by="tester", timestamp=datetime.now()
+    )}
+    first = client.post("/api/v1/task/review", data={"task_id": "cache-task"}).json()
+    second = client.post("/api/v1/task/review", data={"task_id": "cache-task"}).json()
+    assert first["meta"]["cached"] is False
+    assert second["meta"]["cached"] is True
+    assert {k: v for k, v in first.items() if k != "meta"} == {k: v for k, v in second.items() if k != "meta"}
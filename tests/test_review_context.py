@@ -0,0 +1,36 @@
+from datetime import datetime
+from app.core.interfaces.review_engine_interface import ReviewEngineInterface
+from app.models.review_context import ReviewContext
+from app.models.schemas import Task
+from app.services.review_engine import ReviewEngine
+
+CONTEXT = ReviewContext(
+    description="Objective: build a reliable ingestion service with clear requirements and success criteria for the team.",
+    repo_metrics={"has_readme": True, "has_tests": False, "commit_count": 42, "file_count": 9, "languages": ["Python"]},
+    pdf_text=("# Design\n" + "detail " * 150).strip()
+)
+
+def test_legacy_round_trip():
+    parsed = ReviewContext.from_legacy_description(CONTEXT.to_legacy_description())
+    assert parsed.model_dump() == CONTEXT.model_dump()
+
+def test_context_and_legacy_paths_score_identically():
+    engine = ReviewEngine()
+    task = Task(
+        task_id="ctx-1",
+        task_title="Context Equivalence",
+        task_description=CONTEXT.to_legacy_description(),
+        submitted_by="Tester",
+        timestamp=datetime.now()
+    )
+    assert engine.evaluate_context(CONTEXT) == engine.evaluate(task.model_dump())
+
+def test_string_only_engine_receives_legacy_description():
+    class LegacyEngine(ReviewEngineInterface):
+        def evaluate(self, task: dict) -> dict:
+            self.seen = task["task_description"]
+            return {}
+
+    engine = LegacyEngine()
+    engine.evaluate_context(CONTEXT)
+    assert engine.seen == CONTEXT.to_legacy_description()
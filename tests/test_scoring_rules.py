@@ -0,0 +1,187 @@
+import json
+import os
+import pytest
+from app.models.review_context import ReviewContext
+from app.services import review_engine as review_engine_module
+from app.services.review_engine import ReviewEngine, StreamingPDFScorer
+from app.services.scoring_rules import DEFAULT_RULES_PATH, RulesError, ScoringRules, compile_rules
+
+
+def load_default_rules() -> dict:
+    with open(DEFAULT_RULES_PATH) as f:
+        return json.load(f)
+
+
+def write_rules(path, rules: dict):
+    path.write_text(json.dumps(rules))
+    # Force a visible mtime change even on coarse-grained filesystems
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture
+def rules_file(tmp_path):
+    path = tmp_path / "rules.json"
+    write_rules(path, load_default_rules())
+    return path
+
+
+def test_bundled_rules_match_legacy_scores():
+    plan = compile_rules(load_default_rules())
+
+    assert plan.score_pdf(False, 0, False) == (0, ["No PDF content provided."])
+    assert plan.score_pdf(True, 10, False) == (0, ["PDF content too brief.", "Missing structured headings in PDF."])
+    assert plan.score_pdf(True, 100, True) == (30, [])
+    assert plan.score_pdf(True, 500, True) == (40, [])
+
+    assert plan.score_repo({}) == (0, ["No repository metrics provided."])
+    assert plan.score_repo({"has_readme": True, "commit_count": 10, "file_count": 16}) == (
+        20, ["Missing tests directory.", "Low commit history (< 10 commits)."]
+    )
+    assert plan.score_repo({"has_readme": True, "has_tests": True, "commit_count": 11, "file_count": 16}) == (40, [])
+
+    assert plan.score_description("short") == (0, ["Description too short."])
+    assert plan.score_description("x" * 49) == (0, ["Description needs more detail.", "Missing clear objectives/requirements."])
+    assert plan.score_description("Our goal " + "x" * 41) == (15, [])
+    assert plan.score_description("Our goal " + "x" * 191) == (20, [])
+
+    assert (plan.pdf.max_points, plan.repo.max_points, plan.description.max_points) == (40, 40, 20)
+    assert plan.pdf_saturation == (500, True)
+
+
+def test_review_records_rules_version():
+    output = ReviewEngine.review_context(ReviewContext(description="Objective: ship it", repo_metrics={}, pdf_text=""))
+    assert output.meta.rules_version == load_default_rules()["version"]
+
+
+def test_reload_swaps_plan_atomically(rules_file):
+    rules = ScoringRules(str(rules_file), reload_interval=0)
+    before = rules.current()
+
+    updated = load_default_rules()
+    updated["version"] = "3.0.0"
+    updated["sections"]["pdf"]["criteria"][0]["tiers"][0] = {"op": ">=", "value": 300, "points": 30}
+    write_rules(rules_file, updated)
+
+    after = rules.reload()
+    assert rules.current() is after
+    assert after.version == "3.0.0"
+    assert after.fingerprint != before.fingerprint
+    assert after.score_pdf(True, 300, True) == (40, [])
+    assert after.pdf_saturation == (300, True)
+    # A review holding the old plan keeps scoring with it
+    assert before.score_pdf(True, 300, True) == (30, [])
+
+
+def test_changed_file_is_picked_up_after_interval(rules_file, monkeypatch):
+    rules = ScoringRules(str(rules_file), reload_interval=5)
+    updated = load_default_rules()
+    updated["version"] = "hot"
+    write_rules(rules_file, updated)
+
+    assert rules.current().version != "hot"
+    monkeypatch.setattr(rules, "_checked_at", rules._checked_at - 10)
+    assert rules.current().version == "hot"
+
+
+def test_invalid_file_keeps_current_plan(rules_file):
+    rules = ScoringRules(str(rules_file), reload_interval=0)
+    before = rules.current()
+
+    rules_file.write_text("{not json")
+    assert rules.reload() is before
+
+    broken = load_default_rules()
+    broken["sections"]["repo"]["criteria"][0]["feature"] = "stars"
+    write_rules(rules_file, broken)
+    assert rules.reload() is before
+
+
+@pytest.mark.parametrize("mutate", [
+    lambda r: r["sections"].pop("description"),
+    lambda r: r["sections"]["pdf"]["criteria"][0]["tiers"][0].update(op="~="),
+    lambda r: r["sections"]["description"]["requires"].pop("value"),
+    lambda r: r["sections"]["pdf"]["criteria"][0].update(tiers=[]),
+    lambda r: r.update(sections=list(r["sections"].values())),
+    lambda r: r["sections"]["repo"]["criteria"].__setitem__(0, "has_tests"),
+    lambda r: r["sections"]["pdf"]["criteria"][0].update(tiers=[30]),
+    lambda r: r["sections"]["pdf"].update(criteria={"feature": "word_count"}),
+    lambda r: r["sections"]["pdf"].update(requires="present"),
+    lambda r: r["sections"]["description"].update(keywords="goal"),
+])
+def test_compile_rejects_malformed_rules(mutate):
+    rules = load_default_rules()
+    mutate(rules)
+    with pytest.raises(RulesError):
+        compile_rules(rules)
+
+
+def test_malformed_file_keeps_current_plan_on_the_request_path(rules_file):
+    rules = ScoringRules(str(rules_file), reload_interval=0.01)
+    before = rules.current()
+    broken = load_default_rules()
+    broken["sections"] = list(broken["sections"].values())
+    write_rules(rules_file, broken)
+
+    rules._checked_at -= 1
+    assert rules.current() is before
+
+
+def test_non_monotonic_word_rules_disable_early_exit():
+    rules = load_default_rules()
+    rules["sections"]["pdf"]["criteria"][0]["tiers"] = [{"op": "<", "value": 50, "points": 30}]
+    plan = compile_rules(rules)
+
+    scorer = StreamingPDFScorer(plan)
+    assert not scorer.feed("# Heading\n" + "word " * 1000)
+    assert scorer.result() == (10, ["PDF content too brief."])
+
+
+def test_cache_version_follows_rules_file(rules_file, monkeypatch):
+    rules = ScoringRules(str(rules_file), reload_interval=0)
+    monkeypatch.setattr(review_engine_module, "scoring_rules", rules)
+    engine = ReviewEngine()
+    before = engine.cache_version()
+
+    updated = load_default_rules()
+    updated["sections"]["description"]["keywords"].append("scope")
+    write_rules(rules_file, updated)
+    rules.reload()
+
+    assert engine.cache_version() != before
+
+
+@pytest.mark.parametrize("tiers", [
+    # First match wins: 30 points at 600 words, 5 at 1200
+    [{"op": ">=", "value": 1000, "points": 5}, {"op": ">=", "value": 500, "points": 30}],
+    [{"op": ">=", "value": 100, "points": 20}, {"op": ">=", "value": 500, "points": 30}],
+    [{"op": ">=", "value": 500, "points": 20}, {"op": ">=", "value": 500, "points": 30}],
+])
+def test_out_of_order_word_tiers_disable_early_exit(tiers):
+    rules = load_default_rules()
+    rules["sections"]["pdf"]["criteria"][0]["tiers"] = tiers
+    plan = compile_rules(rules)
+    assert plan.pdf_saturation[0] is None
+
+    text = "# Heading\n" + "word " * 1200
+    scorer = StreamingPDFScorer(plan)
+    assert not scorer.feed(text[:3000])
+    scorer.feed(text[3000:])
+    assert scorer.result() == plan.score_pdf(True, scorer.word_count, True)
+
+
+def test_tiered_heading_rules_wait_for_a_heading():
+    rules = load_default_rules()
+    rules["sections"]["pdf"]["criteria"][1] = {
+        "feature": "has_headings",
+        "tiers": [{"op": "==", "value": False, "points": 10}],
+        "failure": "Headings are not allowed."
+    }
+    rules["sections"]["pdf"]["requires"] = {"feature": "word_count", "op": ">=", "value": 5, "unmet_reason": "Too short."}
+    plan = compile_rules(rules)
+    assert plan.pdf_saturation == (500, True)
+
+    scorer = StreamingPDFScorer(plan)
+    assert not scorer.feed("word " * 600)
+    assert scorer.feed("# Late heading\n")
+    assert scorer.result() == plan.score_pdf(True, scorer.word_count, True)
@@ -0,0 +1,95 @@
+import asyncio
+import httpx
+import pytest
+from datetime import datetime
+from fastapi.testclient import TestClient
+from app.main import app
+from app.core.timing import collect_timings, current_timings, server_timing_header, stage
+from app.services import review_engine
+from app.services.repo_analyzer import AsyncRepoAnalyzer, RepoAnalyzer
+from app.services.repo_metrics_cache import repo_metrics_cache
+from app.services.review_cache import review_cache
+
+client = TestClient(app)
+
+DESCRIPTION = "Objective: measure where review latency goes across every pipeline stage."
+
+
+@pytest.fixture(autouse=True)
+def clean_caches():
+    review_cache.clear()
+    repo_metrics_cache.clear()
+    yield
+    review_cache.clear()
+    repo_metrics_cache.clear()
+
+
+def mock_github(monkeypatch):
+    def handler(request):
+        if request.url.path.endswith("/languages"):
+            return httpx.Response(200, json={"Python": 100})
+        if request.url.path.endswith("/commits"):
+            return httpx.Response(200, json=[{}])
+        if "/git/trees" in request.url.path:
+            return httpx.Response(200, json={"tree": []})
+        return httpx.Response(200, json={"default_branch": "main"})
+
+    http_client = httpx.AsyncClient(base_url=RepoAnalyzer.BASE_URL, transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(AsyncRepoAnalyzer, "get_client", classmethod(lambda cls: http_client))
+
+
+def test_review_reports_stage_timings_on_request(monkeypatch):
+    mock_github(monkeypatch)
+    response = client.post(
+        "/api/v1/task/review",
+        data={"description": DESCRIPTION, "github_url": "https://github.com/octo/app"},
+        headers={"X-Review-Timing": "1"}
+    )
+    assert response.status_code == 200
+    meta = response.json()["meta"]
+    timings = meta["stage_timings_ms"]
+    for name in ("validation", "github_metadata", "github_languages", "github_commits",
+                 "github_tree", "score_pdf", "score_repo", "score_description", "next_task"):
+        assert name in timings and timings[name] >= 0
+    # Deterministic mode keeps the fixed evaluation time
+    assert meta["evaluation_time_ms"] == review_engine.FIXED_EVAL_TIME
+    assert "score_repo;dur=" in response.headers["Server-Timing"]
+
+
+def test_timing_is_off_by_default():
+    response = client.post("/api/v1/task/review", data={"description": DESCRIPTION})
+    assert response.json()["meta"]["stage_timings_ms"] is None
+    assert "Server-Timing" not in response.headers
+
+
+def test_timing_enabled_from_env(monkeypatch):
+    monkeypatch.setenv("REVIEW_TIMING_ENABLED", "true")
+    response = client.post("/api/v1/orchestration/process", json={
+        "task_id": "timed", "task_title": "Timed Task", "task_description": DESCRIPTION,
+        "submitted_by": "tester", "timestamp": datetime.now().isoformat()
+    })
+    timings = response.json()["review"]["meta"]["stage_timings_ms"]
+    assert "context_parsing" in timings and "next_task" in timings
+
+
+def test_non_deterministic_mode_measures(monkeypatch):
+    monkeypatch.setattr(review_engine, "DETERMINISTIC_MODE", False)
+    output = review_engine.ReviewEngine.review_context(review_engine.ReviewContext(description=DESCRIPTION))
+    assert output.meta.evaluation_time_ms < review_engine.FIXED_EVAL_TIME
+
+
+def test_stages_from_gathered_tasks_reach_the_request():
+    async def work(name):
+        with stage(name):
+            await asyncio.sleep(0.01)
+
+    async def run():
+        with collect_timings() as timings:
+            await asyncio.gather(work("a"), work("b"), work("a"))
+        assert current_timings() is None
+        return timings
+
+    timings = asyncio.run(run())
+    assert set(timings) == {"a", "b"}
+    assert timings["a"] >= timings["b"]
+    assert server_timing_header({"a": 1.5}) == "a;dur=1.5"
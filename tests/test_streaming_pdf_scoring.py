@@ -0,0 +1,41 @@
+from app.services.review_engine import ReviewEngine, StreamingPDFScorer
+from app.services.pdf_processor import PDFProcessor, scoring_prefix_job, extract_pages_job
+from pdf_fixtures import make_text_pdf
+
+PAGES = [
+    "",
+    "intro words only here",
+    "# Heading\n" + "word " * 120,
+    "EXECUTIVE SUMMARY\n" + "more " * 400,
+]
+
+def test_streaming_scorer_matches_full_text_score():
+    for end in range(len(PAGES) + 1):
+        scorer = StreamingPDFScorer()
+        for page in PAGES[:end]:
+            scorer.feed(page)
+        full_text = PDFProcessor._combine(PAGES[:end])
+        assert scorer.result() == ReviewEngine._score_pdf(full_text)
+
+def test_scorer_saturates_on_top_tier_with_heading():
+    scorer = StreamingPDFScorer()
+    assert not scorer.feed("word " * 600)
+    assert scorer.feed("SECTION HEADING")
+    assert scorer.result() == (40, [])
+
+def test_early_exit_stops_parsing_and_keeps_score():
+    content = make_text_pdf(30)
+    page_texts, pages_read, page_count, saturated = scoring_prefix_job(content)
+
+    assert saturated
+    assert page_count == 30
+    assert pages_read < 5
+    assert ReviewEngine._score_pdf(PDFProcessor._combine(page_texts)) == ReviewEngine._score_pdf(extract_pages_job(content))
+
+def test_unsaturated_document_is_read_fully():
+    content = make_text_pdf(4, lines_per_page=3, heading=False)
+    page_texts, pages_read, page_count, saturated = scoring_prefix_job(content)
+
+    assert not saturated
+    assert pages_read == page_count == 4
+    assert PDFProcessor._combine(page_texts) == extract_pages_job(content)
@@ -0,0 +1,168 @@
+import threading
+import pytest
+from datetime import datetime
+from app.models.schemas import Task
+from app.models.storage import LimitedStorage, LRUTaskStore, SQLiteTaskStore, create_task_store
+
+
+def make_entry(task_id: str, submitted_by: str = "alice", is_demo: bool = False):
+    task = Task(
+        task_id=task_id,
+        task_title="Stored Task Title",
+        task_description="A detailed description of the stored task.",
+        submitted_by=submitted_by,
+        timestamp=datetime(2026, 1, 1, 12, 0, int(task_id[-1]) if task_id[-1].isdigit() else 0)
+    )
+    return {"task": task, "is_demo": is_demo, "demo_type": "good" if is_demo else None}
+
+
+@pytest.fixture(params=["memory", "lru", "sqlite"])
+def store(request, tmp_path):
+    if request.param == "memory":
+        return LimitedStorage(limit=1000)
+    if request.param == "lru":
+        return LRUTaskStore()
+    return SQLiteTaskStore(str(tmp_path / "tasks.sqlite3"))
+
+
+def test_round_trip(store):
+    store["t1"] = make_entry("t1", is_demo=True)
+    entry = store.get("t1")
+    assert entry["task"].task_title == "Stored Task Title"
+    assert entry["task"].timestamp == datetime(2026, 1, 1, 12, 0, 1)
+    assert entry["is_demo"] is True and entry["demo_type"] == "good"
+    assert "t1" in store
+    assert store.get("missing") is None
+    with pytest.raises(KeyError):
+        store["missing"]
+
+
+def test_find_by_submitter(store):
+    for i in range(6):
+        store[f"t{i}"] = make_entry(f"t{i}", "bob" if i % 2 else "alice")
+    assert len(store) == 6
+    bobs = store.find_by_submitter("bob", limit=2)
+    assert [e["task"].task_id for e in bobs] == ["t5", "t3"]
+    assert store.stats()["entries"] == 6
+    store.clear()
+    assert len(store) == 0
+
+
+def test_sqlite_store_is_shared_and_persistent(tmp_path):
+    path = str(tmp_path / "tasks.sqlite3")
+    SQLiteTaskStore(path)["t1"] = make_entry("t1")
+
+    # A second instance (another worker, or a restart) sees the task
+    other = SQLiteTaskStore(path)
+    assert other.get("t1")["task"].task_id == "t1"
+
+    seen = []
+    thread = threading.Thread(target=lambda: seen.append(other.get("t1")))
+    thread.start()
+    thread.join()
+    assert seen[0]["task"].submitted_by == "alice"
+
+
+def test_memory_store_overwrite_does_not_evict():
+    store = LimitedStorage(limit=2)
+    store["a"] = make_entry("a")
+    store["b"] = make_entry("b")
+    store["b"] = make_entry("b")
+    assert "a" in store and "b" in store
+    store["c"] = make_entry("c")
+    assert "a" not in store
+
+
+def test_backend_selection(monkeypatch, tmp_path):
+    monkeypatch.setenv("TASK_STORE_BACKEND", "sqlite")
+    monkeypatch.setenv("TASK_STORE_PATH", str(tmp_path / "selected.sqlite3"))
+    assert isinstance(create_task_store(), SQLiteTaskStore)
+    monkeypatch.setenv("TASK_STORE_BACKEND", "memory")
+    assert isinstance(create_task_store(), LimitedStorage)
+    monkeypatch.delenv("TASK_STORE_BACKEND")
+    assert isinstance(create_task_store(), LRUTaskStore)
+
+
+def test_lru_reads_refresh_recency():
+    store = LRUTaskStore(max_entries=2)
+    store["a"] = make_entry("a")
+    store["b"] = make_entry("b")
+    store.get("a")
+    store["c"] = make_entry("c")
+    assert "a" in store and "b" not in store
+    assert store.stats()["evictions"] == 1
+
+
+def test_lru_evicts_by_bytes_not_count():
+    small = make_entry("s0")
+    large = make_entry("l0")
+    large["task"] = large["task"].model_copy(update={"task_description": "x" * 100_000})
+    budget = LRUTaskStore.entry_size(large) + 3 * LRUTaskStore.entry_size(small)
+    store = LRUTaskStore(max_bytes=budget, max_entries=1000)
+
+    for i in range(3):
+        store[f"s{i}"] = make_entry(f"s{i}")
+    store["l0"] = large
+    assert len(store) == 4
+    store["s3"] = make_entry("s3")
+    # The oldest small entry goes first; the budget holds
+    assert "s0" not in store
+    assert store.stats()["bytes"] <= budget
+
+    store["l1"] = large
+    assert "l0" not in store
+    assert store.stats()["bytes"] <= budget
+
+
+def test_lru_counters_and_ttl(monkeypatch):
+    import app.models.storage as storage
+
+    now = [1000.0]
+    monkeypatch.setattr(storage.time, "monotonic", lambda: now[0])
+    store = LRUTaskStore(ttl_seconds=60)
+    store["a"] = make_entry("a")
+    assert store.get("a") is not None
+    assert store.get("zzz") is None
+    now[0] += 61
+    assert store.get("a") is None
+
+    stats = store.stats()
+    assert (stats["hits"], stats["misses"], stats["expired"], stats["entries"], stats["bytes"]) == (1, 2, 1, 0, 0)
+
+
+def test_sqlite_count_follows_writes_without_scanning(tmp_path):
+    path = str(tmp_path / "tasks.sqlite3")
+    store = SQLiteTaskStore(path)
+    for i in range(3):
+        store[f"t{i}"] = make_entry(f"t{i}")
+    store["t0"] = make_entry("t0", "carol")  # overwrite keeps the count
+    other = SQLiteTaskStore(path)
+    other["t3"] = make_entry("t3")
+
+    assert len(store) == len(other) == 4
+    assert store.stats()["entries"] == 4
+    assert store.get("t0")["task"].submitted_by == "carol"
+    store.clear()
+    assert len(other) == 0
+
+
+def test_put_many_stores_all_entries(store):
+    store.put_many([(f"t{i}", make_entry(f"t{i}", "bob" if i % 2 else "alice")) for i in range(6)])
+    store.put_many([("t0", make_entry("t0", "carol"))])
+    store.put_many([])
+    assert len(store) == 6
+    assert store.stats()["entries"] == 6
+    assert store.get("t0")["task"].submitted_by == "carol"
+
+
+def test_sqlite_put_many_is_atomic(tmp_path):
+    store = SQLiteTaskStore(str(tmp_path / "tasks.sqlite3"))
+    store.put_many([("t1", make_entry("t1")), ("t2", make_entry("t2"))])
+    broken = make_entry("t9")
+    broken["task"] = broken["task"].model_copy(update={"task_title": None})  # violates NOT NULL
+
+    with pytest.raises(Exception):
+        store.put_many([("t3", make_entry("t3")), ("t1", make_entry("t1", "carol")), ("t9", broken)])
+    assert len(store) == 2
+    assert store.get("t3") is None
+    assert store.get("t1")["task"].submitted_by == "alice"
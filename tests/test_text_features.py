@@ -0,0 +1,100 @@
+import random
+import pytest
+from app.services.review_engine import ReviewEngine
+from app.services.text_features import TextFeatureExtractor, count_words, default_extractor, has_headings
+
+
+def legacy_has_headings(text: str) -> bool:
+    return any(
+        line.strip().startswith('#') or
+        (line.strip().isupper() and len(line.strip()) > 5)
+        for line in text.split('\n')
+    )
+
+
+def legacy_keywords(text: str) -> bool:
+    return any(k in text.lower() for k in ["objective", "goal", "purpose", "requirement"])
+
+
+EDGE_CASES = [
+    "",
+    "plain prose without structure",
+    "   # indented hash heading",
+    "\t\r#carriage",
+    "line\n\n   \n#after blank lines",
+    "text #not a heading",
+    "INTRODUCTION",
+    "  SHORT  ",
+    "ABCDE",
+    "ABCDEF",
+    "12345678",
+    "ÜBERSICHT DER ARBEIT",
+    "ÉTAPE un",
+    "SECTION 1:\r\nbody",
+    "MIXED Case Line",
+    "  OVERVIEW ",
+    "ǅUNGLE HEADING",
+    "Our OBJECTIVE is clear",
+    "The GOAL",
+    "OBJECTİVE with dotted capital I",
+    "purpoſe with long s",
+    "Requirements: many",
+]
+
+
+@pytest.mark.parametrize("text", EDGE_CASES)
+def test_matches_legacy_on_edge_cases(text):
+    assert has_headings(text) == legacy_has_headings(text)
+    assert bool(default_extractor.keyword_hits(text)) == legacy_keywords(text)
+    assert default_extractor.has_keyword(text) == legacy_keywords(text)
+
+
+def test_matches_legacy_on_random_text():
+    rng = random.Random(7)
+    alphabet = "abcXYZ #\n\t\r  GOALobjectiveÉé1"
+    for _ in range(2000):
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 60)))
+        features = default_extractor.extract(text)
+        assert features.word_count == len(text.split())
+        assert count_words(text + "\x1c\u00e9 x") == len((text + "\x1c\u00e9 x").split())
+        assert features.has_headings == (bool(text) and legacy_has_headings(text))
+        assert bool(features.keyword_hits) == legacy_keywords(text)
+
+
+@pytest.mark.parametrize("text", ["", " ", "one", " one two ", "a\x1cb\x1fc", "tab\tsep\x0bvt\x0cff\r\n", "x" * 1000])
+def test_count_words_matches_split(text):
+    assert count_words(text) == len(text.split())
+
+
+def test_keyword_hits_and_skipped_features():
+    extractor = TextFeatureExtractor(["goal", "goals", "purpose"])
+    features = extractor.extract("Our GOALS and purpose", headings=False)
+    assert features.keyword_hits == frozenset({"goal", "goals", "purpose"})
+    assert features.has_headings is False
+    assert features.char_length == 21
+    assert TextFeatureExtractor([]).keyword_hits("goal") == frozenset()
+
+
+def test_scorers_consume_features():
+    assert ReviewEngine._score_pdf("# Heading\n" + "word " * 120) == (30, [])
+    assert ReviewEngine._score_description("Our goal " + "x" * 200) == (20, [])
+    assert ReviewEngine._score_description("no keywords here at all") == (0, [
+        "Description needs more detail.", "Missing clear objectives/requirements."
+    ])
+
+
+def test_overlapping_keywords_all_hit():
+    extractor = TextFeatureExtractor(["ab", "bc", "abc", "c"])
+    assert extractor.keyword_hits("xABCx") == frozenset({"ab", "bc", "abc", "c"})
+
+
+def test_multi_block_scan_matches_whole_text(monkeypatch):
+    monkeypatch.setattr(TextFeatureExtractor, "BLOCK_CHARS", 16)
+    rng = random.Random(11)
+    alphabet = "abc GOAL purpose\n#XYZ\t"
+    for _ in range(500):
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 200)))
+        features = default_extractor.extract(text)
+        assert features.word_count == len(text.split())
+        assert features.has_headings == (bool(text) and legacy_has_headings(text))
+        assert bool(features.keyword_hits) == legacy_keywords(text)
@@ -0,0 +1,129 @@
+import os
+import sqlite3
+import threading
+import time
+import pytest
+from app.services import tts_integration
+
+tts_service = tts_integration._load_tts()
+pytestmark = pytest.mark.skipif(tts_service is None, reason="VaaniTTS service not importable")
+
+
+@pytest.fixture
+def upstream(monkeypatch, tmp_path):
+    """Replaces the Groq call with a local fake and points the cache at a temp file."""
+    calls = []
+
+    def fake_request(text, target_language, api_key, default_model):
+        calls.append((text, target_language))
+        return f"[{target_language}] {text}"
+
+    monkeypatch.setenv("GROQ_API_KEY", "test-key")
+    monkeypatch.setattr(tts_service, "_request_translation", fake_request)
+    monkeypatch.setattr(tts_service, "translation_cache", tts_service.TranslationCache(str(tmp_path / "translations.sqlite3")))
+    return calls
+
+
+def test_identical_text_is_translated_once(upstream):
+    assert tts_service.translate_text("Missing README file.", "es") == "[es] Missing README file."
+    assert tts_service.translate_text("Missing README file.", "es") == "[es] Missing README file."
+    assert tts_service.translate_text("Missing README file.", "fr") == "[fr] Missing README file."
+    assert tts_service.translate_text("Missing README file.", "en") == "Missing README file."
+    assert len(upstream) == 2
+
+
+def test_translations_persist_across_instances(upstream, tmp_path):
+    tts_service.translate_text("Sparse repository structure.", "de")
+    reopened = tts_service.TranslationCache(tts_service.translation_cache.path)
+    key = tts_service.TranslationCache.make_key(
+        "Sparse repository structure.", "de",
+        f"{tts_service.FAST_TRANSLATION_MODEL}|{os.getenv('GROQ_MODEL_NAME', 'llama-3.3-70b-versatile')}"
+    )
+    assert reopened.get(key) == "[de] Sparse repository structure."
+
+
+def test_expired_entries_are_refetched(upstream, monkeypatch):
+    tts_service.translate_text("Low commit history.", "hi")
+    now = time.time()
+    monkeypatch.setattr(tts_service.time, "time", lambda: now + tts_service.translation_cache.ttl_seconds + 1)
+    tts_service.translate_text("Low commit history.", "hi")
+    assert len(upstream) == 2
+
+
+def test_failures_are_not_cached(upstream, monkeypatch):
+    monkeypatch.setattr(tts_service, "_request_translation", lambda *args: upstream.append(args) or None)
+    assert tts_service.translate_text("Description too short.", "ja") == "Description too short."
+    assert tts_service.translate_text("Description too short.", "ja") == "Description too short."
+    assert len(upstream) == 2
+
+
+def test_checked_translation_reports_fallback(upstream, monkeypatch):
+    assert tts_service.translate_text_checked("Objective", "es") == ("[es] Objective", False)
+    monkeypatch.setattr(tts_service, "_request_translation", lambda *args: None)
+    assert tts_service.translate_text_checked("Goal", "es") == ("Goal", True)
+    assert tts_service.translate_text_checked("Goal", "en") == ("Goal", False)
+
+
+def test_concurrent_requests_share_one_upstream_call(upstream, monkeypatch):
+    release = threading.Event()
+
+    def slow_request(text, target_language, api_key, default_model):
+        release.wait(5)
+        upstream.append(text)
+        return "traducido"
+
+    monkeypatch.setattr(tts_service, "_request_translation", slow_request)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(tts_service.translate_text("Objective", "es")))
+               for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.1)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert results == ["traducido"] * 5
+    assert len(upstream) == 1
+
+
+def test_translation_is_cached_before_leaving_flight(upstream, monkeypatch):
+    cache = tts_service.translation_cache
+    inflight_at_put = []
+    original_put = cache.put
+    monkeypatch.setattr(cache, "put", lambda key, value: inflight_at_put.append(
+        key in tts_service._inflight_translations) or original_put(key, value))
+
+    tts_service.translate_text("Objective", "es")
+    assert inflight_at_put == [True]
+
+
+def test_default_cache_is_memory_only(monkeypatch, tmp_path):
+    monkeypatch.delenv("TRANSLATION_CACHE_PATH", raising=False)
+    monkeypatch.setattr(tts_service.tempfile, "tempdir", str(tmp_path))
+    cache = tts_service.TranslationCache.from_env()
+    cache.put("key", "value")
+    assert cache.get("key") == "value"
+    assert cache.stats()["persistent"] is False
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_size_limit_trims_memory_and_disk(tmp_path):
+    cache = tts_service.TranslationCache(str(tmp_path / "small.sqlite3"), max_entries=10)
+    for i in range(100):
+        cache.put(f"key-{i}", f"value-{i}")
+    assert cache.stats()["memory_entries"] == 10
+    rows = sqlite3.connect(cache.path).execute("SELECT COUNT(*) FROM translations").fetchone()[0]
+    assert rows == 10
+    assert cache.get("key-99") == "value-99"
+
+
+def test_prefetch_covers_static_review_texts(upstream):
+    templates = tts_integration.spoken_templates()
+    assert "Maintain a commit history > 10." in templates
+    assert "Missing README file." in templates
+
+    assert tts_integration.prefetch_translations(["es"])
+    assert len(upstream) == len(templates)
+    tts_service.translate_text("Missing README file.", "es")
+    assert len(upstream) == len(templates)
@@ -0,0 +1,89 @@
+import pytest
+from fastapi.testclient import TestClient
+from app.main import app
+from app.services import tts_integration
+from app.services.tts_integration import audio_cache_key, audio_media_type, tts_audio_cache
+
+client = TestClient(app)
+
+MP3 = b"ID3\x04" + b"\x00" * 64
+
+
+@pytest.fixture
+def fake_tts(fake_tts):
+    fake_tts["encode"] = lambda text: MP3
+    return fake_tts
+
+
+def test_repeated_text_is_synthesized_once(fake_tts):
+    first = client.post("/api/v1/tts/speak", json={"text": "Missing README file."})
+    second = client.post("/api/v1/tts/speak", json={"text": "  Missing README   file. \U0001F600"})
+
+    assert first.status_code == second.status_code == 200
+    assert first.content == second.content == MP3
+    assert first.headers["content-type"] == "audio/mpeg"
+    assert first.headers["etag"] == second.headers["etag"]
+    assert "max-age=" in first.headers["cache-control"]
+    assert len(fake_tts["calls"]) == 1
+
+
+def test_language_is_part_of_the_key(fake_tts):
+    client.post("/api/v1/tts/speak", json={"text": "Missing README file."})
+    client.post("/api/v1/tts/speak", json={"text": "Missing README file.", "language": "es"})
+    assert len(fake_tts["calls"]) == 2
+    assert audio_cache_key("x", "en") != audio_cache_key("x", "es")
+
+
+def test_revalidation_returns_304_without_synthesis(fake_tts):
+    etag = client.get("/api/v1/tts/speak", params={"text": "Define clear objectives."}).headers["etag"]
+    tts_audio_cache.clear()
+
+    response = client.get("/api/v1/tts/speak", params={"text": "Define clear objectives."},
+                          headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+    assert len(fake_tts["calls"]) == 1
+
+
+def test_disk_tier_survives_memory_eviction(fake_tts, tmp_path, monkeypatch):
+    cache = tts_integration.TieredBlobCache("tts_audio", max_memory_bytes=1, disk_dir=str(tmp_path), compress=False)
+    monkeypatch.setattr(tts_integration, "tts_audio_cache", cache)
+
+    assert tts_integration.generate_audio_stream("Maintain a commit history") == MP3
+    assert tts_integration.generate_audio_stream("Maintain a commit history") == MP3
+    assert len(fake_tts["calls"]) == 1
+    assert cache.stats()["disk_hits"] == 1
+
+
+def test_media_type_follows_audio_signature():
+    assert audio_media_type(MP3) == "audio/mpeg"
+    assert audio_media_type(b"\xff\xf3\x44\xc4") == "audio/mpeg"
+    assert audio_media_type(b"RIFF\x00\x00\x00\x00WAVE") == "audio/wav"
+
+
+def test_fallback_engine_audio_is_not_cached(fake_tts):
+    wav = b"RIFF\x24\x00\x00\x00WAVEfmt "
+    fake_tts["encode"] = lambda text: wav
+
+    response = client.post("/api/v1/tts/speak", json={"text": "gTTS is briefly down."})
+    assert response.content == wav
+    assert response.headers["content-type"] == "audio/wav"
+    assert response.headers["cache-control"] == "no-store"
+    assert "etag" not in response.headers
+    assert tts_audio_cache.get(audio_cache_key("gTTS is briefly down.")) is None
+
+
+def test_untranslated_fallback_audio_is_not_cached(fake_tts):
+    failures = [True]
+    fake_tts["translation_fails"] = lambda text, language: bool(failures) and failures.pop()
+
+    first = client.post("/api/v1/tts/speak", json={"text": "Missing README file.", "language": "hi"})
+    assert first.status_code == 200
+    assert first.headers["cache-control"] == "no-store"
+    assert "etag" not in first.headers
+    assert tts_audio_cache.get(audio_cache_key("Missing README file.", "hi")) is None
+
+    second = client.post("/api/v1/tts/speak", json={"text": "Missing README file.", "language": "hi"})
+    assert "etag" in second.headers
+    assert len(fake_tts["calls"]) == 2
+    assert tts_audio_cache.get(audio_cache_key("Missing README file.", "hi")) == MP3
@@ -0,0 +1,128 @@
+import threading
+import time
+import types
+import pytest
+from fastapi.testclient import TestClient
+from app.main import app
+from app.services import tts_integration
+from app.services.tts_integration import PlaybackQueue, PlaybackQueueFull
+
+client = TestClient(app)
+
+
+class BlockingPlayer:
+    """Records playback and holds each item until released."""
+
+    def __init__(self):
+        self.played = []
+        self.active = 0
+        self.max_active = 0
+        self.release = threading.Semaphore(0)
+        self.started = threading.Event()
+        self._lock = threading.Lock()
+
+    def __call__(self, text, language):
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        self.started.set()
+        self.release.acquire(timeout=5)
+        with self._lock:
+            self.active -= 1
+            self.played.append((text, language))
+
+
+def wait_for(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not met in time"
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def player(monkeypatch):
+    service = types.SimpleNamespace(remove_emojis=lambda text: " ".join(text.split()))
+    monkeypatch.setattr(tts_integration, "_load_tts", lambda: service)
+    monkeypatch.setattr("app.api.tts.is_tts_available", lambda: True)
+    player = BlockingPlayer()
+    queue = PlaybackQueue(max_depth=2, player=player)
+    monkeypatch.setattr("app.api.tts.playback_queue", queue)
+    yield player
+    queue.shutdown()
+    for _ in range(10):
+        player.release.release()
+
+
+def test_items_play_one_at_a_time_in_order(player):
+    queue = PlaybackQueue(max_depth=10, player=player)
+    for i in range(4):
+        queue.enqueue(f"Item {i}.")
+    for _ in range(4):
+        player.release.release()
+
+    wait_for(lambda: len(player.played) == 4)
+    assert player.played == [(f"Item {i}.", "en") for i in range(4)]
+    assert player.max_active == 1
+    assert queue.stats()["played"] == 4
+    queue.shutdown()
+
+
+def test_server_play_is_bounded_and_deduplicated(player):
+    first = client.post("/api/v1/tts/speak", json={"text": "Playing now.", "mode": "server_play"})
+    assert first.status_code == 200
+    player.started.wait(5)
+
+    queued = client.post("/api/v1/tts/speak", json={"text": "Missing README file.", "mode": "server_play"}).json()
+    duplicate = client.post("/api/v1/tts/speak", json={"text": " Missing README  file. ", "mode": "server_play"}).json()
+    assert queued["status"] == "queued"
+    assert duplicate == {**queued, "status": "duplicate", "message": duplicate["message"]}
+
+    assert client.post("/api/v1/tts/speak", json={"text": "Second.", "mode": "server_play"}).status_code == 200
+    full = client.post("/api/v1/tts/speak", json={"text": "Third.", "mode": "server_play"})
+    assert full.status_code == 429
+
+    status = client.get("/api/v1/tts/status").json()["playback_queue"]
+    assert status["pending"] == 2
+    assert status["playing"] is True
+    assert (status["deduplicated"], status["rejected"]) == (1, 1)
+
+
+def test_pending_items_can_be_cancelled_and_cleared(player):
+    client.post("/api/v1/tts/speak", json={"text": "Playing now.", "mode": "server_play"})
+    player.started.wait(5)
+    item_id = client.post("/api/v1/tts/speak", json={"text": "Cancel me.", "mode": "server_play"}).json()["id"]
+    client.post("/api/v1/tts/speak", json={"text": "Clear me.", "mode": "server_play"})
+
+    assert client.delete(f"/api/v1/tts/queue/{item_id}").status_code == 200
+    assert client.delete(f"/api/v1/tts/queue/{item_id}").status_code == 404
+    snapshot = client.get("/api/v1/tts/queue").json()
+    assert snapshot["playing"]["text"] == "Playing now."
+    assert [item["text"] for item in snapshot["pending"]] == ["Clear me."]
+
+    assert client.delete("/api/v1/tts/queue").json() == {"status": "cleared", "cancelled": 1}
+    player.release.release()
+    wait_for(lambda: len(player.played) == 1)
+    assert player.played == [("Playing now.", "en")]
+
+
+def test_skip_interrupts_current_playback(player, monkeypatch):
+    stopped = []
+    engine = types.SimpleNamespace(stop_speaking=lambda: stopped.append(True) or True)
+    service = types.SimpleNamespace(remove_emojis=lambda text: text, speech_engine=engine)
+    monkeypatch.setattr(tts_integration, "_load_tts", lambda: service)
+
+    assert client.post("/api/v1/tts/queue/skip").json() == {"skipped": False}
+    client.post("/api/v1/tts/speak", json={"text": "Long speech.", "mode": "server_play"})
+    player.started.wait(5)
+    assert client.post("/api/v1/tts/queue/skip").json() == {"skipped": True}
+    assert stopped == [True]
+
+
+def test_enqueue_raises_when_full(player):
+    queue = PlaybackQueue(max_depth=1, player=player)
+    queue.enqueue("Playing.")
+    player.started.wait(5)
+    queue.enqueue("Waiting.")
+    with pytest.raises(PlaybackQueueFull):
+        queue.enqueue("Overflow.")
+    queue.shutdown()
@@ -0,0 +1,154 @@
+import threading
+import types
+import pytest
+from app.services import tts_integration
+
+tts_service = tts_integration._load_tts()
+pytestmark = pytest.mark.skipif(tts_service is None, reason="VaaniTTS service not importable")
+
+VOICES = [
+    types.SimpleNamespace(id="voice.david", name="Microsoft David - English (United States)"),
+    types.SimpleNamespace(id="voice.helena", name="Microsoft Helena - Spanish (Spain)"),
+]
+
+
+class FakeEngine:
+    def __init__(self, log):
+        self.log = log
+        self.properties = {}
+        self.pending = []
+        self.callbacks = []
+        self.stopped_from = None
+
+    def connect(self, topic, callback):
+        assert topic == "started-word"
+        self.callbacks.append(callback)
+
+    def stop(self):
+        self.stopped_from = threading.get_ident()
+
+    def getProperty(self, name):
+        self.log["voice_scans"] += 1
+        return VOICES
+
+    def setProperty(self, name, value):
+        self.properties[name] = value
+
+    def save_to_file(self, text, path):
+        self.log["paths"].append(path)
+        self.pending.append((text, path))
+
+    def say(self, text):
+        self.pending.append((text, None))
+
+    def runAndWait(self):
+        self.log["threads"].add(threading.get_ident())
+        for text, path in self.pending:
+            if path is None:
+                self.speak_words(text)
+                self.log["spoken"].append((text, self.properties.get("voice")))
+            else:
+                with open(path, "wb") as f:
+                    f.write(b"RIFF" + f"{self.properties.get('voice')}:{text}".encode())
+        self.pending = []
+
+    def speak_words(self, text):
+        self.stopped_from = None
+        for word in text.split():
+            self.log["words"].append(word)
+            self.log["speaking"].set()
+            for callback in self.callbacks:
+                callback("utterance", 0, len(word))
+            if self.stopped_from is not None:
+                return
+            self.log["gate"].wait(5)
+
+
+@pytest.fixture
+def fake_pyttsx3(monkeypatch):
+    log = {"inits": 0, "voice_scans": 0, "paths": [], "threads": set(), "spoken": [], "words": [],
+           "speaking": threading.Event(), "gate": threading.Event()}
+    log["gate"].set()
+
+    def init():
+        log["inits"] += 1
+        return FakeEngine(log)
+
+    worker = tts_service.SpeechEngineWorker()
+    monkeypatch.setattr(tts_service, "pyttsx3", types.SimpleNamespace(init=init))
+    monkeypatch.setattr(tts_service, "speech_engine", worker)
+    yield log
+    worker.shutdown()
+
+
+def test_engine_is_initialized_once_and_owned_by_one_thread(fake_pyttsx3):
+    audio = [tts_service.text_to_speech_stream(f"Sentence {i}.", use_google_tts=False) for i in range(5)]
+
+    assert audio[0] == b"RIFFvoice.david:Sentence 0."
+    assert fake_pyttsx3["inits"] == 1
+    assert len(fake_pyttsx3["threads"]) == 1
+    assert threading.get_ident() not in fake_pyttsx3["threads"]
+    # One scratch file reused for every synthesis
+    assert len(set(fake_pyttsx3["paths"])) == 1
+
+
+def test_voice_is_resolved_once_per_language(fake_pyttsx3):
+    for _ in range(3):
+        assert tts_service.speech_engine.synthesize("Hola.", "es") == b"RIFFvoice.helena:Hola."
+        assert tts_service.speech_engine.synthesize("Hello.", "en") == b"RIFFvoice.david:Hello."
+
+    assert fake_pyttsx3["voice_scans"] == 2
+    assert tts_service.speech_engine.stats()["voices"] == {"es": "voice.helena", "en": "voice.david"}
+
+
+def test_concurrent_callers_share_the_worker(fake_pyttsx3):
+    results = {}
+
+    def synthesize(i):
+        results[i] = tts_service.speech_engine.synthesize(f"Caller {i}.")
+
+    threads = [threading.Thread(target=synthesize, args=(i,)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == {i: f"RIFFvoice.david:Caller {i}.".encode() for i in range(8)}
+    assert fake_pyttsx3["inits"] == 1
+
+
+def test_speak_directly_uses_the_pooled_engine(fake_pyttsx3):
+    tts_service.speak_text_directly("Server playback.", "es")
+    assert fake_pyttsx3["spoken"] == [("Server playback.", "voice.helena")]
+    assert fake_pyttsx3["inits"] == 1
+
+
+def test_missing_pyttsx3_is_reported(monkeypatch):
+    monkeypatch.setattr(tts_service, "pyttsx3", None)
+    monkeypatch.setattr(tts_service, "speech_engine", tts_service.SpeechEngineWorker())
+
+    assert tts_service.initialize_tts_engine() is None
+    with pytest.raises(RuntimeError):
+        tts_service.text_to_speech_stream("Offline.", use_google_tts=False)
+
+
+def test_select_voice_falls_back_to_first_voice():
+    assert tts_service.select_voice(VOICES, "ja") == "voice.david"
+    assert tts_service.select_voice([], "en") is None
+
+
+def test_stop_is_applied_on_the_engine_thread(fake_pyttsx3):
+    worker = tts_service.speech_engine
+    worker.prime()
+    assert worker.stop_speaking() is False
+
+    fake_pyttsx3["gate"].clear()
+    speaker = threading.Thread(target=worker.speak, args=("one two three four five",))
+    speaker.start()
+    assert fake_pyttsx3["speaking"].wait(5)
+    assert worker.stop_speaking() is True
+    fake_pyttsx3["gate"].set()
+    speaker.join(5)
+
+    assert worker._engine.stopped_from in fake_pyttsx3["threads"]
+    assert fake_pyttsx3["words"] == ["one", "two"]
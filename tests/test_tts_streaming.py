@@ -0,0 +1,84 @@
+import threading
+import pytest
+from fastapi.testclient import TestClient
+from app.main import app
+from app.services import tts_integration
+from app.services.tts_integration import progressive_audio, split_sentences
+
+client = TestClient(app)
+
+TEXT = "Missing README file. Missing tests directory! Sparse repository structure? Define clear objectives."
+
+
+def wav(payload: bytes) -> bytes:
+    return b"RIFF" + len(payload).to_bytes(4, "little") + b"WAVEfmt " + b"\x00" * 20 + b"data" + len(payload).to_bytes(4, "little") + payload
+
+
+@pytest.fixture
+def fake_tts(fake_tts):
+    # Only later sentences are gated, and they finish first, so ordering is really exercised
+    fake_tts["gated"] = lambda text: not text.startswith("Missing README")
+    fake_tts["delay"] = lambda text: 0.05 if text.startswith("Missing README") else 0.01
+    return fake_tts
+
+
+def test_split_sentences():
+    assert split_sentences(TEXT) == [
+        "Missing README file.", "Missing tests directory!", "Sparse repository structure?", "Define clear objectives."
+    ]
+    assert split_sentences("word " * 100, max_chars=50) == ["word " * 9 + "word"] * 10
+    assert split_sentences("  \n ") == []
+
+
+def test_chunks_arrive_in_order_with_bounded_workers(fake_tts):
+    response = client.post("/api/v1/tts/speak", json={"text": TEXT, "mode": "chunked"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "audio/mpeg"
+    assert response.content == b"".join(b"ID3" + sentence.encode() for sentence in split_sentences(TEXT))
+    assert fake_tts["max_active"] <= tts_integration.TTS_STREAM_WORKERS
+
+
+def test_first_chunk_is_ready_before_the_rest(fake_tts):
+    fake_tts["gate"] = threading.Event()
+    media_type, chunks = progressive_audio(TEXT)
+    # Returned while every later sentence is still blocked
+    assert media_type == "audio/mpeg"
+    assert next(chunks) == b"ID3Missing README file."
+    fake_tts["gate"].set()
+    assert len(list(chunks)) == 3
+
+
+def test_wav_chunks_are_merged_into_one_stream(fake_tts):
+    fake_tts["encode"] = lambda text: wav(text.encode())
+    media_type, chunks = progressive_audio("One. Two.")
+    audio = b"".join(chunks)
+
+    assert media_type == "audio/wav"
+    assert audio.count(b"RIFF") == 1
+    assert audio[4:8] == b"\xff\xff\xff\xff"
+    assert audio.endswith(b"One.Two.")
+
+
+def test_recovered_gtts_chunk_is_resynthesized_in_a_wav_stream(fake_tts):
+    # gTTS fails for the first sentence only; the stream is WAV from then on
+    fake_tts["encode"] = lambda text: wav(text.encode()) if text == "One." else b"ID3" + text.encode()
+    media_type, chunks = progressive_audio("One. Two. Three.")
+    audio = b"".join(chunks)
+
+    assert media_type == "audio/wav"
+    assert audio.count(b"RIFF") == 1 and b"ID3" not in audio
+    assert audio.endswith(b"One.Two.Three.")
+
+
+def test_engine_switch_ends_an_mp3_stream(fake_tts, caplog):
+    fake_tts["encode"] = lambda text: wav(text.encode()) if text == "Two." else b"ID3" + text.encode()
+    media_type, chunks = progressive_audio("One. Two. Three.")
+
+    assert media_type == "audio/mpeg"
+    assert list(chunks) == [b"ID3One."]
+    assert "changed mid-stream" in caplog.text
+
+
+def test_empty_text_is_rejected(fake_tts):
+    assert client.post("/api/v1/tts/speak", json={"text": "   ", "mode": "chunked"}).status_code == 500
@@ -0,0 +1,125 @@
+import asyncio
+import hashlib
+import io
+import os
+import pytest
+from fastapi import HTTPException, UploadFile
+from app.services.upload_spool import UploadBudget, UploadSpooler
+
+def make_upload(content: bytes, size=None) -> UploadFile:
+    return UploadFile(file=io.BytesIO(content), filename="doc.pdf", size=size)
+
+def test_spools_to_disk_with_digest():
+    spooler = UploadSpooler(max_upload_bytes=1024, budget=UploadBudget(4096), chunk_size=7)
+    content = b"%PDF-1.4 spooled body"
+
+    async def scenario():
+        async with spooler.spool(make_upload(content, size=len(content))) as spooled:
+            with open(spooled.path, "rb") as f:
+                assert f.read() == content
+            assert spooled.digest == hashlib.sha256(content).hexdigest()
+            assert spooler.budget.stats()["in_flight_bytes"] == len(content)
+            return spooled.path
+
+    path = asyncio.run(scenario())
+    assert not os.path.exists(path)
+    assert spooler.budget.stats()["in_flight_bytes"] == 0
+
+def test_rejects_declared_oversized_upload_before_copying(monkeypatch):
+    spooler = UploadSpooler(max_upload_bytes=10, budget=UploadBudget(4096))
+    upload = make_upload(b"x" * 64, size=64)
+    monkeypatch.setattr("app.services.upload_spool.tempfile.mkstemp", lambda **kwargs: pytest.fail("copied"))
+
+    async def scenario():
+        async with spooler.spool(upload):
+            pass
+
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(scenario())
+    assert exc.value.status_code == 413
+    assert upload.file.tell() == 0
+    assert spooler.budget.stats()["in_flight_bytes"] == 0
+
+def test_rejects_oversized_upload_of_unknown_size_while_copying():
+    spooler = UploadSpooler(max_upload_bytes=10, budget=UploadBudget(4096), chunk_size=4)
+
+    async def scenario():
+        async with spooler.spool(make_upload(b"x" * 64)):
+            pass
+
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(scenario())
+    assert exc.value.status_code == 413
+    assert spooler.budget.stats()["in_flight_bytes"] == 0
+
+def test_rejects_empty_upload():
+    spooler = UploadSpooler(max_upload_bytes=10, budget=UploadBudget(4096))
+
+    async def scenario():
+        async with spooler.spool(make_upload(b"")):
+            pass
+
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(scenario())
+    assert exc.value.status_code == 400
+
+def test_budget_queues_then_admits():
+    budget = UploadBudget(max_bytes=10, wait_timeout=2)
+
+    async def scenario():
+        await budget.acquire(8)
+        waiting = asyncio.ensure_future(budget.acquire(5))
+        await asyncio.sleep(0.05)
+        assert not waiting.done()
+        budget.release(8)
+        await waiting
+
+    asyncio.run(scenario())
+    assert budget.stats()["waited"] == 1
+    assert budget.stats()["in_flight_bytes"] == 5
+
+def test_budget_rejects_after_timeout():
+    budget = UploadBudget(max_bytes=10, wait_timeout=0.05)
+
+    async def scenario():
+        await budget.acquire(8)
+        await budget.acquire(5)
+
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(scenario())
+    assert exc.value.status_code == 503
+
+def test_concurrent_uploads_share_a_small_budget():
+    spooler = UploadSpooler(max_upload_bytes=4096, budget=UploadBudget(1000, wait_timeout=1), chunk_size=100)
+
+    async def upload(content: bytes):
+        async with spooler.spool(make_upload(content, size=len(content))) as spooled:
+            await asyncio.sleep(0.05)
+            return spooled.size
+
+    async def scenario():
+        # Reading interleaves; neither may hold part of the budget while waiting for the rest
+        return await asyncio.gather(upload(b"a" * 700), upload(b"b" * 700))
+
+    assert asyncio.run(scenario()) == [700, 700]
+    assert spooler.budget.stats()["waited"] == 1
+    assert spooler.budget.stats()["in_flight_bytes"] == 0
+
+def test_lone_upload_over_budget_is_admitted():
+    spooler = UploadSpooler(max_upload_bytes=4096, budget=UploadBudget(1000, wait_timeout=0.05), chunk_size=100)
+
+    async def scenario():
+        async with spooler.spool(make_upload(b"x" * 2000, size=2000)) as spooled:
+            return spooled.size
+
+    assert asyncio.run(scenario()) == 2000
+    assert spooler.budget.stats()["rejected"] == 0
+
+def test_unknown_size_reserves_the_maximum():
+    spooler = UploadSpooler(max_upload_bytes=512, budget=UploadBudget(4096))
+
+    async def scenario():
+        async with spooler.spool(make_upload(b"%PDF")):
+            return spooler.budget.stats()["in_flight_bytes"]
+
+    assert asyncio.run(scenario()) == 512
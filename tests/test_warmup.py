@@ -0,0 +1,153 @@
+import asyncio
+import time
+import pytest
+from fastapi.testclient import TestClient
+import app.main as main_module
+from app.core.container import AppContainer
+from app.core.warmup import Warmup, synthetic_review
+from app.main import app
+from app.services.pdf_executor import pdf_executor
+from app.services.review_cache import review_cache
+
+
+async def ok():
+    return None
+
+
+async def missing():
+    return False
+
+
+async def broken():
+    raise RuntimeError("no pdf stack")
+
+
+STEPS = {"pdf": ok, "github": ok, "tts": missing, "translation": missing, "review": ok}
+
+
+def test_optional_subsystem_does_not_block_readiness():
+    warmup = Warmup()
+    assert not warmup.is_ready()
+    asyncio.run(warmup.run(STEPS))
+
+    report = warmup.report()
+    assert report["ready"] and report["warmup"] == "complete"
+    assert report["subsystems"]["pdf"]["state"] == "ready"
+    assert report["subsystems"]["tts"]["state"] == "unavailable"
+    assert "duration_ms" in report["subsystems"]["review"]
+
+
+def test_failed_required_subsystem_is_not_ready():
+    warmup = Warmup(retry_seconds=60)
+
+    async def scenario():
+        task = asyncio.ensure_future(warmup.run({**STEPS, "pdf": broken}))
+        while warmup.state["pdf"]["state"] != "failed":
+            await asyncio.sleep(0.01)
+        report = warmup.report()
+        task.cancel()
+        return report
+
+    report = asyncio.run(scenario())
+    assert not report["ready"] and report["warmup"] == "running"
+    assert report["subsystems"]["pdf"]["state"] == "failed"
+    assert report["subsystems"]["pdf"]["error"] == "no pdf stack"
+    assert report["subsystems"]["pdf"]["retry_in_seconds"] == 60
+
+
+def test_failed_required_subsystem_is_retried_with_backoff(monkeypatch):
+    attempts = []
+    delays = []
+    real_sleep = asyncio.sleep
+
+    async def flaky():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise RuntimeError("GitHub unreachable")
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+        await real_sleep(0)
+
+    monkeypatch.setattr("app.core.warmup.asyncio.sleep", fake_sleep)
+    warmup = Warmup(retry_seconds=1, retry_max_seconds=1.5)
+    asyncio.run(warmup.run({**STEPS, "github": flaky, "tts": broken}))
+
+    assert warmup.is_ready()
+    assert warmup.state["github"]["state"] == "ready"
+    assert warmup.state["github"]["attempts"] == 3
+    assert delays == [1, 1.5]
+    # Optional subsystems are not retried
+    assert warmup.state["tts"]["attempts"] == 1
+
+
+def test_degraded_tts_does_not_block_readiness():
+    async def degraded():
+        return "degraded"
+
+    warmup = Warmup()
+    asyncio.run(warmup.run({**STEPS, "tts": degraded}))
+    assert warmup.is_ready()
+    assert warmup.state["tts"]["state"] == "degraded"
+
+
+def test_synthetic_review_leaves_no_trace_in_the_review_cache():
+    review_cache.clear()
+    result = synthetic_review()
+    assert result.review.score > 0 and result.next_task.title
+    stats = review_cache.stats()
+    assert stats["entries"] == stats["hits"] == stats["misses"] == 0
+
+
+def test_warm_reads_through_the_orchestrators_cache():
+    from app.models.review_context import ReviewContext
+    from app.services.review_cache import ReviewResultCache
+    from app.services.review_engine import ReviewEngine
+    from app.services.review_orchestrator import ReviewOrchestrator
+    from app.services.sequential_task_generator import SequentialTaskGenerator
+
+    cache = ReviewResultCache()
+    orchestrator = ReviewOrchestrator(ReviewEngine(), SequentialTaskGenerator(), review_cache=cache)
+    context = ReviewContext(description="Objective: a review that is already cached.")
+    orchestrator.evaluate(context=context)
+
+    assert orchestrator.warm(context).review.meta.cached is True
+    assert cache.stats()["hits"] == 0 and cache.stats()["entries"] == 1
+
+
+def test_subsystem_selection_and_disabled_warmup():
+    warmup = Warmup(subsystems=["review"])
+    asyncio.run(warmup.run(STEPS))
+    assert warmup.is_ready()
+    assert warmup.report()["subsystems"]["pdf"]["state"] == "skipped"
+
+    disabled = Warmup(enabled=False)
+    assert disabled.is_ready() and disabled.phase == "disabled"
+    assert disabled.start() is None
+
+
+def test_ready_endpoint_reports_503_until_warm(monkeypatch):
+    monkeypatch.setattr(app.state, "container", AppContainer(warmup=Warmup()), raising=False)
+    assert TestClient(app).get("/ready").status_code == 503
+
+
+def test_lifespan_warms_real_subsystems(monkeypatch):
+    # Thread mode keeps the test from spawning worker processes
+    monkeypatch.setattr(pdf_executor, "pool_size", 0)
+    monkeypatch.setattr(main_module, "warmup", Warmup())
+
+    with TestClient(app) as client:
+        deadline = time.monotonic() + 30
+        response = client.get("/ready")
+        # Readiness can flip just before the warm-up task records completion
+        while (response.status_code != 200 or response.json()["warmup"] != "complete") and time.monotonic() < deadline:
+            time.sleep(0.05)
+            response = client.get("/ready")
+
+    report = response.json()
+    assert response.status_code == 200
+    assert report["warmup"] == "complete"
+    for name in ("pdf", "github", "review"):
+        assert report["subsystems"][name]["state"] == "ready"
+    assert report["subsystems"]["tts"]["state"] in ("ready", "degraded", "unavailable")
+    assert report["subsystems"]["translation"]["state"] in ("ready", "unavailable")